@@ -0,0 +1,142 @@
+"""
+Banc d'essai : latence des requêtes filtrées selon la taille de la table d'événements
+
+Usage : python benchmarks/bench_database.py [--max-rows 10000000] [--queries 200]
+
+La table grandit par paliers (10k, 100k, 1M, 10M lignes) ; à chaque palier,
+les requêtes get_events_by_type, get_events_by_scenario et get_vehicle_events
+sont mesurées. Grâce aux index (filtre, horodatage), leur latence doit rester
+à peu près constante. Avec --export, les exports de la table finale sont
+mesurés (débit et mémoire maximale) ; la rétention est mesurée en dernier.
+"""
+
+import argparse
+import random
+import shutil
+import sys
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Ajouter le répertoire src au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from constants import EVENT_TYPES, FPS
+from database import DatabaseManager
+
+SIZES = (10000, 100000, 1000000, 10000000)
+CHUNK = 50000
+SCENARIOS = ("normal", "rush_hour", "night", "manual")
+EVENTS_PER_VEHICLE = 50   # Un véhicule produit en moyenne ~50 événements
+
+
+def synthetic_rows(start: int, count: int, rng: random.Random):
+    """
+    Produit count événements horodatés à la suite des start précédents
+    """
+    origin = datetime(2024, 1, 1)
+    for index in range(start, start + count):
+        yield ((origin + timedelta(seconds=index / FPS)).isoformat(),
+               rng.choice(EVENT_TYPES), "bench", "VERT", rng.choice(SCENARIOS),
+               index // EVENTS_PER_VEHICLE, rng.uniform(-400, 400), rng.uniform(-400, 400),
+               rng.uniform(0, 2.5), index / FPS)
+
+
+def measure(query, queries: int) -> dict:
+    """
+    Latence (µs) d'une requête répétée
+    """
+    durations = []
+    for _ in range(queries):
+        start = time.perf_counter()
+        query()
+        durations.append(time.perf_counter() - start)
+    durations.sort()
+    return {"p50": durations[len(durations) // 2] * 1e6,
+            "p95": durations[int(0.95 * (len(durations) - 1))] * 1e6}
+
+
+def peak_memory_mb() -> float:
+    """
+    Mémoire résidente maximale du processus (Mo), 0 si inconnue
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def main() -> int:
+    """
+    Fonction principale
+    """
+    parser = argparse.ArgumentParser(description="Banc d'essai des requêtes de la base d'événements")
+    parser.add_argument("--max-rows", type=int, default=1000000)
+    parser.add_argument("--queries", type=int, default=200, help="Requêtes mesurées par palier")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--export", action="store_true",
+                        help="Mesure aussi les exports CSV, CSV gzip et NPZ de la table finale")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    directory = tempfile.mkdtemp(prefix="bench_db_")
+    db = DatabaseManager(os.path.join(directory, "bench.db"))
+    if not db.connect():
+        return 1
+    print(f"journal: {db.journal_mode}")
+    print(f"{'lignes':>10} {'insert/s':>10} {'type p50':>10} {'scén. p50':>10} "
+          f"{'véh. p50':>10} {'véh. p95':>10}  (µs)")
+    try:
+        rows = 0
+        for size in SIZES:
+            if size > args.max_rows:
+                break
+            before = rows
+            start = time.perf_counter()
+            while rows < size:
+                count = min(CHUNK, size - rows)
+                db.insert_events(list(synthetic_rows(rows, count, rng)))
+                rows += count
+            insert_rate = (rows - before) / (time.perf_counter() - start)
+
+            vehicles = rows // EVENTS_PER_VEHICLE
+            by_type = measure(lambda: db.get_events_by_type(rng.choice(EVENT_TYPES)), args.queries)
+            by_scenario = measure(lambda: db.get_events_by_scenario(rng.choice(SCENARIOS)),
+                                  args.queries)
+            by_vehicle = measure(lambda: db.get_vehicle_events(rng.randrange(vehicles)),
+                                 args.queries)
+            print(f"{rows:>10} {insert_rate:>10.0f} {by_type['p50']:>10.1f} "
+                  f"{by_scenario['p50']:>10.1f} {by_vehicle['p50']:>10.1f} "
+                  f"{by_vehicle['p95']:>10.1f}")
+
+        if args.export:
+            for name, export in (("events.csv", db.export_to_csv),
+                                 ("events.csv.gz", db.export_to_csv),
+                                 ("events.npz", db.export_to_npz)):
+                filename = os.path.join(directory, name)
+                start = time.perf_counter()
+                if not export(filename):
+                    continue
+                elapsed = time.perf_counter() - start
+                size = os.path.getsize(filename) / 1e6
+                print(f"export {name:<14}: {rows / elapsed:>10.0f} lignes/s, {size:>8.1f} Mo, "
+                      f"{size / elapsed:>6.1f} Mo/s, mémoire max {peak_memory_mb():.0f} Mo")
+                os.remove(filename)
+
+        # Rétention : les événements synthétiques sont tous anciens, leurs
+        # partitions journalières sont supprimées d'un bloc
+        start = time.perf_counter()
+        removed = db.clear_old_events(30)
+        print(f"rétention : {removed} événements supprimés en "
+              f"{(time.perf_counter() - start) * 1000:.1f} ms, "
+              f"{len(db.partitions)} partitions restantes")
+    finally:
+        db.disconnect()
+        shutil.rmtree(directory, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
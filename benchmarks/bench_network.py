@@ -0,0 +1,80 @@
+"""
+Banc d'essai : pas de simulation d'un réseau de carrefours
+
+Usage : python benchmarks/bench_network.py [--junctions 100] [--seconds 10]
+"""
+
+import argparse
+import math
+import sys
+import os
+import time
+
+# Ajouter le répertoire src au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from road_network import RoadNetwork
+from constants import FPS
+
+
+def grid_shape(junctions: int):
+    """
+    Retourne (lignes, colonnes) d'une grille la plus carrée possible
+    """
+    rows = max(1, int(math.sqrt(junctions)))
+    while junctions % rows:
+        rows -= 1
+    return rows, junctions // rows
+
+
+def bench(junctions: int, seconds: float, scenario: str, warmup: float, seed: int) -> dict:
+    """
+    Mesure le temps d'un pas pour un réseau de la taille donnée
+    """
+    rows, columns = grid_shape(junctions)
+    network = RoadNetwork(rows, columns, seed=seed, scenario=scenario)
+    network.setup()
+    network.run_for(warmup)
+
+    steps = int(round(seconds * FPS))
+    start = time.perf_counter()
+    for _ in range(steps):
+        network.step()
+    elapsed = time.perf_counter() - start
+
+    stats = network.get_statistics()
+    return {
+        "junctions": junctions,
+        "grid": f"{rows}x{columns}",
+        "vehicles": stats["vehicle_count"],
+        "ticks_per_second": steps / elapsed,
+        "us_per_junction_tick": elapsed / steps / junctions * 1e6
+    }
+
+
+def main() -> int:
+    """
+    Fonction principale
+    """
+    parser = argparse.ArgumentParser(description="Banc d'essai du réseau multi-carrefours")
+    parser.add_argument("--junctions", type=int, default=100)
+    parser.add_argument("--seconds", type=float, default=10.0, help="Durée simulée mesurée")
+    parser.add_argument("--warmup", type=float, default=30.0, help="Durée simulée de chauffe")
+    parser.add_argument("--scenario", default="rush_hour")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # Échelle croissante jusqu'à la taille demandée : le coût par carrefour doit rester stable
+    sizes = sorted({1, 10, args.junctions} | ({100} if args.junctions >= 100 else set()))
+    print(f"{'carrefours':>10} {'grille':>8} {'véhicules':>10} {'ticks/s':>10} {'µs/carrefour':>13}")
+    for junctions in sizes:
+        if junctions > args.junctions:
+            continue
+        result = bench(junctions, args.seconds, args.scenario, args.warmup, args.seed)
+        print(f"{result['junctions']:>10} {result['grid']:>8} {result['vehicles']:>10} "
+              f"{result['ticks_per_second']:>10.1f} {result['us_per_junction_tick']:>13.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
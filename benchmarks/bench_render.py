@@ -0,0 +1,87 @@
+"""
+Banc d'essai : coût d'une frame d'affichage selon le backend et le nombre de véhicules
+
+Usage : python benchmarks/bench_render.py [--renderer canvas] [--vehicles 1000] [--frames 300]
+
+Nécessite un affichage (DISPLAY) : la scène est dessinée dans une vraie fenêtre Tk.
+Les véhicules sont synthétiques et tous en mouvement (pire cas pour le dessin
+différentiel) ; le budget d'une frame à 60 FPS est de 16,7 ms.
+"""
+
+import argparse
+import sys
+import os
+import time
+import tkinter as tk
+
+# Ajouter le répertoire src au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from constants import *
+from road_scene import RENDERERS, create_scene
+from benchmark import synthetic_frames
+
+
+def bench(renderer: str, vehicles: int, frames: int, seed: int) -> dict:
+    """
+    Mesure le temps de rendu d'une frame
+    """
+    # Fenêtre propre à chaque mesure (turtle.Screen ne peut être recréé après bye())
+    root = tk.Tk()
+    canvas = tk.Canvas(root, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, highlightthickness=0)
+    canvas.pack()
+    scene = create_scene(renderer, canvas)
+    if not scene.setup():
+        root.destroy()
+        raise RuntimeError("Impossible de créer la scène")
+    snapshots = list(synthetic_frames(vehicles, frames, seed))
+    # Première frame hors mesure : création des sprites
+    scene.render(None, snapshots[0])
+
+    durations = []
+    for snapshot in snapshots[1:]:
+        start = time.perf_counter()
+        scene.render(None, snapshot)
+        durations.append(time.perf_counter() - start)
+    stats = scene.get_render_statistics()
+    scene.close()
+    root.destroy()
+
+    durations.sort()
+    mean = sum(durations) / len(durations)
+    return {
+        "renderer": renderer,
+        "vehicles": vehicles,
+        "ms_mean": mean * 1000.0,
+        "ms_p95": durations[int(0.95 * (len(durations) - 1))] * 1000.0,
+        "fps": 1.0 / mean if mean > 0 else float("inf"),
+        "canvas_ops_per_frame": stats["canvas_ops_last_frame"]
+    }
+
+
+def main() -> int:
+    """
+    Fonction principale
+    """
+    parser = argparse.ArgumentParser(description="Banc d'essai des backends d'affichage")
+    parser.add_argument("--renderer", choices=sorted(RENDERERS), default=None,
+                        help="Backend mesuré (tous par défaut)")
+    parser.add_argument("--vehicles", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    renderers = [args.renderer] if args.renderer else sorted(RENDERERS)
+    sizes = sorted({100, args.vehicles})
+    print(f"{'backend':>8} {'véhicules':>10} {'ms/frame':>9} {'p95 ms':>8} {'FPS max':>8} {'ops/frame':>10}")
+    for renderer in renderers:
+        for vehicles in sizes:
+            result = bench(renderer, vehicles, args.frames, args.seed)
+            print(f"{result['renderer']:>8} {result['vehicles']:>10} {result['ms_mean']:>9.2f} "
+                  f"{result['ms_p95']:>8.2f} {result['fps']:>8.0f} "
+                  f"{result['canvas_ops_per_frame']:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""
+Calendriers d'arrivée des véhicules (processus de Poisson par voie)
+Responsable : Ndeye Khady Syll
+"""
+
+import heapq
+import math
+import random
+from typing import List, Optional, Sequence, Tuple
+from constants import *
+
+# Durée (secondes simulées) couverte par chaque lot d'arrivées tirées d'avance
+ARRIVAL_BATCH_SECONDS = 60.0
+# Débit maximal, en arrivées moyennes par frame (probabilité d'apparition ≥ 1)
+MAX_ARRIVALS_PER_FRAME = 5.0
+
+
+def arrival_rate(spawn_probability: float, fps: float = FPS) -> float:
+    """
+    Convertit une probabilité d'apparition par frame en débit (véhicules/s)
+
+    Le débit choisi donne la même probabilité d'au moins une arrivée par
+    frame que l'ancien tirage de Bernoulli à fps images par seconde, plafonné
+    à MAX_ARRIVALS_PER_FRAME arrivées par frame (une probabilité de 1
+    donnerait un débit infini).
+    """
+    if spawn_probability <= 0:
+        return 0.0
+    maximum = MAX_ARRIVALS_PER_FRAME * fps
+    if spawn_probability >= 1:
+        return maximum
+    return min(-fps * math.log(1.0 - spawn_probability), maximum)
+
+
+class ArrivalSchedule:
+    """
+    Arrivées précalculées pour un ensemble de voies d'entrée
+
+    Chaque voie reçoit un processus de Poisson de débit rate / nombre de voies,
+    éventuellement modulé dans le temps par un profil de demande (méthode
+    d'amincissement). Les arrivées sont tirées par lots de
+    ARRIVAL_BATCH_SECONDS et rangées dans un tas : le coût est proportionnel
+    au nombre d'arrivées, et les instants ne dépendent pas du pas de temps.
+    """
+
+    def __init__(self, lanes: Sequence[Tuple[str, int]], rate: float,
+                 rng: Optional[random.Random] = None,
+                 profile: Optional[List[Tuple[float, float]]] = None,
+                 start_time: float = 0.0):
+        """
+        Initialise le calendrier
+
+        Args:
+            lanes: Voies d'entrée (sens, index de voie)
+            rate: Débit total en véhicules par seconde
+            rng: Générateur propre au calendrier
+            profile: Demande variable : [(instant, multiplicateur), ...] en
+                paliers, le premier palier s'appliquant aussi avant son instant
+            start_time: Instant à partir duquel les arrivées sont tirées
+        """
+        self.lanes = list(lanes)
+        self.rng = rng or random.Random()
+        self.rate = rate
+        self.profile = sorted(profile) if profile else None
+        self.queue: List[Tuple[float, int]] = []
+        self.horizon = start_time
+        self.total_arrivals = 0
+
+    def reset(self, start_time: float, rate: Optional[float] = None,
+              lanes: Optional[Sequence[Tuple[str, int]]] = None) -> None:
+        """
+        Oublie les arrivées tirées et repart de start_time (changement de débit)
+        """
+        if rate is not None:
+            self.rate = rate
+        if lanes is not None:
+            self.lanes = list(lanes)
+        self.queue.clear()
+        self.horizon = start_time
+
+    def multiplier(self, current_time: float) -> float:
+        """
+        Retourne le multiplicateur de demande à un instant donné
+        """
+        if not self.profile:
+            return 1.0
+        value = self.profile[0][1]
+        for start, factor in self.profile:
+            if start > current_time:
+                break
+            value = factor
+        return value
+
+    def pop_due(self, current_time: float) -> List[Tuple[str, int]]:
+        """
+        Retire et retourne les voies dont une arrivée est échue, dans l'ordre chronologique
+        """
+        while self.horizon <= current_time:
+            self._draw_batch()
+
+        due = []
+        queue = self.queue
+        while queue and queue[0][0] <= current_time:
+            _, lane_index = heapq.heappop(queue)
+            due.append(self.lanes[lane_index])
+        self.total_arrivals += len(due)
+        return due
+
+    def next_arrival_time(self) -> Optional[float]:
+        """
+        Retourne l'instant de la prochaine arrivée déjà tirée
+        """
+        return self.queue[0][0] if self.queue else None
+
+    def _draw_batch(self) -> None:
+        """
+        Tire les arrivées de toutes les voies sur la fenêtre suivante
+        """
+        start = self.horizon
+        end = start + ARRIVAL_BATCH_SECONDS
+        self.horizon = end
+        if not self.lanes or self.rate <= 0:
+            return
+
+        peak = max(factor for _, factor in self.profile) if self.profile else 1.0
+        lane_rate = self.rate * peak / len(self.lanes)
+        if not math.isfinite(lane_rate):
+            # expovariate(inf) vaut toujours 0 : le tirage ne finirait jamais
+            raise ValueError(f"Débit d'arrivée non fini: {self.rate}")
+        if lane_rate <= 0:
+            return
+
+        rng = self.rng
+        # Sans mémoire : chaque fenêtre peut repartir de son début
+        for lane_index in range(len(self.lanes)):
+            current_time = start
+            while True:
+                current_time += rng.expovariate(lane_rate)
+                if current_time >= end:
+                    break
+                if self.profile and rng.random() * peak >= self.multiplier(current_time):
+                    continue
+                heapq.heappush(self.queue, (current_time, lane_index))
+
+
+if __name__ == "__main__":
+    pass
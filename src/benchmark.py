@@ -0,0 +1,414 @@
+"""
+Suite de bancs d'essai : passage à l'échelle en nombre de véhicules
+Responsable : Ndeye Khady Syll
+
+Mesure, pour 10 à 100 000 véhicules, le nombre de pas headless par seconde et
+le coût par véhicule (pour chaque scénario), le coût d'entrée/sortie d'un
+véhicule, le débit d'insertion du logger et le temps d'une frame d'affichage.
+Les résultats sont écrits en JSON ; compare_results les confronte à une
+référence enregistrée et liste les régressions.
+
+Les véhicules sont répartis sur un réseau de carrefours (VEHICLES_PER_JUNCTION
+par carrefour au plus) : un seul carrefour ne peut physiquement en contenir
+que quelques centaines.
+"""
+
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from constants import *
+from scenario_manager import ScenarioType
+from vehicle import VehicleManager, VehicleType, np
+from road_network import RoadNetwork
+from snapshot import FrameSnapshot, LightSnapshot, VehicleSnapshot
+
+BENCH_SIZES = (10, 100, 1000, 10000, 100000)
+BENCH_FORMAT = 1
+
+VEHICLES_PER_JUNCTION = 120   # 10 véhicules sur chacune des 12 voies
+BENCH_SPACING = 70            # Espacement initial (camion + distance de sécurité)
+BENCH_DISPLAY_ID = 10 ** 9    # IDs affichés hors de ceux des carrefours
+
+STEP_BUDGET = 200000          # Véhicules x pas mesurés par taille (borne la durée)
+MIN_STEPS = 5
+MAX_STEPS = 120
+WARMUP_STEPS = 5
+LOG_BENCH_EVENTS = 20000      # Événements journalisés par la mesure du logger
+LOG_BENCH_SECONDS = 2.0       # Durée maximale de la mesure du logger
+RENDER_MAX_VEHICLES = 10000   # Au-delà, le rendu n'est plus un cas réaliste
+RENDER_FRAMES = 60
+
+# Sens d'amélioration de chaque métrique (True : plus grand = meilleur)
+METRICS = {
+    "steps_per_second": True,
+    "us_per_vehicle": False,
+    "us_per_spawn": False,
+    "us_per_remove": False,
+    "events_per_second": True,
+    "ms_per_frame": False
+}
+REGRESSION_TOLERANCE = 0.2
+
+
+def _steps_for(vehicles: int) -> int:
+    """
+    Nombre de pas mesurés pour une taille donnée
+    """
+    return int(min(MAX_STEPS, max(MIN_STEPS, STEP_BUDGET // max(1, vehicles))))
+
+
+def populate_network(vehicles: int, scenario: str = "normal",
+                     seed: Optional[int] = 1) -> RoadNetwork:
+    """
+    Crée un réseau juste assez grand et y place vehicles véhicules
+
+    Les véhicules sont répartis uniformément sur toutes les voies, du plus
+    éloigné de l'entrée au plus proche (accept_vehicle les ajoute en queue).
+    """
+    junctions = max(1, math.ceil(vehicles / VEHICLES_PER_JUNCTION))
+    rows = max(1, int(math.sqrt(junctions)))
+    columns = math.ceil(junctions / rows)
+    network = RoadNetwork(rows, columns, seed=seed, scenario=scenario)
+    network.setup()
+
+    lanes = [(junction, direction, lane_id)
+             for junction in list(network.junctions.values())[:junctions]
+             for direction, lane_id in sorted(junction.vehicle_manager.lanes)]
+    base, extra = divmod(vehicles, len(lanes))
+    rng = random.Random(seed)
+    display_id = BENCH_DISPLAY_ID
+    for slot, (junction, direction, lane_id) in enumerate(lanes):
+        count = base + (1 if slot < extra else 0)
+        for rank in reversed(range(count)):
+            vehicle_type = VehicleType.TRUCK if rng.random() < TRUCK_PROBABILITY else VehicleType.CAR
+            config = VEHICLE_CONFIG[vehicle_type.value]
+            colors = TRUCK_COLORS if vehicle_type == VehicleType.TRUCK else CAR_COLORS
+            junction.vehicle_manager.accept_vehicle(
+                display_id, vehicle_type, lane_id, direction, rank * BENCH_SPACING,
+                config["max_speed"] / 2, config["max_speed"], rng.choice(colors))
+            display_id += 1
+    return network
+
+
+def bench_steps(vehicles: int, scenario: str, seed: Optional[int] = 1) -> Dict[str, Any]:
+    """
+    Pas headless par seconde et coût de mise à jour par véhicule
+    """
+    network = populate_network(vehicles, scenario, seed)
+    for _ in range(WARMUP_STEPS):
+        network.step()
+
+    steps = _steps_for(vehicles)
+    before = network.get_statistics()["vehicle_count"]
+    start = time.perf_counter()
+    for _ in range(steps):
+        network.step()
+    elapsed = time.perf_counter() - start
+
+    mean_vehicles = (before + network.get_statistics()["vehicle_count"]) / 2
+    return {
+        "junctions": len(network.junctions),
+        "steps": steps,
+        "mean_vehicles": mean_vehicles,
+        "steps_per_second": steps / elapsed,
+        "us_per_vehicle": elapsed / steps / max(1.0, mean_vehicles) * 1e6
+    }
+
+
+def bench_churn(vehicles: int, seed: Optional[int] = 1) -> Dict[str, Any]:
+    """
+    Coût d'entrée puis de sortie de vehicles véhicules dans un gestionnaire
+
+    Mesure la tenue des files de voie, de la grille spatiale et du pool, sans
+    mise à jour du mouvement.
+    """
+    manager = VehicleManager(rng=random.Random(seed))
+    lanes = sorted(manager.lanes)
+    config = VEHICLE_CONFIG[VehicleType.CAR.value]
+
+    start = time.perf_counter()
+    for index in range(vehicles):
+        direction, lane_id = lanes[index % len(lanes)]
+        manager.accept_vehicle(BENCH_DISPLAY_ID + index, VehicleType.CAR, lane_id, direction,
+                               0.0, config["max_speed"], config["max_speed"], CAR_COLORS[0])
+    spawn_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for vehicle_id in list(manager.vehicles):
+        manager.remove_vehicle(vehicle_id)
+    remove_time = time.perf_counter() - start
+
+    return {
+        "us_per_spawn": spawn_time / vehicles * 1e6,
+        "us_per_remove": remove_time / vehicles * 1e6
+    }
+
+
+def bench_logger(events: int = LOG_BENCH_EVENTS,
+                 seconds: float = LOG_BENCH_SECONDS) -> Dict[str, Any]:
+    """
+    Débit d'insertion du logger dans une base SQLite temporaire
+
+    Journalise events événements (ou pendant seconds secondes au plus), puis
+    attend leur écriture. Le débit ne dépend pas du nombre de véhicules : la
+    mesure est faite une fois, sur un échantillon assez grand pour que le
+    démarrage et l'arrêt du thread d'écriture soient négligeables.
+    """
+    from database import DatabaseManager
+    from logger import EventLogger
+
+    directory = tempfile.mkdtemp(prefix="bench_")
+    database = DatabaseManager(os.path.join(directory, "bench.db"))
+    try:
+        if not database.connect():
+            raise RuntimeError("Impossible de créer la base de test")
+        logger = EventLogger(database)
+        inserted = 0
+        start = time.perf_counter()
+        deadline = start + seconds
+        while inserted < events and time.perf_counter() < deadline:
+            logger.log_vehicle_event(inserted, "VEHICLE_CREATED", 1.0, 2.0, 3.0)
+            inserted += 1
+        # L'écriture des événements encore en file fait partie de la mesure
+        logger.close()
+        elapsed = time.perf_counter() - start
+    finally:
+        database.disconnect()
+        shutil.rmtree(directory, ignore_errors=True)
+
+    return {
+        "events": inserted,
+        "events_per_second": inserted / elapsed if elapsed > 0 else float("inf")
+    }
+
+
+def synthetic_frames(vehicles: int, frames: int, seed: int):
+    """
+    Produit des instantanés de véhicules circulant dans les quatre sens
+    """
+    rng = random.Random(seed)
+    directions = list(LANE_STARTS)
+    fleet = []
+    for display_id in range(1, vehicles + 1):
+        direction = rng.choice(directions)
+        start_x, start_y = rng.choice(LANE_STARTS[direction])
+        vehicle_type = "truck" if rng.random() < TRUCK_PROBABILITY else "car"
+        color = rng.choice(TRUCK_COLORS if vehicle_type == "truck" else CAR_COLORS)
+        fleet.append((display_id, direction, start_x, start_y, rng.uniform(0, LANE_LENGTH),
+                      vehicle_type, color))
+
+    lights = tuple(LightSnapshot(position, "VERT", GREEN) for position in TRAFFIC_LIGHT_POSITIONS)
+    for frame in range(frames):
+        snapshot_vehicles = []
+        for display_id, direction, start_x, start_y, offset, vehicle_type, color in fleet:
+            dx, dy = DIRECTION_VECTORS[direction]
+            distance = (offset + 2.0 * frame) % LANE_LENGTH
+            snapshot_vehicles.append(VehicleSnapshot(display_id, start_x + dx * distance,
+                                                     start_y + dy * distance, direction,
+                                                     color, vehicle_type))
+        yield FrameSnapshot(frame / FPS, frame, time.perf_counter(), "VERT", "normal",
+                            lights, tuple(snapshot_vehicles))
+
+
+def bench_render(renderer: str, vehicles: int, frames: int = RENDER_FRAMES,
+                 seed: int = 1) -> Dict[str, Any]:
+    """
+    Temps de rendu d'une frame (nécessite un affichage)
+    """
+    import tkinter as tk
+    from road_scene import create_scene
+
+    # Fenêtre propre à chaque mesure (turtle.Screen ne peut être recréé après bye())
+    root = tk.Tk()
+    try:
+        canvas = tk.Canvas(root, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, highlightthickness=0)
+        canvas.pack()
+        scene = create_scene(renderer, canvas)
+        if not scene.setup():
+            raise RuntimeError("Impossible de créer la scène")
+        snapshots = list(synthetic_frames(vehicles, frames, seed))
+        # Première frame hors mesure : création des sprites
+        scene.render(None, snapshots[0])
+
+        durations = []
+        for snapshot in snapshots[1:]:
+            start = time.perf_counter()
+            scene.render(None, snapshot)
+            durations.append(time.perf_counter() - start)
+        stats = scene.get_render_statistics()
+        scene.close()
+    finally:
+        root.destroy()
+
+    durations.sort()
+    mean = sum(durations) / len(durations)
+    return {
+        "ms_per_frame": mean * 1000.0,
+        "ms_p95": durations[int(0.95 * (len(durations) - 1))] * 1000.0,
+        "fps": 1.0 / mean if mean > 0 else float("inf"),
+        "canvas_ops_per_frame": stats["canvas_ops_last_frame"]
+    }
+
+
+def _display_available() -> Optional[str]:
+    """
+    Retourne None si Tk peut ouvrir une fenêtre, sinon la raison
+    """
+    try:
+        import tkinter as tk
+        tk.Tk().destroy()
+    except Exception as e:
+        return str(e) or type(e).__name__
+    return None
+
+
+def run_suite(sizes: Iterable[int] = BENCH_SIZES,
+              scenarios: Optional[Iterable[str]] = None,
+              render: bool = True, seed: int = 1,
+              progress=None) -> Dict[str, Any]:
+    """
+    Exécute tous les bancs d'essai et retourne le rapport (sérialisable en JSON)
+
+    Args:
+        scenarios: Scénarios mesurés (tous les ScenarioType par défaut)
+        render: Mesure aussi le rendu si un affichage est disponible
+        progress: Fonction appelée avec chaque résultat (affichage)
+    """
+    sizes = sorted(set(sizes))
+    scenarios = list(scenarios) if scenarios is not None else [s.value for s in ScenarioType]
+    results: List[Dict[str, Any]] = []
+
+    def add(bench: str, vehicles: int, metrics: Dict[str, Any], **labels) -> None:
+        result = {"bench": bench, "vehicles": vehicles, **labels, "metrics": metrics}
+        results.append(result)
+        if progress:
+            progress(result)
+
+    for vehicles in sizes:
+        for scenario in scenarios:
+            add("steps", vehicles, bench_steps(vehicles, scenario, seed), scenario=scenario)
+        add("churn", vehicles, bench_churn(vehicles, seed))
+    # Indépendant de la taille : une seule mesure, sans véhicule
+    add("logger", 0, bench_logger())
+
+    render_skipped = _display_available() if render else "désactivé"
+    if render_skipped is None:
+        from road_scene import RENDERERS
+        for renderer in sorted(RENDERERS):
+            for vehicles in sizes:
+                if vehicles <= RENDER_MAX_VEHICLES:
+                    add("render", vehicles, bench_render(renderer, vehicles, seed=seed),
+                        renderer=renderer)
+
+    return {
+        "format": BENCH_FORMAT,
+        "version": VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np is not None,
+        "sizes": sizes,
+        "scenarios": scenarios,
+        "render_skipped": render_skipped,
+        "results": results
+    }
+
+
+def _result_key(result: Dict[str, Any]) -> tuple:
+    """
+    Identifie une mesure indépendamment de ses valeurs
+    """
+    return (result["bench"], result["vehicles"], result.get("scenario"), result.get("renderer"))
+
+
+def compare_results(report: Dict[str, Any], baseline: Dict[str, Any],
+                    tolerance: float = REGRESSION_TOLERANCE) -> List[Dict[str, Any]]:
+    """
+    Liste les métriques dégradées de plus de tolerance par rapport à la référence
+
+    Seules les mesures présentes dans les deux rapports sont comparées.
+    """
+    reference = {_result_key(result): result["metrics"] for result in baseline.get("results", [])}
+    regressions = []
+    for result in report["results"]:
+        old_metrics = reference.get(_result_key(result))
+        if old_metrics is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old, new = old_metrics.get(metric), result["metrics"].get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append({"bench": result["bench"], "vehicles": result["vehicles"],
+                                    "scenario": result.get("scenario"),
+                                    "renderer": result.get("renderer"),
+                                    "metric": metric, "baseline": old, "value": new,
+                                    "change": change})
+    return regressions
+
+
+def save_report(report: Dict[str, Any], filename: str) -> None:
+    """
+    Écrit le rapport en JSON
+    """
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+def load_report(filename: str) -> Dict[str, Any]:
+    """
+    Lit un rapport JSON (référence)
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    """
+    Ligne de tableau pour un résultat
+    """
+    label = result.get("scenario") or result.get("renderer") or ""
+    metrics = "  ".join(f"{name}={value:.2f}" if isinstance(value, float) else f"{name}={value}"
+                        for name, value in result["metrics"].items())
+    return f"{result['bench']:>7} {label:>10} {result['vehicles']:>7}  {metrics}"
+
+
+def run_benchmarks(output: str, baseline: Optional[str] = None,
+                   sizes: Iterable[int] = BENCH_SIZES,
+                   scenarios: Optional[Iterable[str]] = None,
+                   tolerance: float = REGRESSION_TOLERANCE, render: bool = True) -> int:
+    """
+    Exécute la suite, écrit le rapport et le compare à la référence
+
+    Returns:
+        int: 0 si aucune régression, 1 sinon
+    """
+    report = run_suite(sizes, scenarios, render=render,
+                       progress=lambda result: print(format_result(result)))
+    if report["render_skipped"]:
+        print(f"Rendu non mesuré : {report['render_skipped']}")
+    save_report(report, output)
+    print(f"✓ Résultats écrits dans {output}")
+
+    if not baseline:
+        return 0
+    regressions = compare_results(report, load_report(baseline), tolerance)
+    for regression in regressions:
+        label = regression["scenario"] or regression["renderer"] or ""
+        print(f"✗ {regression['bench']} {label} {regression['vehicles']} : "
+              f"{regression['metric']} {regression['baseline']:.2f} -> "
+              f"{regression['value']:.2f} ({regression['change']:+.0%})")
+    if not regressions:
+        print(f"✓ Aucune régression au-delà de {tolerance:.0%} par rapport à {baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,226 @@
+"""
+Sauvegarde et restauration binaires de l'état complet d'une simulation
+Responsable : Ndeye Khady Syll
+
+Format (version 2, petit-boutiste) :
+    en-tête    : magic "TSCK", version (uint16), taille des métadonnées (uint32)
+    métadonnées: JSON UTF-8 (horloge, scénario, feux, compteurs, couleurs,
+                 arrivées déjà tirées)
+    RNG        : état du random.Random de la simulation puis de celui des
+                 arrivées (uint32 x n, puis gauss_next)
+    véhicules  : une colonne brute du VehicleStore après l'autre, voie par voie,
+                 puis l'index de couleur de chaque véhicule (uint16)
+
+Les colonnes sont copiées telles quelles depuis les tableaux du stockage :
+la restauration ne reconstruit que les vues, les voies et l'index spatial.
+"""
+
+import json
+import struct
+import sys
+from typing import Any, Dict, List, Tuple
+from constants import *
+from traffic_light import TrafficLightState
+from scenario_manager import ScenarioType
+from vehicle import Vehicle
+from vehicle_store import FLOAT_COLUMNS, INT_COLUMNS, ITEM_SIZES
+
+CHECKPOINT_MAGIC = b"TSCK"
+CHECKPOINT_VERSION = 2
+
+HEADER = struct.Struct("<4sHI")
+RNG_HEADER = struct.Struct("<IH")
+RNG_GAUSS = struct.Struct("<?d")
+
+# Colonnes sauvegardées ("alive" est implicite : toutes les lignes sont vivantes)
+CHECKPOINT_COLUMNS = FLOAT_COLUMNS + tuple(name for name in INT_COLUMNS if name != "alive")
+COLUMN_ITEM_SIZES = {name: ITEM_SIZES["f8"] for name in FLOAT_COLUMNS}
+COLUMN_ITEM_SIZES.update({name: ITEM_SIZES["i4"] for name in INT_COLUMNS})
+
+
+def _pack_rng_state(state: Tuple) -> bytes:
+    """
+    Encode l'état d'un random.Random (version, tableau interne, gauss_next)
+    """
+    version, internal, gauss_next = state
+    data = RNG_HEADER.pack(len(internal), version)
+    data += struct.pack(f"<{len(internal)}I", *internal)
+    data += RNG_GAUSS.pack(gauss_next is not None, gauss_next or 0.0)
+    return data
+
+
+def _unpack_rng_state(buffer: memoryview, offset: int) -> Tuple[Tuple, int]:
+    """
+    Décode l'état d'un random.Random ; retourne (état, position suivante)
+    """
+    length, version = RNG_HEADER.unpack_from(buffer, offset)
+    offset += RNG_HEADER.size
+    internal = struct.unpack_from(f"<{length}I", buffer, offset)
+    offset += 4 * length
+    has_gauss, gauss_next = RNG_GAUSS.unpack_from(buffer, offset)
+    offset += RNG_GAUSS.size
+    return (version, internal, gauss_next if has_gauss else None), offset
+
+
+def save_checkpoint(simulation, path: str) -> int:
+    """
+    Écrit l'état de la simulation dans un fichier
+
+    Returns:
+        int: Taille du fichier en octets
+    """
+    with simulation.lock:
+        lights = simulation.traffic_light_manager.lights
+        manager = simulation.vehicle_manager
+        columns, colors = manager.export_vehicles(CHECKPOINT_COLUMNS)
+        palette = sorted(set(colors))
+        palette_index = {color: index for index, color in enumerate(palette)}
+
+        meta: Dict[str, Any] = {
+            "byteorder": sys.byteorder,
+            "seed": simulation.seed,
+            "sim_time": simulation.sim_time,
+            "frame_count": simulation.frame_count,
+            "current_light_state": simulation.current_light_state,
+            "scenario": simulation.scenario_manager.get_current_scenario_name(),
+            "next_vehicle_id": Vehicle._next_id,
+            "total_spawned": manager.total_spawned,
+            "total_removed": manager.total_removed,
+            "free_vehicle_ids": manager.free_ids,
+            "next_pool_id": manager.next_vehicle_id,
+            "vehicle_count": len(colors),
+            "columns": list(CHECKPOINT_COLUMNS),
+            "palette": palette,
+            "lights": [{
+                "state": light.state.value,
+                "scenario": light.scenario,
+                "timings": light.timings,
+                "automatic": light.automatic,
+                "blink_on": light.blink_on,
+                "current_time": light.current_time,
+                "state_start_time": light.state_start_time
+            } for light in lights],
+            "arrivals": {
+                "lanes": simulation.arrivals.lanes,
+                "rate": simulation.arrivals.rate,
+                "profile": simulation.arrivals.profile,
+                "horizon": simulation.arrivals.horizon,
+                "queue": simulation.arrivals.queue,
+                "total_arrivals": simulation.arrivals.total_arrivals
+            }
+        }
+        meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+        rng_bytes = (_pack_rng_state(simulation.rng.getstate())
+                     + _pack_rng_state(simulation.arrivals.rng.getstate()))
+        color_bytes = struct.pack(f"<{len(colors)}H", *(palette_index[color] for color in colors))
+
+    with open(path, "wb") as checkpoint_file:
+        checkpoint_file.write(HEADER.pack(CHECKPOINT_MAGIC, CHECKPOINT_VERSION, len(meta_bytes)))
+        checkpoint_file.write(meta_bytes)
+        checkpoint_file.write(rng_bytes)
+        for name in CHECKPOINT_COLUMNS:
+            checkpoint_file.write(columns[name])
+        checkpoint_file.write(color_bytes)
+        return checkpoint_file.tell()
+
+
+def read_checkpoint(path: str) -> Tuple[Dict[str, Any], Tuple, Dict[str, bytes], List[str]]:
+    """
+    Lit et vérifie un fichier de sauvegarde
+
+    Returns:
+        Tuple: (métadonnées, état du RNG, octets bruts de chaque colonne,
+        couleur de chaque véhicule)
+    """
+    with open(path, "rb") as checkpoint_file:
+        buffer = memoryview(checkpoint_file.read())
+
+    if len(buffer) < HEADER.size:
+        raise ValueError(f"Sauvegarde tronquée: {path}")
+    magic, version, meta_length = HEADER.unpack_from(buffer, 0)
+    if magic != CHECKPOINT_MAGIC:
+        raise ValueError(f"Fichier de sauvegarde invalide: {path}")
+    if version != CHECKPOINT_VERSION:
+        raise ValueError(f"Version de sauvegarde non prise en charge: {version}")
+
+    offset = HEADER.size
+    meta = json.loads(bytes(buffer[offset:offset + meta_length]).decode("utf-8"))
+    offset += meta_length
+    if meta["byteorder"] != sys.byteorder:
+        raise ValueError("Sauvegarde écrite sur une machine d'ordre d'octets différent")
+
+    rng_state, offset = _unpack_rng_state(buffer, offset)
+    meta["arrivals"]["rng_state"], offset = _unpack_rng_state(buffer, offset)
+
+    count = meta["vehicle_count"]
+    columns = {}
+    for name in meta["columns"]:
+        size = count * COLUMN_ITEM_SIZES[name]
+        if offset + size > len(buffer):
+            raise ValueError(f"Sauvegarde tronquée: {path}")
+        columns[name] = buffer[offset:offset + size]
+        offset += size
+
+    if offset + 2 * count > len(buffer):
+        raise ValueError(f"Sauvegarde tronquée: {path}")
+    palette = meta["palette"]
+    colors = [palette[index] for index in struct.unpack_from(f"<{count}H", buffer, offset)]
+    return meta, rng_state, columns, colors
+
+
+def load_checkpoint(simulation, path: str) -> None:
+    """
+    Remplace l'état de la simulation par celui d'un fichier de sauvegarde
+    """
+    meta, rng_state, columns, colors = read_checkpoint(path)
+
+    with simulation.lock:
+        if simulation.vehicle_manager is None and not simulation.setup():
+            raise RuntimeError("Impossible de configurer la simulation")
+
+        manager = simulation.vehicle_manager
+        simulation.scenario_manager.change_scenario(ScenarioType(meta["scenario"]))
+        manager.set_scenario(meta["scenario"])
+        manager.import_vehicles(columns, colors)
+        manager.total_spawned = meta["total_spawned"]
+        manager.total_removed = meta["total_removed"]
+        manager.free_ids = list(meta["free_vehicle_ids"])
+        manager.next_vehicle_id = meta["next_pool_id"]
+
+        light_manager = simulation.traffic_light_manager
+        light_manager.scenario = meta["scenario"]
+        for light, saved in zip(light_manager.lights, meta["lights"]):
+            light.state = TrafficLightState(saved["state"])
+            light.scenario = saved["scenario"]
+            light.timings = saved["timings"]
+            light.automatic = saved["automatic"]
+            light.blink_on = saved["blink_on"]
+            light.current_time = saved["current_time"]
+            light.state_start_time = saved["state_start_time"]
+        light_manager.scheduler.current_time = meta["sim_time"]
+        light_manager.reschedule()
+
+        saved = meta["arrivals"]
+        arrivals = simulation.arrivals
+        arrivals.lanes = [tuple(lane) for lane in saved["lanes"]]
+        arrivals.rate = saved["rate"]
+        arrivals.profile = [tuple(step) for step in saved["profile"]] if saved["profile"] else None
+        arrivals.horizon = saved["horizon"]
+        # Le tas est sauvegardé tel quel : il reste un tas valide
+        arrivals.queue = [tuple(entry) for entry in saved["queue"]]
+        arrivals.total_arrivals = saved["total_arrivals"]
+        arrivals.rng.setstate(saved["rng_state"])
+
+        simulation.rng.setstate(rng_state)
+        simulation.seed = meta["seed"]
+        simulation.sim_time = meta["sim_time"]
+        simulation.frame_count = meta["frame_count"]
+        simulation.current_light_state = meta["current_light_state"]
+        simulation._pending_removals = []
+        Vehicle._next_id = meta["next_vehicle_id"]
+        simulation.snapshots.clear()
+        simulation.publish_snapshot()
+
+
+if __name__ == "__main__":
+    pass
@@ -94,6 +94,9 @@ VEHICLE_CONFIG = {
     }
 }
 
+# Proportion de camions parmi les véhicules créés
+TRUCK_PROBABILITY = 0.2
+
 # Taux d'apparition (probabilité par frame)
 SPAWN_RATES = {
     "normal": 0.02,
@@ -110,10 +113,14 @@ MAX_VEHICLES = {
     "manual": 15
 }
 
+# Véhicules préalloués par VehicleManager (réutilisés au lieu d'être recréés)
+VEHICLE_POOL_SIZE = max(MAX_VEHICLES.values())
+
 # ==================== SIMULATION ====================
 FPS = 60
 UPDATE_INTERVAL = 16.67  # 1000ms / 60 FPS
 SIMULATION_SPEED = 1.0
+FRAME_TIMING_WINDOW = 600  # Frames conservées pour les percentiles de temps par phase
 
 # ==================== POSITIONS ====================
 # Positions des feux tricolores
@@ -148,10 +155,42 @@ LANE_STARTS = {
     ]
 }
 
+# Géométrie des voies (distances mesurées depuis le départ de la voie)
+DIRECTION_VECTORS = {
+    "north": (0, 1),
+    "south": (0, -1),
+    "east": (1, 0),
+    "west": (-1, 0)
+}
+STOP_LINE_DISTANCE = 400 - INTERSECTION_SIZE / 2  # Ligne d'arrêt avant le carrefour
+LANE_LENGTH = 800                                 # Longueur parcourue avant sortie
+SAFE_DISTANCE = 10                                # Distance minimale entre véhicules
+
 # ==================== BASE DE DONNÉES ====================
 DB_NAME = "traffic_simulation.db"
 EVENTS_TABLE = "simulation_events"
 STATS_TABLE = "statistics"
+SEQUENCE_TABLE = "event_sequence"  # Dernier ID attribué (partagé entre connexions)
+DB_JOURNAL_MODE = "WAL"         # Lectures (interface) sans bloquer l'écriture
+DB_SYNCHRONOUS = "NORMAL"       # En WAL : pas de fsync à chaque transaction
+DB_CACHE_SIZE_KB = 16384        # Cache de pages SQLite par connexion
+DB_STATEMENT_CACHE = 64         # Requêtes préparées conservées par la connexion
+EXPORT_CHUNK_SIZE = 50000       # Lignes lues par fetchmany lors d'un export
+EXPORT_GZIP_LEVEL = 1           # Compression rapide : l'export reste limité par le disque
+
+# Écriture asynchrone des événements (EventLogger)
+LOG_QUEUE_SIZE = 10000          # Événements en attente au plus
+LOG_BATCH_SIZE = 500            # Événements par transaction
+LOG_FLUSH_INTERVAL = 0.5        # Délai max (s) avant l'écriture d'un lot incomplet
+LOG_OVERFLOW_POLICIES = ("block", "drop_oldest", "sample")
+LOG_OVERFLOW_POLICY = "block"
+LOG_SAMPLE_EVERY = 10           # Politique "sample" : 1 événement gardé sur N en saturation
+LOG_SAMPLE_RATES = {}           # Fraction gardée par type d'événement (1.0 si absent)
+
+# Trajectoires : positions journalisées sous forme d'images clés
+LOG_POSITIONS = False           # Journalise la position de chaque véhicule à chaque pas
+POSITION_TOLERANCE = 1.0        # Écart max (px) entre trajectoire reconstruite et réelle
+SPEED_TOLERANCE = 0.05          # Écart max (px/frame) sur la vitesse reconstruite
 
 # ==================== INTERFACE ====================
 BUTTON_COLORS = {
@@ -172,7 +211,9 @@ EVENT_TYPES = [
     "VEHICLE_CREATED",
     "VEHICLE_REMOVED",
     "SCENARIO_CHANGED",
-    "USER_ACTION"
+    "VEHICLE_POSITION",
+    "USER_ACTION",
+    "ERROR"
 ]
 
 # ==================== CHEMINS D'IMPORT ====================
@@ -1,14 +1,135 @@
 """
 Module de gestion de la base de données SQLite
 Responsable : Modou Sarr
+
+Les événements sont répartis dans une table par jour (simulation_events_AAAAMMJJ) ;
+la vue simulation_events les réunit, si bien que les requêtes de lecture
+ignorent le partitionnement. La rétention supprime des partitions entières
+(DROP TABLE) au lieu d'un DELETE ligne à ligne.
+
+Plusieurs processus peuvent écrire dans le même fichier : les IDs sont pris
+dans la table event_sequence au sein de la transaction d'écriture (BEGIN
+IMMEDIATE), et la vue est reconstruite d'après les partitions présentes dans
+sqlite_master, pas seulement celles créées par ce processus.
 """
 
 import sqlite3
 import json
-from datetime import datetime
-from typing import List, Tuple, Dict, Any, Optional
+import csv
+import gzip
+import os
+import tempfile
+import threading
+import zipfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from itertools import groupby
+from typing import List, Tuple, Dict, Any, Optional, Union
 from constants import *
 
+try:
+    import numpy as np
+except ImportError:  # Sans NumPy, pas d'export colonnaire
+    np = None
+
+EVENT_COLUMNS = ["id", "timestamp", "event_type", "action", "etat_feu", "scenario",
+                 "id_voiture", "position_x", "position_y", "vitesse", "sim_time"]
+# Colonnes fournies à l'insertion (id est attribué par le gestionnaire)
+INSERT_COLUMNS = EVENT_COLUMNS[1:]
+# Colonnes ajoutées après coup : ajoutées aux partitions existantes (ALTER TABLE)
+ADDED_COLUMNS = {"sim_time": "REAL"}   # Temps de simulation (trajectoires)
+
+# Partitions : une table par jour, plus l'ancienne table unique après migration
+PARTITION_PREFIX = f"{EVENTS_TABLE}_"
+LEGACY_PARTITION = f"{PARTITION_PREFIX}legacy"
+
+# Index des requêtes filtrées (créés sur chaque partition) : le filtre puis le
+# tri par horodatage sont lus dans l'index, sans parcours de table ni tri
+EVENT_INDEXES = {
+    "type_time": ("event_type", "timestamp"),
+    "scenario_time": ("scenario", "timestamp"),
+    "vehicle_time": ("id_voiture", "timestamp")
+}
+
+# Requêtes au texte constant : la connexion réutilise leur forme préparée
+SELECT_ALL_SQL = f"SELECT * FROM {EVENTS_TABLE} ORDER BY id DESC LIMIT ?"
+SELECT_BY_TYPE_SQL = (f"SELECT * FROM {EVENTS_TABLE} WHERE event_type = ? "
+                      f"ORDER BY timestamp DESC LIMIT ?")
+SELECT_BY_SCENARIO_SQL = (f"SELECT * FROM {EVENTS_TABLE} WHERE scenario = ? "
+                          f"ORDER BY timestamp DESC LIMIT ?")
+SELECT_BY_VEHICLE_SQL = (f"SELECT * FROM {EVENTS_TABLE} WHERE id_voiture = ? "
+                         f"ORDER BY timestamp")
+
+
+# Agrégats maintenus dans STATS_TABLE, par partition : (catégorie, clé) ->
+# nombre, somme, minimum, maximum
+STATS_COUNTED = (
+    ("event_type", "event_type"),   # (catégorie, colonne comptée)
+    ("scenario", "scenario"),
+    ("light_state", "etat_feu")
+)
+_VEHICLE_COLUMN = INSERT_COLUMNS.index("id_voiture")
+_SPEED_COLUMN = INSERT_COLUMNS.index("vitesse")
+_TYPE_COLUMN = INSERT_COLUMNS.index("event_type")
+# Les vitesses des images clés de trajectoire sont agrégées à part (clé
+# "trajectory") : elles fausseraient celles des événements de véhicule ("vehicle")
+TRAJECTORY_EVENT = "VEHICLE_POSITION"
+SPEED_KEY_SQL = f"CASE WHEN event_type = '{TRAJECTORY_EVENT}' THEN 'trajectory' ELSE 'vehicle' END"
+UPSERT_STATS_SQL = (
+    f"INSERT INTO {STATS_TABLE} (partition, category, key, count, total, minimum, maximum) "
+    f"VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (partition, category, key) DO UPDATE SET "
+    f"count = count + excluded.count, total = total + excluded.total, "
+    f"minimum = min(coalesce(minimum, excluded.minimum), coalesce(excluded.minimum, minimum)), "
+    f"maximum = max(coalesce(maximum, excluded.maximum), coalesce(excluded.maximum, maximum))")
+SELECT_STATS_SQL = (f"SELECT category, key, SUM(count), SUM(total), MIN(minimum), MAX(maximum) "
+                    f"FROM {STATS_TABLE} GROUP BY category, key")
+
+
+def batch_statistics(rows: List[Tuple]) -> Dict[Tuple[str, str], List]:
+    """
+    Agrégats d'un lot d'événements (tuples dans l'ordre de INSERT_COLUMNS)
+
+    Returns:
+        Dict: (catégorie, clé) -> [nombre, somme, minimum, maximum]
+    """
+    stats: Dict[Tuple[str, str], List] = {("total", "events"): [len(rows), 0.0, None, None]}
+    speeds: Dict[str, List[float]] = {}
+    counted = [(category, INSERT_COLUMNS.index(column)) for category, column in STATS_COUNTED]
+    for row in rows:
+        for category, index in counted:
+            if row[index] is not None:
+                entry = stats.setdefault((category, row[index]), [0, 0.0, None, None])
+                entry[0] += 1
+        if row[_VEHICLE_COLUMN] is not None and row[_SPEED_COLUMN] is not None:
+            key = "trajectory" if row[_TYPE_COLUMN] == TRAJECTORY_EVENT else "vehicle"
+            speeds.setdefault(key, []).append(row[_SPEED_COLUMN])
+    for key, values in speeds.items():
+        stats[("speed", key)] = [len(values), sum(values), min(values), max(values)]
+    return stats
+
+
+# Export colonnaire : type NumPy de chaque colonne (les textes sont codés par
+# des entiers, avec une table de libellés <colonne>_labels)
+NPZ_NUMERIC = {"id": "int64", "timestamp": "datetime64[us]", "id_voiture": "int64",
+               "position_x": "float64", "position_y": "float64", "vitesse": "float64",
+               "sim_time": "float64"}
+NPZ_CATEGORICAL = ("event_type", "action", "etat_feu", "scenario")
+
+
+def partition_name(timestamp: str) -> str:
+    """
+    Retourne la partition d'un événement d'après son horodatage ISO
+    """
+    return PARTITION_PREFIX + timestamp[:10].replace("-", "")
+
+
+def index_name(partition: str, suffix: str) -> str:
+    """
+    Nom d'un index d'une partition
+    """
+    return f"idx_{partition}_{suffix}"
+
+
 class DatabaseManager:
     """
     Gère la connexion et les opérations sur la base de données
@@ -18,31 +139,140 @@ class DatabaseManager:
         """
         Initialise le gestionnaire de base de données
         """
-        pass
+        self.db_name = db_name
+        self.connection: Optional[sqlite3.Connection] = None
+        # La connexion est partagée entre le thread de simulation et l'interface
+        self.lock = threading.RLock()
+        self.journal_mode: Optional[str] = None
+        # Partitions existantes, de la plus ancienne à la plus récente
+        self.partitions: List[str] = []
     
     def connect(self) -> bool:
         """
         Établit la connexion à la base de données
         """
-        pass
+        try:
+            self.connection = sqlite3.connect(self.db_name, check_same_thread=False,
+                                              cached_statements=DB_STATEMENT_CACHE)
+            self.configure()
+            return self.create_tables()
+        except sqlite3.Error as e:
+            print(f"Erreur de connexion à la base de données: {e}")
+            self.connection = None
+            return False
     
     def disconnect(self) -> None:
         """
         Ferme la connexion à la base de données
         """
-        pass
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+    
+    def configure(self) -> None:
+        """
+        Règle la connexion : journal WAL, synchronisation et cache de pages
+
+        Une base en mémoire garde son journal en mémoire (WAL non applicable).
+        """
+        with self.lock:
+            self.journal_mode = self.connection.execute(
+                f"PRAGMA journal_mode = {DB_JOURNAL_MODE}").fetchone()[0]
+            self.connection.execute(f"PRAGMA synchronous = {DB_SYNCHRONOUS}")
+            self.connection.execute(f"PRAGMA cache_size = -{DB_CACHE_SIZE_KB}")
+            self.connection.execute("PRAGMA temp_store = MEMORY")
     
     def create_tables(self) -> bool:
         """
-        Crée les tables nécessaires si elles n'existent pas
+        Crée la vue des événements et retrouve les partitions existantes
+
+        Une ancienne table simulation_events (non partitionnée) devient la
+        partition simulation_events_legacy ; les colonnes ajoutées depuis
+        (ADDED_COLUMNS) sont créées dans les partitions qui ne les ont pas.
         """
-        pass
+        try:
+            with self.lock:
+                legacy = self.connection.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                    (EVENTS_TABLE,)).fetchone()
+                if legacy:
+                    self.connection.execute(
+                        f"ALTER TABLE {EVENTS_TABLE} RENAME TO {LEGACY_PARTITION}")
+                    for suffix in EVENT_INDEXES:
+                        self.connection.execute(
+                            f"DROP INDEX IF EXISTS {index_name(EVENTS_TABLE, suffix)}")
+
+                self._load_partitions()
+                for partition in self.partitions:
+                    columns = {row[1] for row in self.connection.execute(
+                        f"PRAGMA table_info({partition})")}
+                    for column, sql_type in ADDED_COLUMNS.items():
+                        if column not in columns:
+                            self.connection.execute(
+                                f"ALTER TABLE {partition} ADD COLUMN {column} {sql_type}")
+                    self._create_indexes(partition)
+                self._create_view()
+                stats_missing = not self.connection.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                    (STATS_TABLE,)).fetchone()
+                self.connection.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {STATS_TABLE} (
+                        partition TEXT NOT NULL,
+                        category TEXT NOT NULL,
+                        key TEXT NOT NULL,
+                        count INTEGER NOT NULL,
+                        total REAL NOT NULL,
+                        minimum REAL,
+                        maximum REAL,
+                        PRIMARY KEY (partition, category, key)
+                    )
+                """)
+                self.connection.commit()
+                # Base créée avant les agrégats : ils sont calculés une fois
+                if stats_missing and self.partitions:
+                    self.rebuild_statistics()
+                elif legacy:
+                    with self.connection:
+                        self.connection.execute(f"DELETE FROM {STATS_TABLE} WHERE partition = ?",
+                                                (LEGACY_PARTITION,))
+                        self._rebuild_partition_statistics(LEGACY_PARTITION)
+
+                # Séquence des IDs, jamais en dessous du plus grand ID existant
+                # (base antérieure à la séquence, ancienne table reprise)
+                last_id = max((self.connection.execute(f"SELECT MAX(id) FROM {partition}")
+                               .fetchone()[0] or 0 for partition in self.partitions), default=0)
+                self.connection.execute(f"CREATE TABLE IF NOT EXISTS {SEQUENCE_TABLE} ("
+                                        f"id INTEGER PRIMARY KEY CHECK (id = 0), "
+                                        f"last_id INTEGER NOT NULL)")
+                self.connection.execute(f"INSERT OR IGNORE INTO {SEQUENCE_TABLE} (id, last_id) "
+                                        f"VALUES (0, 0)")
+                self.connection.execute(f"UPDATE {SEQUENCE_TABLE} SET last_id = max(last_id, ?)",
+                                        (last_id,))
+                self.connection.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"Erreur lors de la création des tables: {e}")
+            return False
     
     def reset_database(self) -> bool:
         """
-        Réinitialise complètement la base de données
+        Réinitialise complètement la base de données (suppression des partitions)
         """
-        pass
+        try:
+            with self.lock:
+                self._load_partitions()
+                self.connection.execute(f"DROP VIEW IF EXISTS {EVENTS_TABLE}")
+                for partition in self.partitions:
+                    self.connection.execute(f"DROP TABLE IF EXISTS {partition}")
+                self.connection.execute(f"DROP TABLE IF EXISTS {STATS_TABLE}")
+                self.connection.execute(f"DROP TABLE IF EXISTS {SEQUENCE_TABLE}")
+                self.connection.commit()
+                self.partitions = []
+            return self.create_tables()
+        except sqlite3.Error as e:
+            print(f"Erreur lors de la réinitialisation: {e}")
+            return False
     
     def insert_event(self, event_type: str, action: str, 
                     etat_feu: Optional[str] = None,
@@ -50,53 +280,421 @@ class DatabaseManager:
                     id_voiture: Optional[int] = None,
                     position_x: Optional[float] = None,
                     position_y: Optional[float] = None,
-                    vitesse: Optional[float] = None) -> int:
+                    vitesse: Optional[float] = None,
+                    sim_time: Optional[float] = None) -> int:
         """
         Insère un événement dans la base de données
+
+        Returns:
+            int: ID de l'événement inséré (-1 en cas d'erreur)
+        """
+        try:
+            return self._insert_rows([(datetime.now().isoformat(), event_type, action,
+                                       etat_feu, scenario, id_voiture, position_x,
+                                       position_y, vitesse, sim_time)])
+        except sqlite3.Error as e:
+            print(f"Erreur lors de l'insertion: {e}")
+            return -1
+    
+    def insert_events(self, rows: List[Tuple]) -> int:
+        """
+        Insère un lot d'événements dans une seule transaction
+
+        Args:
+            rows: Tuples dans l'ordre de INSERT_COLUMNS (horodatage compris)
+
+        Returns:
+            int: Nombre d'événements insérés (0 en cas d'erreur, le lot est annulé)
         """
-        pass
+        if not rows:
+            return 0
+        try:
+            self._insert_rows(rows)
+            return len(rows)
+        except sqlite3.Error as e:
+            print(f"Erreur lors de l'insertion du lot: {e}")
+            return 0
+    
+    def _insert_rows(self, rows: List[Tuple]) -> int:
+        """
+        Insère des événements dans leurs partitions, en une transaction
+
+        BEGIN IMMEDIATE réserve l'écriture avant de lire la séquence : deux
+        connexions au même fichier ne peuvent pas attribuer les mêmes IDs.
+
+        Returns:
+            int: ID du premier événement inséré
+        """
+        with self.lock:
+            connection = self.connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for partition in sorted({partition_name(row[0]) for row in rows}):
+                    if partition not in self.partitions:
+                        self._add_partition(partition)
+                connection.execute(f"UPDATE {SEQUENCE_TABLE} SET last_id = last_id + ?",
+                                   (len(rows),))
+                first_id = connection.execute(
+                    f"SELECT last_id FROM {SEQUENCE_TABLE}").fetchone()[0] - len(rows) + 1
+                with connection:
+                    event_id = first_id
+                    for partition, group in groupby(rows, key=lambda row: partition_name(row[0])):
+                        group = list(group)
+                        self.connection.executemany(
+                            f"INSERT INTO {partition} ({', '.join(EVENT_COLUMNS)}) "
+                            f"VALUES ({', '.join('?' * len(EVENT_COLUMNS))})",
+                            [(event_id + offset,) + row for offset, row in enumerate(group)])
+                        # Agrégats mis à jour dans la même transaction que les événements
+                        self.connection.executemany(
+                            UPSERT_STATS_SQL,
+                            [(partition, category, key, *values)
+                             for (category, key), values in batch_statistics(group).items()])
+                        event_id += len(group)
+            except Exception:
+                if connection.in_transaction:
+                    connection.rollback()
+                # Une partition créée dans la transaction annulée n'existe plus
+                self._load_partitions()
+                raise
+            return first_id
+    
+    def _add_partition(self, partition: str) -> None:
+        """
+        Crée une partition journalière (si une autre connexion ne l'a pas
+        déjà fait) et l'ajoute à la vue, dans la transaction en cours
+        """
+        self.connection.execute(f"""
+            CREATE TABLE IF NOT EXISTS {partition} (
+                id INTEGER PRIMARY KEY,
+                timestamp TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                action TEXT NOT NULL,
+                etat_feu TEXT,
+                scenario TEXT,
+                id_voiture INTEGER,
+                position_x REAL,
+                position_y REAL,
+                vitesse REAL,
+                sim_time REAL
+            )
+        """)
+        self._create_indexes(partition)
+        self._create_view()
+    
+    def _create_indexes(self, partition: str) -> None:
+        """
+        Crée les index des requêtes filtrées sur une partition
+        """
+        for suffix, columns in EVENT_INDEXES.items():
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS {index_name(partition, suffix)} "
+                                    f"ON {partition} ({', '.join(columns)})")
+    
+    def _load_partitions(self) -> None:
+        """
+        Relit les partitions présentes dans la base (y compris celles créées
+        par d'autres connexions)
+        """
+        names = [row[0] for row in self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB ?",
+            (PARTITION_PREFIX + "*",))]
+        # L'ancienne table précède toutes les partitions journalières
+        self.partitions = sorted(names, key=lambda name: (name != LEGACY_PARTITION, name))
+
+    def _create_view(self) -> None:
+        """
+        (Re)crée la vue réunissant toutes les partitions de la base
+        """
+        self._load_partitions()
+        if self.partitions:
+            body = " UNION ALL ".join(f"SELECT * FROM {partition}" for partition in self.partitions)
+        else:
+            body = "SELECT " + ", ".join(f"NULL AS {column}" for column in EVENT_COLUMNS) + " WHERE 0"
+        self.connection.execute(f"DROP VIEW IF EXISTS {EVENTS_TABLE}")
+        self.connection.execute(f"CREATE VIEW {EVENTS_TABLE} AS {body}")
     
     def get_all_events(self, limit: int = 100) -> List[Tuple]:
         """
         Récupère tous les événements
         """
-        pass
+        return self._fetch(SELECT_ALL_SQL, (limit,))
     
     def get_events_by_type(self, event_type: str, limit: int = 50) -> List[Tuple]:
         """
         Récupère les événements par type
         """
-        pass
+        return self._fetch(SELECT_BY_TYPE_SQL, (event_type, limit))
     
     def get_events_by_scenario(self, scenario: str, limit: int = 50) -> List[Tuple]:
         """
         Récupère les événements par scénario
         """
-        pass
+        return self._fetch(SELECT_BY_SCENARIO_SQL, (scenario, limit))
     
     def get_vehicle_events(self, vehicle_id: int) -> List[Tuple]:
         """
         Récupère les événements d'un véhicule spécifique
         """
-        pass
+        return self._fetch(SELECT_BY_VEHICLE_SQL, (vehicle_id,))
     
     def get_statistics(self) -> Dict[str, Any]:
         """
-        Calcule des statistiques sur les données
+        Retourne les statistiques des événements, lues dans les agrégats
+
+        Le coût dépend du nombre de partitions et de valeurs distinctes, pas
+        du nombre d'événements. total_vehicles compte les véhicules créés,
+        vehicles_exited ceux sortis de la scène. Les vitesses sont celles des
+        événements de véhicule, sans les images clés de trajectoire.
+
+        Les comptes portent sur les événements enregistrés : pour un type
+        échantillonné par le logger (LOG_SAMPLE_RATES), ils sont réduits
+        dans la même proportion.
+        """
+        stats: Dict[str, Any] = {"total_events": 0, "events_by_type": {},
+                                 "events_by_scenario": {}, "events_by_light_state": {}}
+        by_category = {"event_type": stats["events_by_type"],
+                       "scenario": stats["events_by_scenario"],
+                       "light_state": stats["events_by_light_state"]}
+        speed = (0, 0.0, None, None)
+        try:
+            for category, key, count, total, minimum, maximum in self._fetch(SELECT_STATS_SQL):
+                if category == "total":
+                    stats["total_events"] = count
+                elif category == "speed":
+                    if key == "vehicle":
+                        speed = (count, total, minimum, maximum)
+                elif count:
+                    by_category[category][key] = count
+        except sqlite3.Error as e:
+            print(f"Erreur lors du calcul des statistiques: {e}")
+        stats["total_vehicles"] = stats["events_by_type"].get("VEHICLE_CREATED", 0)
+        stats["vehicles_exited"] = stats["events_by_type"].get("VEHICLE_REMOVED", 0)
+        count, total, minimum, maximum = speed
+        stats["average_speed"] = total / count if count else 0.0
+        stats["min_speed"] = minimum or 0.0
+        stats["max_speed"] = maximum or 0.0
+        return stats
+    
+    def rebuild_statistics(self) -> bool:
+        """
+        Recalcule les agrégats à partir des événements (réconciliation)
+        """
+        try:
+            with self.lock:
+                with self.connection:
+                    self.connection.execute(f"DELETE FROM {STATS_TABLE}")
+                    for partition in self.partitions:
+                        self._rebuild_partition_statistics(partition)
+            return True
+        except sqlite3.Error as e:
+            print(f"Erreur lors du recalcul des statistiques: {e}")
+            return False
+    
+    def _rebuild_partition_statistics(self, partition: str) -> None:
+        """
+        Calcule les agrégats d'une partition par des requêtes GROUP BY
         """
-        pass
+        insert = (f"INSERT INTO {STATS_TABLE} "
+                  f"(partition, category, key, count, total, minimum, maximum) ")
+        self.connection.execute(insert + f"SELECT ?, 'total', 'events', COUNT(*), 0.0, NULL, NULL "
+                                         f"FROM {partition}", (partition,))
+        for category, column in STATS_COUNTED:
+            self.connection.execute(insert + f"SELECT ?, ?, {column}, COUNT(*), 0.0, NULL, NULL "
+                                             f"FROM {partition} WHERE {column} IS NOT NULL "
+                                             f"GROUP BY {column}", (partition, category))
+        self.connection.execute(insert + f"SELECT ?, 'speed', {SPEED_KEY_SQL} AS speed_key, "
+                                         f"COUNT(vitesse), SUM(vitesse), MIN(vitesse), "
+                                         f"MAX(vitesse) FROM {partition} "
+                                         f"WHERE id_voiture IS NOT NULL AND vitesse IS NOT NULL "
+                                         f"GROUP BY speed_key", (partition,))
     
     def clear_old_events(self, days_old: int = 30) -> int:
         """
-        Supprime les événements trop anciens
+        Supprime les partitions plus anciennes que days_old jours
+
+        La rétention est arrondie au jour : la partition du jour limite est
+        conservée. Chaque partition est supprimée dans sa propre transaction,
+        si bien que l'écriture des événements n'attend jamais plus d'un DROP.
+
+        Returns:
+            int: Nombre d'événements supprimés
+        """
+        cutoff = datetime.now() - timedelta(days=days_old)
+        cutoff_partition = partition_name(cutoff.isoformat())
+        removed = 0
+        try:
+            with self.lock:
+                self._load_partitions()
+            for partition in list(self.partitions):
+                with self.lock:
+                    if partition not in self.partitions:
+                        continue
+                    if partition == LEGACY_PARTITION:
+                        newest = self.connection.execute(
+                            f"SELECT MAX(timestamp) FROM {partition}").fetchone()[0]
+                        if newest is not None and newest >= cutoff.isoformat():
+                            continue
+                    elif partition >= cutoff_partition:
+                        continue
+                    count = self.connection.execute(
+                        f"SELECT count FROM {STATS_TABLE} WHERE partition = ? "
+                        f"AND category = 'total'", (partition,)).fetchone()
+                    # Agrégats, vue et partition supprimés dans une même transaction
+                    self.connection.execute(f"DELETE FROM {STATS_TABLE} WHERE partition = ?",
+                                            (partition,))
+                    self.connection.execute(f"DROP TABLE {partition}")
+                    self._create_view()
+                    self.connection.commit()
+                    removed += count[0] if count else 0
+            return removed
+        except sqlite3.Error as e:
+            print(f"Erreur lors de la suppression: {e}")
+            return removed
+    
+    def export_to_csv(self, filename: str, start: Union[datetime, str, None] = None,
+                      end: Union[datetime, str, None] = None,
+                      scenario: Optional[str] = None, event_type: Optional[str] = None,
+                      compress: Optional[bool] = None,
+                      chunk_size: int = EXPORT_CHUNK_SIZE) -> bool:
+        """
+        Exporte les données en CSV, par blocs (mémoire bornée)
+
+        Args:
+            start, end: Bornes de l'horodatage (début incluse, fin exclue)
+            scenario, event_type: Filtres optionnels
+            compress: Compresse en gzip (par défaut si filename finit par .gz)
+            chunk_size: Lignes lues à la fois
+        """
+        if compress is None:
+            compress = filename.endswith(".gz")
+        where, params = self._export_filter(start, end, scenario, event_type)
+        query = f"SELECT * FROM {EVENTS_TABLE}{where} ORDER BY id"
+        try:
+            if compress:
+                f = gzip.open(filename, "wt", newline="", encoding="utf-8",
+                              compresslevel=EXPORT_GZIP_LEVEL)
+            else:
+                f = open(filename, "w", newline="", encoding="utf-8")
+            with f, self._reader() as connection:
+                writer = csv.writer(f)
+                writer.writerow(EVENT_COLUMNS)
+                cursor = connection.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    writer.writerows(rows)
+            return True
+        except (sqlite3.Error, OSError) as e:
+            print(f"Erreur lors de l'export CSV: {e}")
+            return False
+    
+    def export_to_npz(self, filename: str, start: Union[datetime, str, None] = None,
+                      end: Union[datetime, str, None] = None,
+                      scenario: Optional[str] = None, event_type: Optional[str] = None,
+                      chunk_size: int = EXPORT_CHUNK_SIZE) -> bool:
+        """
+        Exporte les données en colonnes NumPy (.npz), pour l'analyse de trajectoires
+
+        Chaque colonne est un tableau : les valeurs absentes valent NaN
+        (réels) ou -1 (entiers), les textes sont des codes entiers dont les
+        libellés sont dans <colonne>_labels. Les colonnes sont d'abord écrites
+        par blocs dans des fichiers .npy temporaires : la mémoire reste bornée.
+        Mêmes filtres que export_to_csv.
+        """
+        if np is None:
+            print("Erreur lors de l'export NPZ: NumPy n'est pas installé")
+            return False
+        where, params = self._export_filter(start, end, scenario, event_type)
+        query = f"SELECT * FROM {EVENTS_TABLE}{where} ORDER BY id"
+        count_query = f"SELECT COUNT(*) FROM {EVENTS_TABLE}{where}"
+        try:
+            with self._reader() as connection, \
+                    tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(filename))) as tmp:
+                # Même transaction de lecture : le nombre de lignes correspond à l'export
+                count = connection.execute(count_query, params).fetchone()[0]
+                dtypes = {column: np.dtype(NPZ_NUMERIC.get(column, "int32"))
+                          for column in EVENT_COLUMNS}
+                labels: Dict[str, Dict[str, int]] = {column: {} for column in NPZ_CATEGORICAL}
+                files = {}
+                for column in EVENT_COLUMNS:
+                    files[column] = open(os.path.join(tmp, f"{column}.npy"), "wb")
+                    np.lib.format.write_array_header_2_0(
+                        files[column], {"descr": np.lib.format.dtype_to_descr(dtypes[column]),
+                                        "fortran_order": False, "shape": (count,)})
+                try:
+                    cursor = connection.execute(query, params)
+                    while True:
+                        rows = cursor.fetchmany(chunk_size)
+                        if not rows:
+                            break
+                        for column, values in zip(EVENT_COLUMNS, zip(*rows)):
+                            if column in labels:
+                                codes = labels[column]
+                                values = [-1 if value is None else codes.setdefault(value, len(codes))
+                                          for value in values]
+                            elif dtypes[column].kind == "i":
+                                values = [-1 if value is None else value for value in values]
+                            files[column].write(np.asarray(values, dtype=dtypes[column]).tobytes())
+                finally:
+                    for f in files.values():
+                        f.close()
+
+                with zipfile.ZipFile(filename, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+                    for column in EVENT_COLUMNS:
+                        archive.write(os.path.join(tmp, f"{column}.npy"), f"{column}.npy")
+                    for column, codes in labels.items():
+                        with archive.open(f"{column}_labels.npy", "w") as f:
+                            np.save(f, np.array(sorted(codes, key=codes.get), dtype=str))
+            return True
+        except (sqlite3.Error, OSError, ValueError) as e:
+            print(f"Erreur lors de l'export NPZ: {e}")
+            return False
+    
+    def _export_filter(self, start: Union[datetime, str, None], end: Union[datetime, str, None],
+                       scenario: Optional[str], event_type: Optional[str]) -> Tuple[str, Tuple]:
+        """
+        Clause WHERE (éventuellement vide) et paramètres des filtres d'export
+        """
+        conditions, params = [], []
+        for condition, value in (("timestamp >= ?", start), ("timestamp < ?", end),
+                                 ("scenario = ?", scenario), ("event_type = ?", event_type)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value.isoformat() if isinstance(value, datetime) else value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, tuple(params)
+    
+    @contextmanager
+    def _reader(self):
+        """
+        Connexion de lecture pour les exports
+
+        Une base sur disque est lue par une connexion dédiée, dans une
+        transaction (instantané cohérent) : en WAL, la journalisation continue
+        pendant l'export. Une base en mémoire est lue sous le verrou.
         """
-        pass
+        if self.db_name == ":memory:":
+            with self.lock:
+                yield self.connection
+            return
+        connection = sqlite3.connect(self.db_name)
+        try:
+            connection.execute("BEGIN")
+            yield connection
+        finally:
+            connection.rollback()
+            connection.close()
     
-    def export_to_csv(self, filename: str) -> bool:
+    def _fetch(self, query: str, params: Tuple = ()) -> List[Tuple]:
         """
-        Exporte les données en CSV
+        Exécute une requête de lecture et retourne toutes les lignes
         """
-        pass
+        try:
+            with self.lock:
+                return self.connection.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            print(f"Erreur lors de la lecture: {e}")
+            return []
 
 
 if __name__ == "__main__":
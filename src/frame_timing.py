@@ -0,0 +1,139 @@
+"""
+Mesure du temps passé dans chaque phase d'une frame
+Responsable : Ndeye Khady Syll
+
+Chaque phase garde ses dernières durées dans une fenêtre glissante ; les
+percentiles ne sont calculés qu'à la demande (get_statistics, overlay). Une
+mesure coûte deux appels à time.perf_counter et un ajout dans un deque : on
+peut la laisser active en production.
+"""
+
+import math
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+from constants import *
+
+# Phases mesurées : thread de simulation puis thread d'affichage
+FRAME_PHASES = (
+    "update",    # _update_components (feux et véhicules)
+    "spawn",     # _handle_vehicle_spawning
+    "removal",   # _handle_vehicle_removal
+    "publish",   # copie de l'état dans un instantané pour l'affichage
+    "log",       # temps passé dans le logger (inclus dans les phases qui journalisent)
+    "step",      # frame complète de simulation
+    "render",    # dessin de la scène (thread Tk)
+    "gui"        # mise à jour des étiquettes de l'interface (thread Tk)
+)
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """
+    Percentile (rang le plus proche) d'une liste déjà triée
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class RollingTimer:
+    """
+    Dernières durées mesurées d'une phase
+    """
+
+    __slots__ = ("samples", "count")
+
+    def __init__(self, window: int = FRAME_TIMING_WINDOW):
+        """
+        Initialise la fenêtre glissante
+
+        Args:
+            window: Nombre de mesures conservées
+        """
+        self.samples = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        """
+        Ajoute une mesure (en secondes)
+        """
+        self.samples.append(seconds)
+        self.count += 1
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Retourne les percentiles de la fenêtre en millisecondes
+        """
+        values = sorted(self.samples)
+        stats = {"count": self.count}
+        for p in PERCENTILES:
+            stats[f"p{p}_ms"] = percentile(values, p) * 1000.0
+        stats["max_ms"] = values[-1] * 1000.0 if values else 0.0
+        return stats
+
+
+class FrameProfiler:
+    """
+    Temps par phase des frames de simulation et d'affichage
+    """
+
+    def __init__(self, window: int = FRAME_TIMING_WINDOW, budget: float = 1.0 / FPS,
+                 phases: Iterable[str] = FRAME_PHASES):
+        """
+        Initialise le profileur
+
+        Args:
+            window: Nombre de frames conservées par phase
+            budget: Durée (secondes) au-delà de laquelle une frame est en retard
+        """
+        self.window = window
+        self.budget = budget
+        self.enabled = True
+        self.timers = {phase: RollingTimer(window) for phase in phases}
+        self.frames_over_budget = 0
+
+    def record(self, phase: str, seconds: float) -> None:
+        """
+        Enregistre la durée d'une phase
+        """
+        self.timers[phase].record(seconds)
+
+    def record_frame(self, seconds: float) -> None:
+        """
+        Enregistre la durée d'une frame de simulation complète
+        """
+        self.timers["step"].record(seconds)
+        if seconds > self.budget:
+            self.frames_over_budget += 1
+
+    def reset(self) -> None:
+        """
+        Oublie toutes les mesures
+        """
+        self.timers = {phase: RollingTimer(self.window) for phase in self.timers}
+        self.frames_over_budget = 0
+
+    def get_statistics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Retourne p50/p95/p99/max (ms) et le nombre de mesures de chaque phase
+        """
+        return {phase: timer.summary() for phase, timer in self.timers.items()}
+
+    def format_overlay(self, stats: Optional[Dict[str, Dict[str, float]]] = None) -> str:
+        """
+        Texte de l'overlay : une ligne par phase mesurée
+        """
+        stats = stats or self.get_statistics()
+        lines = [f"{'phase':<8}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for phase, summary in stats.items():
+            if summary["count"]:
+                lines.append(f"{phase:<8}{summary['p50_ms']:>7.2f}"
+                             f"{summary['p95_ms']:>7.2f}{summary['p99_ms']:>7.2f}")
+        lines.append(f"en retard: {self.frames_over_budget}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    pass
@@ -3,154 +3,372 @@ Module d'interface graphique utilisateur
 Responsable : Modou Sarr
 """
 
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict
 from constants import *
+from road_scene import SceneRenderer, create_scene
+from snapshot import interpolation_alpha
+
+# Scénarios proposés dans le sélecteur
+SCENARIO_CHOICES = ["normal", "rush_hour", "night", "manual"]
+
+# Frames d'affichage entre deux rafraîchissements de l'overlay des temps
+OVERLAY_REFRESH_FRAMES = 30
+
+# Tag de l'overlay des temps par phase sur le canvas
+OVERLAY_TAG = "timing_overlay"
+
+# Libellé affiché pour chaque état de feu
+LIGHT_STATE_LABELS = {
+    "ROUGE": ("Rouge", RED),
+    "ORANGE": ("Orange", ORANGE),
+    "VERT": ("Vert", GREEN),
+    "ORANGE_CLIGNOTANT": ("Orange clignotant", ORANGE)
+}
+
 
 class ControlInterface:
     """
     Interface de contrôle de la simulation
+
+    L'affichage tourne dans la boucle Tk (thread principal) : à chaque frame,
+    il lit les deux derniers instantanés publiés par la simulation et dessine
+    une position interpolée. Un dessin lent saute des frames d'affichage mais
+    ne ralentit jamais la simulation.
     """
-    
-    def __init__(self, simulation):
+
+    def __init__(self, simulation, renderer: str = "turtle", show_timings: bool = False):
         """
         Initialise l'interface
-        """
-        pass
-    
+
+        Args:
+            renderer: Backend d'affichage de la scène ("turtle" ou "canvas")
+            show_timings: Affiche dès le départ l'overlay des temps par phase
+        """
+        self.simulation = simulation
+        self.renderer = renderer
+        self.show_timings = show_timings
+        self.show_timings_var: Optional[tk.BooleanVar] = None
+        self._overlay_item: Optional[int] = None
+        self._frames_since_overlay = 0
+        self.root: Optional[tk.Tk] = None
+        self.canvas: Optional[tk.Canvas] = None
+        self.scene: Optional[SceneRenderer] = None
+        self.control_frame: Optional[tk.Frame] = None
+        self.scenario_var: Optional[tk.StringVar] = None
+        self.status_var: Optional[tk.StringVar] = None
+        self.vehicle_count_var: Optional[tk.StringVar] = None
+        self.light_state_var: Optional[tk.StringVar] = None
+        self.scenario_status_var: Optional[tk.StringVar] = None
+        self.status_label: Optional[tk.Label] = None
+        self.light_state_label: Optional[tk.Label] = None
+        self._render_job: Optional[str] = None
+        self._last_rendered = None
+        self._last_alpha = None
+        self._label_texts: Dict[str, str] = {}
+        self.label_updates = 0
+
     def setup(self) -> bool:
         """
         Configure l'interface
         """
-        pass
-    
+        try:
+            self._create_main_window()
+            self._create_menu_bar()
+            self._create_control_panel()
+
+            self.scene = create_scene(self.renderer, self.canvas)
+            if not self.scene.setup():
+                return False
+            self._render_job = self.root.after(int(UPDATE_INTERVAL), self._render_frame)
+            return True
+        except tk.TclError as e:
+            print(f"Erreur lors de la création de l'interface: {e}")
+            return False
+
     def run(self) -> None:
         """
         Lance l'interface
         """
-        pass
-    
+        if self.root is not None:
+            self.root.mainloop()
+
     def close(self) -> None:
         """
         Ferme l'interface
         """
-        pass
-    
+        if self.root is None:
+            return
+        self.simulation.stop()
+        if self._render_job is not None:
+            self.root.after_cancel(self._render_job)
+            self._render_job = None
+        if self.scene:
+            self.scene.close()
+        try:
+            self.root.destroy()
+        except tk.TclError:
+            pass
+        self.root = None
+
     def _create_main_window(self) -> None:
         """
         Crée la fenêtre principale
         """
-        pass
-    
+        self.root = tk.Tk()
+        self.root.title(f"Simulation feu tricolore - Ville de Thiès (v{VERSION})")
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        self.root.resizable(False, False)
+
+        self.canvas = tk.Canvas(self.root, width=SCREEN_WIDTH, height=SCREEN_HEIGHT,
+                                highlightthickness=0)
+        self.canvas.pack(side=tk.LEFT)
+
     def _create_control_panel(self) -> None:
         """
         Crée le panneau de contrôle
         """
-        pass
-    
+        self.control_frame = tk.Frame(self.root, padx=10, pady=10)
+        self.control_frame.pack(side=tk.RIGHT, fill=tk.Y)
+        self._create_simulation_buttons()
+        self._create_scenario_selector()
+        self._create_traffic_light_controls()
+        self._create_status_panel()
+
     def _create_simulation_buttons(self) -> None:
         """
         Crée les boutons de simulation
         """
-        pass
-    
+        frame = tk.LabelFrame(self.control_frame, text="Simulation", padx=5, pady=5)
+        frame.pack(fill=tk.X, pady=5)
+        for text, key, command in (("Démarrer", "start", self._on_start_clicked),
+                                   ("Pause", "pause", self._on_pause_clicked),
+                                   ("Arrêter", "stop", self._on_stop_clicked),
+                                   ("Réinitialiser", "reset", self._on_reset_clicked)):
+            tk.Button(frame, text=text, command=command, bg=BUTTON_COLORS[key],
+                      fg="white", width=14).pack(pady=2)
+
     def _create_scenario_selector(self) -> None:
         """
         Crée le sélecteur de scénario
         """
-        pass
-    
+        frame = tk.LabelFrame(self.control_frame, text="Scénario", padx=5, pady=5)
+        frame.pack(fill=tk.X, pady=5)
+        self.scenario_var = tk.StringVar(
+            value=self.simulation.scenario_manager.get_current_scenario_name())
+        selector = ttk.Combobox(frame, textvariable=self.scenario_var,
+                                values=SCENARIO_CHOICES, state="readonly", width=14)
+        selector.bind("<<ComboboxSelected>>", self._on_scenario_changed)
+        selector.pack(pady=2)
+
     def _create_traffic_light_controls(self) -> None:
         """
         Crée les contrôles manuels des feux
         """
-        pass
-    
+        frame = tk.LabelFrame(self.control_frame, text="Feux (manuel)", padx=5, pady=5)
+        frame.pack(fill=tk.X, pady=5)
+        for text, color, command in (("Rouge", RED, self._on_red_light_clicked),
+                                     ("Orange", ORANGE, self._on_orange_light_clicked),
+                                     ("Vert", GREEN, self._on_green_light_clicked)):
+            tk.Button(frame, text=text, command=command, bg=color, width=14).pack(pady=2)
+
     def _create_status_panel(self) -> None:
         """
         Crée le panneau d'état
         """
-        pass
-    
+        frame = tk.LabelFrame(self.control_frame, text="État", padx=5, pady=5)
+        frame.pack(fill=tk.X, pady=5)
+        self.status_var = tk.StringVar(value="Arrêtée")
+        self.vehicle_count_var = tk.StringVar(value="Véhicules : 0")
+        self.light_state_var = tk.StringVar(value="Feu : -")
+        self.scenario_status_var = tk.StringVar(value="Scénario : -")
+
+        self.status_label = tk.Label(frame, textvariable=self.status_var, anchor="w")
+        self.status_label.pack(fill=tk.X)
+        tk.Label(frame, textvariable=self.vehicle_count_var, anchor="w").pack(fill=tk.X)
+        self.light_state_label = tk.Label(frame, textvariable=self.light_state_var, anchor="w")
+        self.light_state_label.pack(fill=tk.X)
+        tk.Label(frame, textvariable=self.scenario_status_var, anchor="w").pack(fill=tk.X)
+
     def _create_menu_bar(self) -> None:
         """
         Crée la barre de menu
         """
-        pass
-    
+        menu_bar = tk.Menu(self.root)
+        file_menu = tk.Menu(menu_bar, tearoff=0)
+        file_menu.add_command(label="Quitter", command=self.close)
+        menu_bar.add_cascade(label="Fichier", menu=file_menu)
+
+        view_menu = tk.Menu(menu_bar, tearoff=0)
+        self.show_timings_var = tk.BooleanVar(value=self.show_timings)
+        view_menu.add_checkbutton(label="Temps par phase", variable=self.show_timings_var,
+                                  command=self._on_timings_toggled)
+        menu_bar.add_cascade(label="Affichage", menu=view_menu)
+
+        help_menu = tk.Menu(menu_bar, tearoff=0)
+        help_menu.add_command(label="À propos", command=lambda: messagebox.showinfo(
+            "À propos", f"Simulation feu tricolore\nVersion {VERSION} - {YEAR}\n{AUTHOR}"))
+        menu_bar.add_cascade(label="Aide", menu=help_menu)
+        self.root.config(menu=menu_bar)
+
+    def _render_frame(self) -> None:
+        """
+        Dessine le dernier instantané de la simulation et planifie la frame suivante
+        """
+        clock = time.perf_counter
+        profiler = self.simulation.frame_profiler
+        start = clock()
+        previous, current = self.simulation.snapshots.read()
+        if current is not None:
+            alpha = interpolation_alpha(previous, current, start)
+            # Rien n'a bougé depuis la dernière frame (pause, arrêt)
+            if current is not self._last_rendered or alpha != self._last_alpha:
+                self.scene.render(previous, current, alpha)
+                rendered = clock()
+                self._last_rendered, self._last_alpha = current, alpha
+                self.update_vehicle_count(len(current.vehicles))
+                self.update_traffic_light_status(current.light_state)
+                self.update_scenario_status(current.scenario)
+                if profiler.enabled:
+                    profiler.record("render", rendered - start)
+                    profiler.record("gui", clock() - rendered)
+
+        if self.show_timings:
+            self._frames_since_overlay += 1
+            if self._frames_since_overlay >= OVERLAY_REFRESH_FRAMES:
+                self._update_timing_overlay()
+
+        # Cadence visée : UPDATE_INTERVAL ; une frame trop lente décale simplement la suivante
+        elapsed = (time.perf_counter() - start) * 1000.0
+        if self.root is not None:
+            self._render_job = self.root.after(max(1, int(UPDATE_INTERVAL - elapsed)),
+                                               self._render_frame)
+
+    def _on_timings_toggled(self) -> None:
+        """
+        Affiche ou masque l'overlay des temps par phase
+        """
+        self.show_timings = self.show_timings_var.get()
+        if self.show_timings:
+            self._update_timing_overlay()
+        elif self._overlay_item is not None:
+            self.canvas.delete(OVERLAY_TAG)
+            self._overlay_item = None
+
+    def _update_timing_overlay(self) -> None:
+        """
+        Réécrit l'overlay des temps par phase (coin supérieur gauche du canvas)
+        """
+        self._frames_since_overlay = 0
+        text = self.simulation.frame_profiler.format_overlay()
+        if self._overlay_item is None:
+            self._overlay_item = self.canvas.create_text(
+                -SCREEN_WIDTH // 2 + 10, -SCREEN_HEIGHT // 2 + 10, text=text, anchor="nw",
+                font=("Courier", 9), fill="black", tags=OVERLAY_TAG)
+        else:
+            self.canvas.itemconfig(self._overlay_item, text=text)
+            self.canvas.tag_raise(OVERLAY_TAG)
+
     def _on_start_clicked(self) -> None:
         """
         Gère le clic sur le bouton Démarrer
         """
-        pass
-    
+        if self.simulation.start():
+            self.update_status("En cours", BUTTON_COLORS["start"])
+
     def _on_pause_clicked(self) -> None:
         """
         Gère le clic sur le bouton Pause
         """
-        pass
-    
+        if self.simulation.is_running():
+            self.simulation.pause()
+            self.update_status("En pause", BUTTON_COLORS["pause"])
+
     def _on_stop_clicked(self) -> None:
         """
         Gère le clic sur le bouton Arrêter
         """
-        pass
-    
+        self.simulation.stop()
+        self.update_status("Arrêtée", BUTTON_COLORS["stop"])
+
     def _on_reset_clicked(self) -> None:
         """
         Gère le clic sur le bouton Réinitialiser
         """
-        pass
-    
+        self.simulation.reset()
+        self.scene.reset()
+        self._last_rendered = None
+        self.update_status("Réinitialisée", BUTTON_COLORS["reset"])
+
     def _on_scenario_changed(self, event=None) -> None:
         """
         Gère le changement de scénario
         """
-        pass
-    
+        scenario_name = self.scenario_var.get()
+        if not self.simulation.change_scenario(scenario_name):
+            messagebox.showerror("Scénario", f"Scénario inconnu: {scenario_name}")
+
     def _on_red_light_clicked(self) -> None:
         """
         Gère le clic sur le bouton Feu rouge
         """
-        pass
-    
+        self.simulation.change_traffic_light_manual("RED")
+
     def _on_orange_light_clicked(self) -> None:
         """
         Gère le clic sur le bouton Feu orange
         """
-        pass
-    
+        self.simulation.change_traffic_light_manual("ORANGE")
+
     def _on_green_light_clicked(self) -> None:
         """
         Gère le clic sur le bouton Feu vert
         """
-        pass
-    
+        self.simulation.change_traffic_light_manual("GREEN")
+
+    def _set_label(self, name: str, variable: tk.StringVar, text: str) -> bool:
+        """
+        Change le texte d'une étiquette seulement s'il est différent
+
+        Returns:
+            bool: True si l'étiquette a été modifiée
+        """
+        if self._label_texts.get(name) == text:
+            return False
+        self._label_texts[name] = text
+        variable.set(text)
+        self.label_updates += 1
+        return True
+
     def update_status(self, status_text: str, color: str = "black") -> None:
         """
         Met à jour le statut affiché
         """
-        pass
-    
+        if self._set_label("status", self.status_var, status_text):
+            self.status_label.config(fg=color)
+
     def update_vehicle_count(self, count: int) -> None:
         """
         Met à jour le compteur de véhicules
         """
-        pass
-    
+        self._set_label("vehicles", self.vehicle_count_var, f"Véhicules : {count}")
+
     def update_traffic_light_status(self, state: str) -> None:
         """
         Met à jour l'état du feu affiché
         """
-        pass
-    
+        label, color = LIGHT_STATE_LABELS.get(state, (state or "-", "black"))
+        if self._set_label("light", self.light_state_var, f"Feu : {label}"):
+            self.light_state_label.config(fg=color)
+
     def update_scenario_status(self, scenario_name: str) -> None:
         """
         Met à jour le scénario affiché
         """
-        pass
+        self._set_label("scenario", self.scenario_status_var, f"Scénario : {scenario_name}")
 
 
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    pass
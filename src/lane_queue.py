@@ -0,0 +1,121 @@
+"""
+Files ordonnées des véhicules par voie
+Responsable : Ndeye Khady Syll
+"""
+
+from typing import Dict, Iterator, Optional
+
+class LaneQueue:
+    """
+    Liste doublement chaînée des véhicules d'une voie, dans l'ordre de marche
+
+    La tête est le véhicule le plus avancé, la queue le dernier entré. Les
+    véhicules ne se doublent pas : l'ordre d'entrée reste l'ordre de marche.
+    Ajout en queue, retrait (n'importe où), prédécesseur et suiveur en O(1).
+    """
+
+    def __init__(self, direction: str, lane_id: int):
+        """
+        Initialise une voie vide
+        """
+        self.direction = direction
+        self.lane_id = lane_id
+        self.head: Optional[int] = None
+        self.tail: Optional[int] = None
+        self._ahead: Dict[int, Optional[int]] = {}
+        self._behind: Dict[int, Optional[int]] = {}
+
+    def __len__(self) -> int:
+        """
+        Retourne le nombre de véhicules dans la voie
+        """
+        return len(self._ahead)
+
+    def __contains__(self, vehicle_id: int) -> bool:
+        """
+        Vérifie si un véhicule est dans la voie
+        """
+        return vehicle_id in self._ahead
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Parcourt les véhicules de la tête à la queue
+        """
+        vehicle_id = self.head
+        while vehicle_id is not None:
+            yield vehicle_id
+            vehicle_id = self._behind[vehicle_id]
+
+    def __reversed__(self) -> Iterator[int]:
+        """
+        Parcourt les véhicules de la queue à la tête
+        """
+        vehicle_id = self.tail
+        while vehicle_id is not None:
+            yield vehicle_id
+            vehicle_id = self._ahead[vehicle_id]
+
+    def push_tail(self, vehicle_id: int) -> None:
+        """
+        Ajoute un véhicule à l'entrée de la voie
+        """
+        self._ahead[vehicle_id] = self.tail
+        self._behind[vehicle_id] = None
+        if self.tail is None:
+            self.head = vehicle_id
+        else:
+            self._behind[self.tail] = vehicle_id
+        self.tail = vehicle_id
+
+    def pop_head(self) -> Optional[int]:
+        """
+        Retire et retourne le véhicule le plus avancé
+        """
+        vehicle_id = self.head
+        if vehicle_id is not None:
+            self.remove(vehicle_id)
+        return vehicle_id
+
+    def remove(self, vehicle_id: int) -> bool:
+        """
+        Retire un véhicule, même au milieu de la voie, sans changer l'ordre des autres
+        """
+        if vehicle_id not in self._ahead:
+            return False
+
+        ahead = self._ahead.pop(vehicle_id)
+        behind = self._behind.pop(vehicle_id)
+        if ahead is None:
+            self.head = behind
+        else:
+            self._behind[ahead] = behind
+        if behind is None:
+            self.tail = ahead
+        else:
+            self._ahead[behind] = ahead
+        return True
+
+    def leader(self, vehicle_id: int) -> Optional[int]:
+        """
+        Retourne le véhicule qui précède (None pour la tête)
+        """
+        return self._ahead.get(vehicle_id)
+
+    def follower(self, vehicle_id: int) -> Optional[int]:
+        """
+        Retourne le véhicule qui suit (None pour la queue)
+        """
+        return self._behind.get(vehicle_id)
+
+    def clear(self) -> None:
+        """
+        Vide la voie
+        """
+        self.head = None
+        self.tail = None
+        self._ahead.clear()
+        self._behind.clear()
+
+
+if __name__ == "__main__":
+    pass
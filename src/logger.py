@@ -1,12 +1,25 @@
 """
 Module de journalisation des événements
 Responsable : Modou Sarr
+
+Les appels de journalisation ne font qu'ajouter l'événement à une file bornée ;
+un thread d'écriture la vide par lots (une transaction par lot), dès que
+LOG_BATCH_SIZE événements attendent ou après LOG_FLUSH_INTERVAL secondes.
+flush() attend l'écriture de tout ce qui a été journalisé, close() arrête le
+thread : rien n'est perdu lors d'un arrêt normal.
+
+Le volume peut être réduit en amont : chaque type d'événement a un taux
+d'échantillonnage (sample_rates), et les positions des véhicules ne sont
+journalisées qu'aux images clés de leur trajectoire (module trajectory).
 """
 
+import threading
 import time
+from collections import deque
 from datetime import datetime
-from typing import Optional, Dict, Any
-from database import DatabaseManager
+from typing import Optional, Dict, Any, List, Tuple
+from database import DatabaseManager, EVENT_COLUMNS
+from trajectory import Keyframe, TrajectoryCompressor
 from constants import *
 
 class EventLogger:
@@ -14,24 +27,96 @@ class EventLogger:
     Gère la journalisation de tous les événements de la simulation
     """
     
-    def __init__(self, database_manager: DatabaseManager):
+    def __init__(self, database_manager: DatabaseManager,
+                 asynchronous: bool = True,
+                 queue_size: int = LOG_QUEUE_SIZE,
+                 batch_size: int = LOG_BATCH_SIZE,
+                 flush_interval: float = LOG_FLUSH_INTERVAL,
+                 overflow: str = LOG_OVERFLOW_POLICY,
+                 sample_every: int = LOG_SAMPLE_EVERY,
+                 sample_rates: Optional[Dict[str, float]] = None,
+                 log_positions: bool = LOG_POSITIONS,
+                 position_tolerance: float = POSITION_TOLERANCE,
+                 speed_tolerance: float = SPEED_TOLERANCE):
         """
         Initialise le logger
+
+        Args:
+            asynchronous: Écrit par lots dans un thread dédié (sinon une
+                transaction par événement, dans le thread appelant)
+            queue_size: Nombre maximal d'événements en attente d'écriture
+            batch_size: Nombre maximal d'événements par transaction
+            flush_interval: Délai maximal (secondes) avant l'écriture d'un lot incomplet
+            overflow: Comportement quand la file est pleine : "block" (attend
+                le thread d'écriture), "drop_oldest" (perd le plus ancien) ou
+                "sample" (garde un nouvel événement sur sample_every)
+            sample_rates: Fraction gardée par type d'événement (1.0 si absent) ;
+                les statistiques de la base ne comptent que les événements gardés,
+                et échantillonner VEHICLE_POSITION annule la tolérance des trajectoires
+            log_positions: Journalise les positions (images clés) à chaque pas
+            position_tolerance, speed_tolerance: Écarts maximaux des trajectoires
+                reconstruites à partir des images clés
         """
-        pass
+        if overflow not in LOG_OVERFLOW_POLICIES:
+            raise ValueError(f"Politique de saturation inconnue: {overflow}")
+        self.db = database_manager
+        self.enabled = True
+        self.verbose = False
+        # Contexte ajouté à chaque événement
+        self.current_scenario = "normal"
+        self.current_light_state: Optional[str] = None
+        # Temps cumulé (secondes) passé à journaliser, lu par le profileur de frames
+        self.log_time = 0.0
+
+        self.asynchronous = asynchronous
+        self.queue_size = max(1, queue_size)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.sample_every = max(1, sample_every)
+        self._queue: deque = deque()
+        self._condition = threading.Condition()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        self._flush_requested = False
+        # Compteurs : acceptés = écrits + perdus (file) + échoués + en attente
+        self.events_accepted = 0
+        self.events_written = 0
+        self.events_dropped = 0
+        self.events_failed = 0
+        self.batches_written = 0
+        self.max_queue_depth = 0
+        self._settled = 0
+        self._overflowed = 0
+
+        self.sample_rates = dict(LOG_SAMPLE_RATES if sample_rates is None else sample_rates)
+        for event_type, rate in self.sample_rates.items():
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"Taux d'échantillonnage invalide pour {event_type}: {rate}")
+        # Échantillonnage déterministe : un événement est gardé dès que le
+        # crédit accumulé (taux par événement) atteint 1
+        self._sample_credit: Dict[str, float] = {}
+        self.events_sampled_out = 0
+        self.log_positions = log_positions
+        self.trajectories = TrajectoryCompressor(position_tolerance, speed_tolerance)
     
     def log_simulation_event(self, action: str, details: Optional[str] = None) -> None:
         """
         Journalise un événement de simulation
         """
-        pass
+        event_type = f"SIMULATION_{action.upper()}"
+        if event_type not in EVENT_TYPES:
+            event_type = "USER_ACTION"
+        self._log(event_type, details or action)
     
     def log_traffic_light_event(self, from_state: str, to_state: str, 
                                manual: bool = False) -> None:
         """
         Journalise un changement de feu
         """
-        pass
+        self.current_light_state = to_state
+        mode = "manuel" if manual else "automatique"
+        self._log("TRAFFIC_LIGHT_CHANGE", f"{from_state} -> {to_state} ({mode})")
     
     def log_vehicle_event(self, vehicle_id: int, event: str, 
                          position_x: Optional[float] = None,
@@ -40,37 +125,232 @@ class EventLogger:
         """
         Journalise un événement de véhicule
         """
-        pass
+        event_type = event if event in EVENT_TYPES else "USER_ACTION"
+        if event_type == "VEHICLE_REMOVED":
+            # Dernière image clé de la trajectoire avant la sortie
+            self._log_keyframes(vehicle_id, self.trajectories.finish(vehicle_id))
+        self._log(event_type, event, id_voiture=vehicle_id, position_x=position_x,
+                  position_y=position_y, vitesse=vitesse)
+    
+    def log_vehicle_position(self, vehicle_id: int, sim_time: float, position_x: float,
+                             position_y: float, vitesse: float, state: str) -> None:
+        """
+        Transmet la position courante d'un véhicule ; seules les images clés
+        (VEHICLE_POSITION, état dans action) sont journalisées
+        """
+        if not self.enabled:
+            return
+        self._log_keyframes(vehicle_id, self.trajectories.add(
+            vehicle_id, Keyframe(sim_time, position_x, position_y, vitesse, state)))
+    
+    def end_trajectories(self) -> None:
+        """
+        Journalise la dernière image clé de toutes les trajectoires en cours
+        """
+        for vehicle_id in list(self.trajectories.tracks):
+            self._log_keyframes(vehicle_id, self.trajectories.finish(vehicle_id))
+    
+    def _log_keyframes(self, vehicle_id: int, keyframes: List[Keyframe]) -> None:
+        """
+        Journalise des images clés de trajectoire
+        """
+        for keyframe in keyframes:
+            self._log("VEHICLE_POSITION", keyframe.state, id_voiture=vehicle_id,
+                      position_x=keyframe.x, position_y=keyframe.y, vitesse=keyframe.speed,
+                      sim_time=keyframe.sim_time)
     
     def log_scenario_change(self, old_scenario: str, new_scenario: str) -> None:
         """
         Journalise un changement de scénario
         """
-        pass
+        self.current_scenario = new_scenario
+        self._log("SCENARIO_CHANGED", f"{old_scenario} -> {new_scenario}")
     
     def log_user_action(self, action: str, details: Optional[str] = None) -> None:
         """
         Journalise une action utilisateur
         """
-        pass
+        self._log("USER_ACTION", f"{action}: {details}" if details else action)
     
     def log_error(self, error_message: str, component: str = "unknown") -> None:
         """
         Journalise une erreur
         """
-        pass
+        self._log("ERROR", f"[{component}] {error_message}")
     
     def get_recent_logs(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
         Récupère les logs récents
         """
-        pass
+        self.flush()
+        return [dict(zip(EVENT_COLUMNS, row)) for row in self.db.get_all_events(limit)]
     
     def clear_logs(self) -> bool:
         """
         Efface tous les logs
         """
-        pass
+        self.flush()
+        return self.db.reset_database()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Attend que tous les événements déjà journalisés soient écrits
+
+        Returns:
+            bool: False si le délai a expiré avant la fin de l'écriture
+        """
+        with self._condition:
+            target = self.events_accepted
+            if self._settled >= target:
+                return True
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: self._settled >= target, timeout)
+    
+    def close(self) -> None:
+        """
+        Écrit les événements en attente et arrête le thread d'écriture
+
+        Les événements journalisés ensuite sont écrits directement.
+        """
+        self.end_trajectories()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            writer = self._writer
+        if writer is not None:
+            writer.join()
+        self._writer = None
+    
+    def get_queue_statistics(self) -> Dict[str, Any]:
+        """
+        Retourne l'état de la file d'écriture
+        """
+        with self._condition:
+            return {
+                "queued": len(self._queue),
+                "max_queue_depth": self.max_queue_depth,
+                "accepted": self.events_accepted,
+                "written": self.events_written,
+                "dropped": self.events_dropped,
+                "failed": self.events_failed,
+                "batches": self.batches_written,
+                "sampled_out": self.events_sampled_out
+            }
+    
+    def _log(self, event_type: str, action: str, **fields) -> None:
+        """
+        Enregistre un événement avec le contexte courant (scénario, état du feu)
+        """
+        if not self.enabled:
+            return
+        rate = self.sample_rates.get(event_type)
+        if rate is not None and rate < 1.0:
+            credit = self._sample_credit.get(event_type, 0.0) + rate
+            if credit < 1.0 - 1e-9:
+                self._sample_credit[event_type] = credit
+                self.events_sampled_out += 1
+                return
+            self._sample_credit[event_type] = credit - 1.0
+        start = time.perf_counter()
+        now = datetime.now()
+        if self.verbose:
+            print(f"[{now.strftime('%H:%M:%S')}] {event_type}: {action}")
+        row = (now.isoformat(), event_type, action, self.current_light_state,
+               self.current_scenario, fields.get("id_voiture"), fields.get("position_x"),
+               fields.get("position_y"), fields.get("vitesse"), fields.get("sim_time"))
+        try:
+            if not (self.asynchronous and self._enqueue(row)):
+                self._write([row])
+        except Exception as e:
+            # La journalisation ne doit jamais interrompre la simulation
+            print(f"Erreur de journalisation: {e}")
+        self.log_time += time.perf_counter() - start
+    
+    def _enqueue(self, row: Tuple) -> bool:
+        """
+        Ajoute un événement à la file en appliquant la politique de saturation
+
+        Returns:
+            bool: False si le logger est fermé (l'appelant écrit directement)
+        """
+        with self._condition:
+            if self._closed:
+                return False
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run_writer,
+                                                name="event-writer", daemon=True)
+                self._writer.start()
+
+            if len(self._queue) >= self.queue_size:
+                if self.overflow == "block":
+                    self._condition.notify_all()
+                    self._condition.wait_for(lambda: len(self._queue) < self.queue_size)
+                else:
+                    self._overflowed += 1
+                    if self.overflow == "sample" and self._overflowed % self.sample_every:
+                        # Événement écarté avant même d'entrer dans la file
+                        self.events_accepted += 1
+                        self.events_dropped += 1
+                        self._settled += 1
+                        return True
+                    self._queue.popleft()
+                    self.events_dropped += 1
+                    self._settled += 1
+
+            self._queue.append(row)
+            self.events_accepted += 1
+            self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+            # Réveille le thread d'écriture : premier événement (délai) ou lot complet
+            if len(self._queue) == 1 or len(self._queue) >= self.batch_size:
+                self._condition.notify_all()
+            return True
+    
+    def _run_writer(self) -> None:
+        """
+        Boucle du thread d'écriture : un lot par transaction
+        """
+        while True:
+            with self._condition:
+                # Le délai court à partir du premier événement en attente
+                deadline = time.monotonic() + self.flush_interval
+                while (len(self._queue) < self.batch_size and not self._closed
+                       and not self._flush_requested):
+                    if not self._queue:
+                        deadline = time.monotonic() + self.flush_interval
+                        self._condition.wait()
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if not self._queue:
+                    self._flush_requested = False
+                    if self._closed:
+                        return
+                    continue
+                batch = [self._queue.popleft()
+                         for _ in range(min(self.batch_size, len(self._queue)))]
+                # Place libérée : réveille les appelants bloqués (politique "block")
+                self._condition.notify_all()
+
+            written = self._write(batch)
+            with self._condition:
+                self.events_written += written
+                self.events_failed += len(batch) - written
+                self.batches_written += 1
+                self._settled += len(batch)
+                self._condition.notify_all()
+    
+    def _write(self, rows: List[Tuple]) -> int:
+        """
+        Écrit des événements en base, dans une seule transaction
+        """
+        try:
+            return self.db.insert_events(rows)
+        except Exception as e:
+            print(f"Erreur de journalisation: {e}")
+            return 0
 
 
 if __name__ == "__main__":
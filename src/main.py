@@ -6,18 +6,19 @@ Responsable : Modou Sarr
 import sys
 import os
 import argparse
-from typing import Optional
+from typing import Optional, Tuple
 
 # Ajouter le répertoire courant au path Python
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import des modules de l'application
+# (gui est importé plus tard : le mode headless ne doit pas charger Tkinter)
 try:
     from simulation import Simulation
-    from gui import ControlInterface
     from logger import EventLogger
     from database import DatabaseManager
-    from constants import VERSION, AUTHOR, YEAR
+    from constants import (VERSION, AUTHOR, YEAR, DB_NAME, FPS, LOG_OVERFLOW_POLICY,
+                           LOG_OVERFLOW_POLICIES, LOG_POSITIONS, POSITION_TOLERANCE)
     print("✓ Modules importés avec succès")
 except ImportError as e:
     print(f"✗ Erreur d'importation: {e}")
@@ -30,62 +31,280 @@ class TrafficSimulationApp:
     Application principale de simulation de trafic
     """
     
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, headless: bool = False,
+                 duration: float = 3600.0, dt: float = 1.0 / FPS,
+                 scenario: str = "normal", seed: Optional[int] = None,
+                 db_name: str = DB_NAME, log_events: bool = True,
+                 grid: Optional[Tuple[int, int]] = None, workers: int = 1,
+                 renderer: str = "turtle", show_timings: bool = False,
+                 log_overflow: str = LOG_OVERFLOW_POLICY,
+                 log_positions: bool = LOG_POSITIONS):
         """
         Initialise l'application
+
+        Args:
+            grid: (lignes, colonnes) pour simuler un réseau de carrefours (headless)
+            workers: Nombre de processus pour le réseau (1 = mono-processus)
+            renderer: Backend d'affichage ("turtle" ou "canvas")
+            show_timings: Affiche l'overlay des temps par phase de frame
+            log_overflow: Comportement du logger quand sa file d'écriture est pleine
+            log_positions: Journalise les trajectoires des véhicules (images clés)
         """
         self.debug = debug
+        self.headless = headless
+        self.duration = duration
+        self.dt = dt
+        self.scenario = scenario
+        self.seed = seed
+        self.db_name = db_name
+        self.log_events = log_events
+        self.grid = grid
+        self.workers = workers
+        self.renderer = renderer
+        self.show_timings = show_timings
+        self.log_overflow = log_overflow
+        self.log_positions = log_positions
         self.simulation = None
         self.interface = None
         self.logger = None
         self.database = None
-        
+
         print("\n" + "=" * 60)
         print(f"SIMULATION FEU TRICOLORE - VILLE DE THIÈS")
         print(f"Version {VERSION} - {YEAR}")
         print(f"Développé par: {AUTHOR}")
         print("=" * 60)
-        
+
         if debug:
             print("Mode débogage activé")
+        if headless:
+            print(f"Mode headless : {duration:.0f} s simulées, pas de {dt:.4f} s")
     
     def setup(self) -> bool:
         """
         Configure tous les composants de l'application
-        
+
         Returns:
             bool: True si la configuration a réussi
         """
-        pass
+        self.database = DatabaseManager(self.db_name)
+        if not self.database.connect():
+            print("✗ Impossible de se connecter à la base de données")
+            return False
+
+        self.logger = EventLogger(self.database, overflow=self.log_overflow,
+                                  log_positions=self.log_positions)
+        self.logger.verbose = self.debug
+        self.logger.enabled = self.log_events
+
+        self.simulation = Simulation(self.logger, seed=self.seed, headless=self.headless)
+        if not self.simulation.setup():
+            print("✗ Impossible de configurer la simulation")
+            return False
+        if not self.simulation.change_scenario(self.scenario):
+            print(f"✗ Scénario inconnu: {self.scenario}")
+            return False
+
+        if not self.headless:
+            from gui import ControlInterface
+            self.interface = ControlInterface(self.simulation, renderer=self.renderer,
+                                              show_timings=self.show_timings)
+            if not self.interface.setup():
+                print("✗ Impossible de créer l'interface")
+                return False
+
+        return True
     
     def run(self) -> int:
         """
         Exécute l'application
-        
+
         Returns:
             int: Code de retour (0 = succès, autre = erreur)
         """
-        pass
+        if not self.setup():
+            return 1
+
+        try:
+            if self.headless:
+                self.logger.log_simulation_event("START", "headless")
+                if self.grid:
+                    stats = self._run_network()
+                else:
+                    stats = self.simulation.run_for(self.duration, self.dt)
+                self.logger.log_simulation_event("STOP", "headless")
+                self._print_statistics(stats)
+            else:
+                self.interface.run()
+            return 0
+        except KeyboardInterrupt:
+            print("\nInterruption par l'utilisateur")
+            return 0
+        finally:
+            self.cleanup()
+    
+    def _run_network(self) -> dict:
+        """
+        Exécute un réseau de carrefours sans affichage, sur un ou plusieurs processus
+        """
+        rows, columns = self.grid
+        if self.workers > 1:
+            from parallel_network import ParallelRoadNetwork
+            with ParallelRoadNetwork(rows, columns, seed=self.seed, scenario=self.scenario,
+                                     workers=self.workers) as network:
+                return network.run_for(self.duration, self.dt)
+
+        from road_network import RoadNetwork
+        network = RoadNetwork(rows, columns, seed=self.seed, scenario=self.scenario)
+        network.setup()
+        return network.run_for(self.duration, self.dt)
+    
+    def _print_statistics(self, stats: dict) -> None:
+        """
+        Affiche les statistiques d'une exécution headless
+        """
+        print("-" * 60)
+        for key, value in stats.items():
+            if isinstance(value, dict):
+                # Détails (temps par phase) : non mesurés en mode headless
+                continue
+            if isinstance(value, float):
+                value = f"{value:.2f}"
+            print(f"{key:>20}: {value}")
+        print("-" * 60)
     
     def cleanup(self) -> None:
         """
         Nettoie les ressources de l'application
         """
-        pass
+        if self.simulation:
+            self.simulation.stop()
+        if self.interface:
+            self.interface.close()
+        if self.logger:
+            # Écrit les événements encore en file avant de fermer la base
+            self.logger.close()
+        if self.database:
+            self.database.disconnect()
 
 
 def parse_arguments() -> argparse.Namespace:
     """
     Parse les arguments de ligne de commande
     """
-    pass
+    try:
+        from road_scene import RENDERERS
+    except ImportError:  # Sans Tkinter, seul le mode headless est disponible
+        RENDERERS = {}
+    parser = argparse.ArgumentParser(
+        description="Simulation de feu tricolore - Ville de Thiès")
+    parser.add_argument("--debug", action="store_true",
+                        help="Active le mode débogage")
+    parser.add_argument("--headless", action="store_true",
+                        help="Exécute la simulation sans interface, plus vite que le temps réel")
+    parser.add_argument("--duration", type=float, default=3600.0,
+                        help="Durée simulée en secondes (mode headless)")
+    parser.add_argument("--dt", type=float, default=1.0 / FPS,
+                        help="Pas de temps fixe en secondes (mode headless)")
+    parser.add_argument("--scenario", default="normal",
+                        choices=["normal", "rush_hour", "night", "manual"],
+                        help="Scénario de circulation initial")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Graine aléatoire pour une exécution reproductible")
+    parser.add_argument("--db", default=DB_NAME,
+                        help="Fichier de base de données SQLite")
+    parser.add_argument("--no-log", action="store_true",
+                        help="Désactive la journalisation des événements en base")
+    parser.add_argument("--rebuild-stats", action="store_true",
+                        help="Recalcule les statistiques agrégées de la base (--db) puis quitte")
+    parser.add_argument("--log-overflow", default=LOG_OVERFLOW_POLICY,
+                        choices=LOG_OVERFLOW_POLICIES,
+                        help="File d'écriture des événements pleine : attendre, "
+                             "perdre les plus anciens ou échantillonner")
+    parser.add_argument("--log-positions", action="store_true",
+                        help="Journalise les trajectoires des véhicules (images clés à "
+                             f"{POSITION_TOLERANCE} px près)")
+    parser.add_argument("--grid", type=parse_grid, default=None, metavar="LIGNESxCOLONNES",
+                        help="Simule un réseau de carrefours, par ex. 10x10 (mode headless)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Nombre de processus pour le réseau (--grid)")
+    parser.add_argument("--renderer", default="turtle", choices=sorted(RENDERERS),
+                        help="Backend d'affichage : Turtle ou Canvas Tkinter direct (plus rapide)")
+    parser.add_argument("--show-timings", action="store_true",
+                        help="Affiche les temps par phase (p50/p95/p99) sur la scène")
+    parser.add_argument("--bench", action="store_true",
+                        help="Exécute la suite de bancs d'essai (sans mesure du rendu avec --headless)")
+    parser.add_argument("--bench-output", default="bench_results.json",
+                        help="Fichier JSON des résultats (--bench)")
+    parser.add_argument("--bench-baseline", default=None,
+                        help="Résultats de référence à comparer (--bench)")
+    parser.add_argument("--bench-sizes", type=int, nargs="+", default=None, metavar="N",
+                        help="Nombres de véhicules mesurés (--bench)")
+    parser.add_argument("--bench-tolerance", type=float, default=0.2,
+                        help="Dégradation relative tolérée avant régression (--bench)")
+    args = parser.parse_args()
+    # Le réseau de carrefours n'est simulé qu'en mode headless
+    if args.grid is not None and not args.headless:
+        parser.error("--grid nécessite --headless")
+    if args.workers > 1 and args.grid is None:
+        parser.error("--workers nécessite --grid")
+    return args
+
+
+def parse_grid(value: str) -> Tuple[int, int]:
+    """
+    Convertit "LIGNESxCOLONNES" en tuple d'entiers
+    """
+    try:
+        rows, columns = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Grille invalide: {value} (attendu: 4x5)")
+    if rows < 1 or columns < 1:
+        raise argparse.ArgumentTypeError(f"Grille invalide: {value}")
+    return rows, columns
+
+
+def rebuild_statistics(db_name: str) -> int:
+    """
+    Réconcilie les agrégats de la base avec les événements enregistrés
+    """
+    database = DatabaseManager(db_name)
+    if not database.connect():
+        print("✗ Impossible de se connecter à la base de données")
+        return 1
+    try:
+        if not database.rebuild_statistics():
+            return 1
+        stats = database.get_statistics()
+        print(f"✓ Statistiques recalculées : {stats['total_events']} événements, "
+              f"{stats['total_vehicles']} véhicules")
+        return 0
+    finally:
+        database.disconnect()
 
 
 def main() -> int:
     """
     Fonction principale
     """
-    pass
+    args = parse_arguments()
+    if args.rebuild_stats:
+        return rebuild_statistics(args.db)
+    if args.bench:
+        from benchmark import BENCH_SIZES, run_benchmarks
+        return run_benchmarks(args.bench_output, args.bench_baseline,
+                              sizes=args.bench_sizes or BENCH_SIZES,
+                              tolerance=args.bench_tolerance,
+                              render=not args.headless)
+    app = TrafficSimulationApp(debug=args.debug, headless=args.headless,
+                               duration=args.duration, dt=args.dt,
+                               scenario=args.scenario, seed=args.seed,
+                               db_name=args.db, log_events=not args.no_log,
+                               grid=args.grid, workers=args.workers,
+                               renderer=args.renderer, show_timings=args.show_timings,
+                               log_overflow=args.log_overflow,
+                               log_positions=args.log_positions)
+    return app.run()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,369 @@
+"""
+Exécution parallèle d'un réseau routier partitionné entre plusieurs processus
+Responsable : Ndeye Khady Syll
+"""
+
+import multiprocessing
+import struct
+import time
+import traceback
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple, Any
+from constants import *
+from road_network import RoadNetwork, Handoff, deliver_handoffs
+from vehicle import VEHICLE_TYPES, VEHICLE_TYPE_CODES
+from vehicle_store import DIRECTIONS, DIRECTION_CODES
+
+# Enregistrement binaire d'un véhicule transmis (cible, source, ID, type,
+# sens, voie, distance, vitesse, vitesse max, couleur)
+HANDOFF_RECORD = struct.Struct("<iiqBBBddd16s")
+COUNT_HEADER = struct.Struct("<i")
+
+# Places réservées par carrefour et par pas dans une boîte d'envoi
+HANDOFF_CAPACITY_PER_JUNCTION = 64
+
+# Délai maximal d'attente à la barrière (un processus bloqué ne fige pas tout)
+BARRIER_TIMEOUT = 60.0
+
+
+def partition_indices(count: int, workers: int) -> List[List[int]]:
+    """
+    Découpe les carrefours en blocs contigus de tailles égales (à un près)
+
+    Des blocs contigus limitent le nombre de liaisons entre partitions. Le
+    découpage ne suit pas les lignes de la grille : les blocs sont formés de
+    lignes entières seulement si le nombre de lignes est multiple de workers.
+    """
+    workers = max(1, min(workers, count))
+    size, extra = divmod(count, workers)
+    parts = []
+    start = 0
+    for worker in range(workers):
+        end = start + size + (1 if worker < extra else 0)
+        parts.append(list(range(start, end)))
+        start = end
+    return parts
+
+
+class HandoffOutbox:
+    """
+    Boîte d'envoi en mémoire partagée d'un processus
+
+    Le segment contient une section par processus destinataire : un compteur
+    suivi d'enregistrements HANDOFF_RECORD. Seul le propriétaire écrit ; chaque
+    processus ne lit que sa section dans les boîtes des autres.
+    """
+
+    def __init__(self, workers: int, capacity: int, name: Optional[str] = None):
+        """
+        Crée (name absent) ou ouvre un segment de mémoire partagée
+
+        Args:
+            workers: Nombre de processus (de sections)
+            capacity: Nombre maximal d'enregistrements par section
+        """
+        self.workers = workers
+        self.capacity = capacity
+        self.section_size = COUNT_HEADER.size + capacity * HANDOFF_RECORD.size
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=self.section_size * workers)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+
+    @property
+    def name(self) -> str:
+        """
+        Nom du segment à transmettre aux autres processus
+        """
+        return self.shm.name
+
+    def write(self, section: int, handoffs: List[Handoff]) -> None:
+        """
+        Écrit les véhicules destinés à un processus
+        """
+        if len(handoffs) > self.capacity:
+            raise OverflowError(
+                f"{len(handoffs)} véhicules transmis pour {self.capacity} places")
+        buffer = self.shm.buf
+        base = section * self.section_size
+        COUNT_HEADER.pack_into(buffer, base, len(handoffs))
+        offset = base + COUNT_HEADER.size
+        for handoff in handoffs:
+            HANDOFF_RECORD.pack_into(
+                buffer, offset, handoff.target, handoff.source, handoff.display_id,
+                VEHICLE_TYPE_CODES[handoff.vehicle_type],
+                DIRECTION_CODES[handoff.direction], handoff.lane_id,
+                handoff.distance, handoff.speed, handoff.max_speed,
+                handoff.color.encode("ascii"))
+            offset += HANDOFF_RECORD.size
+
+    def read(self, section: int) -> List[Handoff]:
+        """
+        Lit les véhicules destinés à un processus
+        """
+        buffer = self.shm.buf
+        base = section * self.section_size
+        (count,) = COUNT_HEADER.unpack_from(buffer, base)
+        handoffs = []
+        offset = base + COUNT_HEADER.size
+        for _ in range(count):
+            (target, source, display_id, type_code, direction_code, lane_id,
+             distance, speed, max_speed, color) = HANDOFF_RECORD.unpack_from(buffer, offset)
+            handoffs.append(Handoff(target, source, display_id, VEHICLE_TYPES[type_code],
+                                    DIRECTIONS[direction_code], lane_id, distance, speed,
+                                    max_speed, color.rstrip(b"\0").decode("ascii")))
+            offset += HANDOFF_RECORD.size
+        return handoffs
+
+    def close(self) -> None:
+        """
+        Ferme le segment (et le détruit si ce processus l'a créé)
+        """
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _worker_main(worker: int, rows: int, columns: int, seed: Optional[int],
+                 scenario: str, parts: List[List[int]], outbox_names: List[str],
+                 capacity: int, barrier, connection) -> None:
+    """
+    Boucle d'un processus : avance sa partition au pas à pas, sur ordre du parent
+    """
+    outboxes = []
+    try:
+        network = RoadNetwork(rows, columns, seed, scenario, indices=parts[worker])
+        network.setup()
+        owner = {index: part_id for part_id, part in enumerate(parts) for index in part}
+        outboxes = [HandoffOutbox(len(parts), capacity, name) for name in outbox_names]
+        own_outbox = outboxes[worker]
+
+        while True:
+            command, argument = connection.recv()
+            if command == "run":
+                steps, dt = argument
+                for _ in range(steps):
+                    local: List[Handoff] = []
+                    outgoing: List[List[Handoff]] = [[] for _ in parts]
+                    for handoff in network.advance(dt):
+                        part_id = owner[handoff.target]
+                        if part_id == worker:
+                            local.append(handoff)
+                        else:
+                            outgoing[part_id].append(handoff)
+                    for part_id, handoffs in enumerate(outgoing):
+                        if part_id != worker:
+                            own_outbox.write(part_id, handoffs)
+
+                    # Toutes les boîtes sont écrites avant la lecture...
+                    barrier.wait(BARRIER_TIMEOUT)
+                    for part_id, outbox in enumerate(outboxes):
+                        if part_id != worker:
+                            local.extend(outbox.read(worker))
+                    # ... et toutes sont lues avant d'être réécrites au pas suivant
+                    barrier.wait(BARRIER_TIMEOUT)
+                    deliver_handoffs(network.junctions, local)
+                connection.send(("ok", None))
+            elif command == "statistics":
+                connection.send(("ok", network.get_statistics()))
+            elif command == "states":
+                connection.send(("ok", network.get_vehicle_states()))
+            elif command == "scenario":
+                connection.send(("ok", network.change_scenario(argument)))
+            elif command == "close":
+                connection.send(("ok", None))
+                break
+    except Exception:
+        # Débloque les autres processus avant de remonter l'erreur au parent
+        barrier.abort()
+        connection.send(("error", traceback.format_exc()))
+    finally:
+        for outbox in outboxes:
+            outbox.close()
+        connection.close()
+
+
+class ParallelRoadNetwork:
+    """
+    Réseau routier partitionné entre plusieurs processus
+
+    Chaque processus possède un bloc de carrefours et leurs véhicules ; à
+    chaque pas, seuls les véhicules franchissant une frontière de partition
+    sont échangés, via des boîtes d'envoi en mémoire partagée (pas de
+    sérialisation pickle). Les livraisons suivent le même ordre que
+    RoadNetwork : à graine égale, le résultat est identique au mode mono-processus.
+    """
+
+    def __init__(self, rows: int = 1, columns: int = 1, seed: Optional[int] = None,
+                 scenario: str = "normal", workers: Optional[int] = None):
+        """
+        Initialise le réseau parallèle
+
+        Args:
+            workers: Nombre de processus (nombre de cœurs par défaut)
+        """
+        if rows < 1 or columns < 1:
+            raise ValueError("Le réseau doit contenir au moins un carrefour")
+        self.rows = rows
+        self.columns = columns
+        self.seed = seed
+        self.scenario = scenario
+        self.workers = workers or multiprocessing.cpu_count()
+        self.parts: List[List[int]] = []
+        self.processes: List[multiprocessing.Process] = []
+        self.connections = []
+        self.outboxes: List[HandoffOutbox] = []
+        self.sim_time = 0.0
+        self.frame_count = 0
+
+    def __enter__(self) -> 'ParallelRoadNetwork':
+        if not self.processes:
+            self.setup()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def setup(self) -> bool:
+        """
+        Démarre les processus et crée les boîtes d'envoi
+        """
+        self.close()
+        self.parts = partition_indices(self.rows * self.columns, self.workers)
+        largest = max(len(part) for part in self.parts)
+        capacity = largest * HANDOFF_CAPACITY_PER_JUNCTION
+        self.outboxes = [HandoffOutbox(len(self.parts), capacity) for _ in self.parts]
+        names = [outbox.name for outbox in self.outboxes]
+
+        context = multiprocessing.get_context()
+        barrier = context.Barrier(len(self.parts))
+        for worker in range(len(self.parts)):
+            parent_end, child_end = context.Pipe()
+            process = context.Process(
+                target=_worker_main,
+                args=(worker, self.rows, self.columns, self.seed, self.scenario,
+                      self.parts, names, capacity, barrier, child_end),
+                daemon=True)
+            process.start()
+            child_end.close()
+            self.processes.append(process)
+            self.connections.append(parent_end)
+        self.sim_time = 0.0
+        self.frame_count = 0
+        return True
+
+    def change_scenario(self, scenario_type: str) -> bool:
+        """
+        Applique un scénario à tous les carrefours
+        """
+        results = self._broadcast("scenario", scenario_type)
+        if all(results):
+            self.scenario = scenario_type
+            return True
+        return False
+
+    def step(self, dt: float = 1.0 / FPS) -> None:
+        """
+        Avance le réseau d'un pas
+        """
+        self.run_steps(1, dt)
+
+    def run_steps(self, steps: int, dt: float = 1.0 / FPS) -> None:
+        """
+        Avance le réseau de plusieurs pas sans repasser par le parent
+        """
+        self._broadcast("run", (steps, dt))
+        for _ in range(steps):
+            self.sim_time += dt
+        self.frame_count += steps
+
+    def run_for(self, sim_seconds: float, dt: float = 1.0 / FPS) -> Dict[str, Any]:
+        """
+        Exécute le réseau sur une durée de temps virtuel
+        """
+        if not self.processes:
+            self.setup()
+        steps = int(round(sim_seconds / dt))
+        start = time.perf_counter()
+        self.run_steps(steps, dt)
+        wall_time = time.perf_counter() - start
+
+        stats = self.get_statistics()
+        stats["wall_time"] = wall_time
+        stats["speedup"] = steps * dt / wall_time if wall_time > 0 else float("inf")
+        return stats
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Retourne les statistiques agrégées de toutes les partitions
+        """
+        stats: Dict[str, Any] = {
+            "sim_time": self.sim_time,
+            "frame_count": self.frame_count,
+            "junctions": self.rows * self.columns,
+            "scenario": self.scenario,
+            "workers": len(self.parts)
+        }
+        per_worker = self._broadcast("statistics")
+        for key in ("vehicle_count", "total_spawned", "total_exited",
+                    "total_handed_off", "total_received"):
+            stats[key] = sum(worker_stats[key] for worker_stats in per_worker)
+        return stats
+
+    def get_vehicle_states(self) -> List[Tuple[int, int, float, float]]:
+        """
+        Retourne (carrefour, ID affiché, distance, vitesse) de tous les véhicules, triés par ID
+        """
+        states = []
+        for worker_states in self._broadcast("states"):
+            states.extend(worker_states)
+        return sorted(states, key=lambda state: state[1])
+
+    def close(self) -> None:
+        """
+        Arrête les processus et libère la mémoire partagée
+        """
+        for connection, process in zip(self.connections, self.processes):
+            if process.is_alive():
+                try:
+                    connection.send(("close", None))
+                    connection.recv()
+                except (EOFError, OSError):
+                    pass
+            connection.close()
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for outbox in self.outboxes:
+            outbox.close()
+        self.processes = []
+        self.connections = []
+        self.outboxes = []
+
+    def _broadcast(self, command: str, argument: Any = None) -> List[Any]:
+        """
+        Envoie une commande à tous les processus et rassemble leurs réponses
+        """
+        if not self.processes:
+            raise RuntimeError("Le réseau parallèle n'est pas démarré (appeler setup())")
+        for connection in self.connections:
+            connection.send((command, argument))
+
+        results, errors = [], []
+        for worker, connection in enumerate(self.connections):
+            try:
+                status, value = connection.recv()
+            except EOFError:
+                status, value = "error", f"processus {worker} arrêté"
+            if status == "error":
+                errors.append(value)
+            results.append(value)
+        if errors:
+            self.close()
+            raise RuntimeError("Erreur dans un processus du réseau :\n" + errors[0])
+        return results
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,322 @@
+"""
+Réseau routier multi-carrefours (corridor ou grille N x M)
+Responsable : Ndeye Khady Syll
+"""
+
+import itertools
+import random
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any
+from constants import *
+from traffic_light import TrafficLightManager
+from vehicle import VehicleManager, VehicleType
+from scenario_manager import ScenarioManager, ScenarioType
+from arrivals import ArrivalSchedule, arrival_rate
+
+# Carrefour voisin atteint en sortant dans chaque sens (décalage ligne, colonne)
+NEIGHBOR_OFFSETS = {
+    "north": (1, 0),
+    "south": (-1, 0),
+    "east": (0, 1),
+    "west": (0, -1)
+}
+
+# Distance entre deux carrefours : la sortie d'une voie est l'entrée de la suivante
+JUNCTION_SPACING = LANE_LENGTH
+
+
+class Handoff(NamedTuple):
+    """
+    Véhicule transmis d'un carrefour à son voisin
+    """
+    target: int
+    source: int
+    display_id: int
+    vehicle_type: VehicleType
+    direction: str
+    lane_id: int
+    distance: float
+    speed: float
+    max_speed: float
+    color: str
+
+
+class Junction:
+    """
+    Carrefour du réseau, avec ses propres feux et ses véhicules
+
+    Les positions des véhicules restent dans le repère local du carrefour ;
+    offset donne la position du carrefour dans le réseau.
+    """
+    
+    def __init__(self, index: int, row: int, column: int, junction_count: int,
+                 seed: Optional[int] = None):
+        """
+        Initialise un carrefour
+
+        Args:
+            index: Index du carrefour dans le réseau
+            junction_count: Nombre total de carrefours (pour des IDs de véhicules uniques)
+            seed: Graine du réseau ; chaque carrefour dérive la sienne
+        """
+        self.index = index
+        self.row = row
+        self.column = column
+        self.offset = (column * JUNCTION_SPACING, row * JUNCTION_SPACING)
+        self.neighbors: Dict[str, int] = {}
+
+        # Graine propre au carrefour : le résultat ne dépend pas de l'ordre de calcul
+        self.rng = random.Random(f"{seed}:{index}") if seed is not None else random.Random()
+
+        self.light_manager = TrafficLightManager()
+        self.light_manager.setup_lights()
+        self.vehicle_manager = VehicleManager(
+            rng=self.rng,
+            id_sequence=itertools.count(index + 1, junction_count))
+        self.scenario = "normal"
+        arrivals_rng = (random.Random(f"{seed}:{index}:arrivals") if seed is not None
+                        else random.Random())
+        self.arrivals = ArrivalSchedule(self.vehicle_manager.get_entry_lanes(),
+                                        arrival_rate(SPAWN_RATES["normal"]), arrivals_rng)
+        self.total_exited = 0
+        self.total_handed_off = 0
+        self.total_received = 0
+    
+    def connect(self, neighbors: Dict[str, int]) -> None:
+        """
+        Relie le carrefour à ses voisins et limite l'apparition aux entrées du réseau
+        """
+        self.neighbors = neighbors
+        # Une voie allant vers le nord reçoit ses véhicules du voisin situé au sud
+        upstream = {"north": "south", "south": "north", "east": "west", "west": "east"}
+        self.vehicle_manager.entry_directions = [
+            direction for direction in LANE_STARTS
+            if upstream[direction] not in neighbors
+        ]
+        self.arrivals.reset(self.light_manager.scheduler.current_time,
+                            lanes=self.vehicle_manager.get_entry_lanes())
+    
+    def step(self, current_time: float, dt: float) -> List[Handoff]:
+        """
+        Avance le carrefour d'un pas de temps
+
+        Returns:
+            List[Handoff]: Véhicules sortis vers un carrefour voisin
+        """
+        self.light_manager.update_all(current_time)
+        manager = self.vehicle_manager
+        leaving = manager.update(self.light_manager.get_current_state(), dt)
+
+        handoffs = []
+        for vehicle_id in leaving:
+            vehicle = manager.vehicles[vehicle_id]
+            target = self.neighbors.get(vehicle.direction)
+            if target is None:
+                self.total_exited += 1
+            else:
+                handoffs.append(Handoff(target, self.index, vehicle.display_id, vehicle.vehicle_type,
+                                        vehicle.direction, vehicle.lane_id,
+                                        vehicle.distance - JUNCTION_SPACING, vehicle.speed,
+                                        vehicle.max_speed, vehicle.color))
+                self.total_handed_off += 1
+            manager.remove_vehicle(vehicle_id)
+
+        for direction, lane_id in self.arrivals.pop_due(current_time):
+            manager.spawn_vehicle(self.scenario, direction, lane_id)
+        return handoffs
+    
+    def receive(self, handoff: Handoff) -> None:
+        """
+        Fait entrer un véhicule transmis par un voisin
+        """
+        self.vehicle_manager.accept_vehicle(handoff.display_id, handoff.vehicle_type,
+                                            handoff.lane_id, handoff.direction,
+                                            handoff.distance, handoff.speed,
+                                            handoff.max_speed, handoff.color)
+        self.total_received += 1
+    
+    def set_scenario(self, scenario: ScenarioType) -> None:
+        """
+        Applique un scénario aux feux et aux véhicules du carrefour
+        """
+        manager = ScenarioManager()
+        manager.setup()
+        manager.change_scenario(scenario)
+        manager.apply_current_scenario(self.light_manager, self.vehicle_manager)
+        self.scenario = scenario.value
+        self.arrivals.reset(self.light_manager.scheduler.current_time,
+                            rate=arrival_rate(manager.get_current_scenario().get_spawn_rate()))
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Retourne les compteurs du carrefour
+        """
+        return {
+            "vehicle_count": self.vehicle_manager.get_vehicle_count(),
+            "total_spawned": self.vehicle_manager.total_spawned,
+            "total_exited": self.total_exited,
+            "total_handed_off": self.total_handed_off,
+            "total_received": self.total_received,
+            "traffic_light_state": self.light_manager.get_current_state()
+        }
+
+
+def deliver_handoffs(junctions: Dict[int, Junction], handoffs: List[Handoff]) -> None:
+    """
+    Livre les véhicules transmis dans un ordre indépendant du partitionnement
+    """
+    for handoff in sorted(handoffs, key=lambda h: (h.target, h.source, h.display_id)):
+        junctions[handoff.target].receive(handoff)
+
+
+class RoadNetwork:
+    """
+    Représente le réseau routier : une grille de carrefours reliés entre eux
+
+    Chaque carrefour a son TrafficLightManager et son VehicleManager ; un
+    véhicule qui sort d'un carrefour entre dans la voie de même sens du
+    carrefour voisin. Le coût d'un pas est linéaire en nombre de carrefours.
+    """
+    
+    def __init__(self, rows: int = 1, columns: int = 1, seed: Optional[int] = None,
+                 scenario: str = "normal", indices: Optional[List[int]] = None):
+        """
+        Initialise le réseau
+
+        Args:
+            rows: Nombre de lignes de carrefours (1 pour un corridor)
+            columns: Nombre de colonnes de carrefours
+            seed: Graine aléatoire du réseau
+            indices: Carrefours gérés localement (tous par défaut) ; les autres
+                appartiennent à une autre partition du même réseau
+        """
+        if rows < 1 or columns < 1:
+            raise ValueError("Le réseau doit contenir au moins un carrefour")
+        self.rows = rows
+        self.columns = columns
+        self.seed = seed
+        self.scenario = scenario
+        self.indices = sorted(indices) if indices is not None else list(range(rows * columns))
+        self.junctions: Dict[int, Junction] = {}
+        self.sim_time = 0.0
+        self.frame_count = 0
+    
+    @classmethod
+    def corridor(cls, length: int, seed: Optional[int] = None,
+                 scenario: str = "normal") -> 'RoadNetwork':
+        """
+        Crée un corridor est-ouest de length carrefours
+        """
+        return cls(1, length, seed, scenario)
+    
+    def setup(self) -> bool:
+        """
+        Crée les carrefours et leurs liaisons
+        """
+        count = self.rows * self.columns
+        self.junctions = {}
+        for index in self.indices:
+            row, column = divmod(index, self.columns)
+            self.junctions[index] = Junction(index, row, column, count, self.seed)
+
+        for junction in self.junctions.values():
+            neighbors = {}
+            for direction, (d_row, d_column) in NEIGHBOR_OFFSETS.items():
+                row, column = junction.row + d_row, junction.column + d_column
+                if 0 <= row < self.rows and 0 <= column < self.columns:
+                    neighbors[direction] = self.index_of(row, column)
+            junction.connect(neighbors)
+        return self.change_scenario(self.scenario)
+    
+    def index_of(self, row: int, column: int) -> int:
+        """
+        Retourne l'index d'un carrefour à partir de sa position dans la grille
+        """
+        return row * self.columns + column
+    
+    def junction_at(self, row: int, column: int) -> Junction:
+        """
+        Retourne le carrefour à une position de la grille
+        """
+        return self.junctions[self.index_of(row, column)]
+    
+    def change_scenario(self, scenario_type: str) -> bool:
+        """
+        Applique un scénario à tous les carrefours
+        """
+        try:
+            scenario = ScenarioType(scenario_type)
+        except ValueError:
+            return False
+        self.scenario = scenario_type
+        for junction in self.junctions.values():
+            junction.set_scenario(scenario)
+        return True
+    
+    def step(self, dt: float = 1.0 / FPS) -> None:
+        """
+        Avance tous les carrefours d'un pas, puis livre les véhicules transmis
+        """
+        deliver_handoffs(self.junctions, self.advance(dt))
+    
+    def advance(self, dt: float = 1.0 / FPS) -> List[Handoff]:
+        """
+        Avance les carrefours locaux d'un pas sans livrer les véhicules sortants
+
+        Returns:
+            List[Handoff]: Véhicules à livrer (éventuellement à une autre partition)
+        """
+        self.sim_time += dt
+        self.frame_count += 1
+        handoffs: List[Handoff] = []
+        for junction in self.junctions.values():
+            handoffs.extend(junction.step(self.sim_time, dt))
+        return handoffs
+    
+    def run_for(self, sim_seconds: float, dt: float = 1.0 / FPS) -> Dict[str, Any]:
+        """
+        Exécute le réseau sans affichage sur une durée de temps virtuel
+        """
+        if not self.junctions:
+            self.setup()
+        steps = int(round(sim_seconds / dt))
+        start = time.perf_counter()
+        for _ in range(steps):
+            self.step(dt)
+        wall_time = time.perf_counter() - start
+
+        stats = self.get_statistics()
+        stats["wall_time"] = wall_time
+        stats["speedup"] = steps * dt / wall_time if wall_time > 0 else float("inf")
+        return stats
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Retourne les statistiques agrégées du réseau
+        """
+        stats: Dict[str, Any] = {
+            "sim_time": self.sim_time,
+            "frame_count": self.frame_count,
+            "junctions": len(self.junctions),
+            "scenario": self.scenario
+        }
+        per_junction = [junction.get_statistics() for junction in self.junctions.values()]
+        for key in ("vehicle_count", "total_spawned", "total_exited",
+                    "total_handed_off", "total_received"):
+            stats[key] = sum(junction_stats[key] for junction_stats in per_junction)
+        return stats
+    
+    def get_vehicle_states(self) -> List[Tuple[int, int, float, float]]:
+        """
+        Retourne (carrefour, ID affiché, distance, vitesse) de tous les véhicules, triés par ID
+        """
+        states = []
+        for junction in self.junctions.values():
+            for vehicle in junction.vehicle_manager.get_all_vehicles():
+                states.append((junction.index, vehicle.display_id, vehicle.distance,
+                               vehicle.speed))
+        return sorted(states, key=lambda state: state[1])
+
+
+if __name__ == "__main__":
+    pass
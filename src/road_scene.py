@@ -1,131 +1,710 @@
 """
-Module de dessin du carrefour routier avec Turtle
+Module de dessin du carrefour routier (Turtle ou Canvas Tkinter)
 Responsable : Mbene Diagne
 """
 
 import turtle
 import time
-from typing import Tuple, List, Dict, Any, Optional
+import tkinter as tk
+from abc import ABC, abstractmethod
+from typing import Tuple, List, Dict, Any, Optional, Set
 from constants import *
+from snapshot import FrameSnapshot, interpolate_vehicles
 
-class RoadScene:
+# Taille (pixels) des formes de base de Turtle ("square", "circle")
+BASE_SHAPE_SIZE = 20
+
+# Diamètre d'un feu à l'écran
+LIGHT_DIAMETER = 30
+
+# Couleur d'un feu selon son état (la couleur exacte vient de l'instantané)
+LIGHT_STATE_COLORS = {
+    "ROUGE": RED,
+    "ORANGE": ORANGE,
+    "VERT": GREEN,
+    "ORANGE_CLIGNOTANT": ORANGE
+}
+
+# Déplacement (pixels) en dessous duquel un sprite n'est pas redessiné
+MIN_MOVE_PIXELS = 0.5
+
+# Contour des véhicules
+VEHICLE_OUTLINE = "black"
+
+# Tag des éléments du canvas formant le décor statique
+BACKGROUND_TAG = "background"
+
+
+def background_key() -> Tuple:
+    """
+    Dimensions et couleurs dont dépend le décor : il n'est reconstruit que si elles changent
+    """
+    return (SCREEN_WIDTH, SCREEN_HEIGHT, ROAD_WIDTH, INTERSECTION_SIZE, LANE_WIDTH,
+            SIDEWALK_WIDTH, GRASS_COLOR, ROAD_COLOR, SIDEWALK_COLOR, MARKING_COLOR)
+
+
+def vehicle_shape_name(vehicle_type: str, direction: str) -> str:
+    """
+    Nom de la forme Turtle enregistrée pour un type et un sens de véhicule
     """
-    Gère l'affichage graphique du carrefour routier
+    return f"vehicle_{vehicle_type}_{direction}"
+
+
+def vehicle_outline(vehicle_type: str, direction: str) -> Tuple[Tuple[float, float], ...]:
+    """
+    Polygone d'un véhicule centré sur l'origine, orienté dans son sens, avant biseauté
+
+    Les dimensions viennent de VEHICLE_CONFIG (width : longueur dans le sens
+    de la marche, height : largeur). Repère de la scène (y vers le haut).
+    """
+    config = VEHICLE_CONFIG[vehicle_type]
+    half_length, half_width = config["width"] / 2, config["height"] / 2
+    bevel = half_width / 2
+    dx, dy = DIRECTION_VECTORS[direction]
+    outline = ((-half_length, -half_width), (half_length - bevel, -half_width),
+               (half_length, -half_width + bevel), (half_length, half_width - bevel),
+               (half_length - bevel, half_width), (-half_length, half_width))
+    return tuple((along * dx - across * dy, along * dy + across * dx)
+                 for along, across in outline)
+
+
+def vehicle_shape(vehicle_type: str, direction: str) -> Tuple[Tuple[float, float], ...]:
+    """
+    Polygone d'un véhicule dans le repère des formes Turtle, pour un cap de 0
+
+    Le sprite n'a ainsi jamais à tourner.
+    """
+    # Cap 0 : l'axe y de la forme pointe vers l'est, l'axe x vers le sud
+    return tuple((-y, x) for x, y in vehicle_outline(vehicle_type, direction))
+
+
+def redraw_turtles(screen: turtle.TurtleScreen, sprites) -> None:
     """
-    
-    def __init__(self):
+    Redessine seulement les sprites donnés puis met à jour le canvas
+
+    S'appuie sur des internes de Turtle (_tracing, _drawturtle, _update) ;
+    s'ils manquent, l'écran entier est redessiné par screen.update().
+    """
+    try:
+        tracing = screen._tracing
+        drawers = [sprite._drawturtle for sprite in sprites]
+        refresh = screen._update
+    except AttributeError:
+        screen.update()
+        return
+    # _drawturtle() ne dessine que si le traçage est actif
+    screen._tracing = 1
+    try:
+        for draw in drawers:
+            draw()
+    finally:
+        screen._tracing = tracing
+    refresh()
+
+
+class SceneRenderer(ABC):
+    """
+    Affichage du carrefour, indépendant de la bibliothèque de dessin
+
+    La scène ne lit jamais l'état vivant de la simulation : elle dessine les
+    instantanés publiés par le thread de simulation (voir snapshot.py).
+
+    Le dessin est différentiel : seuls les véhicules apparus, disparus ou
+    déplacés d'au moins MIN_MOVE_PIXELS et les feux qui changent de couleur
+    coûtent une opération sur le canvas. Le décor est une couche du canvas
+    construite une fois. Les backends fournissent les opérations élémentaires
+    (_new_sprite, _place_sprite, _move_sprite, _hide_sprite, _set_light_color).
+    """
+
+    def __init__(self, canvas=None):
         """
         Initialise la scène graphique
+
+        Args:
+            canvas: Canvas Tkinter hôte (fenêtre autonome si absent)
+        """
+        self.canvas = canvas
+        self.cv = None
+        self.background_key: Optional[Tuple] = None
+        self.background_builds = 0
+        self.light_colors: Dict[Tuple[float, float], str] = {}
+        self.vehicle_sprites: Dict[int, Any] = {}
+        self.sprite_pool: List[Any] = []
+        self.sprites_created = 0
+        self.sprites_reused = 0
+        self.sprite_positions: Dict[int, Tuple[float, float]] = {}
+        self.frames_rendered = 0
+        self.canvas_ops = 0
+        self.total_canvas_ops = 0
+
+    @abstractmethod
+    def setup(self) -> bool:
+        """
+        Crée la surface de dessin et le décor
         """
         pass
-    
-    def setup(self) -> bool:
+
+    @abstractmethod
+    def update_display(self) -> None:
         """
-        Configure l'environnement Turtle
+        Envoie à l'écran les modifications de la frame
         """
         pass
-    
-    def draw_road_network(self) -> None:
+
+    @abstractmethod
+    def close(self) -> None:
         """
-        Dessine l'ensemble du réseau routier
+        Libère la surface de dessin
         """
         pass
-    
+
+    def draw_road_network(self) -> None:
+        """
+        Dessine l'ensemble du réseau routier
+
+        Le décor est une couche d'éléments du canvas (tag BACKGROUND_TAG)
+        construite une seule fois, sous les feux et les véhicules, puis jamais
+        modifiée : elle n'est reconstruite que si les dimensions changent.
+        """
+        key = background_key()
+        if key == self.background_key:
+            return
+        self.cv.delete(BACKGROUND_TAG)
+        self._draw_grass()
+        self._draw_roads()
+        self._draw_intersection()
+        self._draw_sidewalks()
+        self._draw_road_markings()
+        self.cv.tag_lower(BACKGROUND_TAG)
+        self.background_key = key
+        self.background_builds += 1
+
     def _draw_grass(self) -> None:
         """
         Dessine l'herbe autour des routes
         """
-        pass
-    
+        self._fill_rectangle(-SCREEN_WIDTH / 2, -SCREEN_HEIGHT / 2,
+                             SCREEN_WIDTH, SCREEN_HEIGHT, GRASS_COLOR)
+
     def _draw_roads(self) -> None:
         """
         Dessine les deux routes principales
         """
-        pass
-    
-    def _draw_single_road(self, start: Tuple[float, float], 
-                         length: float, width: float, 
+        self._draw_single_road((-SCREEN_WIDTH / 2, -ROAD_WIDTH / 2),
+                               SCREEN_WIDTH, ROAD_WIDTH, horizontal=True)
+        self._draw_single_road((-ROAD_WIDTH / 2, -SCREEN_HEIGHT / 2),
+                               SCREEN_HEIGHT, ROAD_WIDTH, horizontal=False)
+
+    def _draw_single_road(self, start: Tuple[float, float],
+                         length: float, width: float,
                          horizontal: bool = True) -> None:
         """
         Dessine une route individuelle
-        """
-        pass
-    
+
+        Args:
+            start: Coin inférieur gauche de la route
+        """
+        x, y = start
+        if horizontal:
+            self._fill_rectangle(x, y, length, width, ROAD_COLOR)
+        else:
+            self._fill_rectangle(x, y, width, length, ROAD_COLOR)
+
     def _draw_intersection(self) -> None:
         """
         Dessine l'intersection centrale
         """
-        pass
-    
+        half = INTERSECTION_SIZE / 2
+        self._fill_rectangle(-half, -half, INTERSECTION_SIZE, INTERSECTION_SIZE, ROAD_COLOR)
+
     def _draw_sidewalks(self) -> None:
         """
         Dessine les trottoirs
         """
-        pass
-    
-    def _draw_single_sidewalk(self, start: Tuple[float, float], 
-                             length: float, width: float, 
-                             horizontal: bool = True, 
+        half_road = ROAD_WIDTH / 2
+        half_x = SCREEN_WIDTH / 2 - half_road
+        half_y = SCREEN_HEIGHT / 2 - half_road
+        for x in (-SCREEN_WIDTH / 2, half_road):
+            self._draw_single_sidewalk((x, half_road), half_x, SIDEWALK_WIDTH,
+                                       horizontal=True, outer=True)
+            self._draw_single_sidewalk((x, -half_road), half_x, SIDEWALK_WIDTH,
+                                       horizontal=True, outer=False)
+        for y in (-SCREEN_HEIGHT / 2, half_road):
+            self._draw_single_sidewalk((half_road, y), half_y, SIDEWALK_WIDTH,
+                                       horizontal=False, outer=True)
+            self._draw_single_sidewalk((-half_road, y), half_y, SIDEWALK_WIDTH,
+                                       horizontal=False, outer=False)
+
+    def _draw_single_sidewalk(self, start: Tuple[float, float],
+                             length: float, width: float,
+                             horizontal: bool = True,
                              outer: bool = True) -> None:
         """
         Dessine un trottoir individuel
-        """
-        pass
-    
+
+        Args:
+            start: Point du bord de la route où commence le trottoir
+            outer: True si le trottoir est du côté des coordonnées positives
+        """
+        x, y = start
+        if horizontal:
+            self._fill_rectangle(x, y if outer else y - width, length, width, SIDEWALK_COLOR)
+        else:
+            self._fill_rectangle(x if outer else x - width, y, width, length, SIDEWALK_COLOR)
+
     def _draw_road_markings(self) -> None:
         """
         Dessine les marquages au sol (lignes)
         """
-        pass
-    
-    def _draw_dashed_line(self, start: Tuple[float, float], 
-                         end: Tuple[float, float], 
-                         dash_length: float = 20, 
+        half = INTERSECTION_SIZE / 2
+        half_width = SCREEN_WIDTH / 2
+        half_height = SCREEN_HEIGHT / 2
+        # Séparations entre les voies, hors du carrefour
+        for offset in (-LANE_WIDTH / 2, LANE_WIDTH / 2):
+            self._draw_dashed_line((-half_width, offset), (-half, offset))
+            self._draw_dashed_line((half, offset), (half_width, offset))
+            self._draw_dashed_line((offset, -half_height), (offset, -half))
+            self._draw_dashed_line((offset, half), (offset, half_height))
+
+        # Lignes d'arrêt au bord du carrefour
+        for start, end in (((-half, half), (half, half)), ((-half, -half), (half, -half)),
+                           ((half, -half), (half, half)), ((-half, -half), (-half, half))):
+            self.cv.create_line(start[0], -start[1], end[0], -end[1], fill=MARKING_COLOR,
+                                width=3, tags=BACKGROUND_TAG)
+
+    def _draw_dashed_line(self, start: Tuple[float, float],
+                         end: Tuple[float, float],
+                         dash_length: float = 20,
                          gap_length: float = 10) -> None:
         """
-        Dessine une ligne en pointillés
+        Dessine une ligne en pointillés (un seul élément du canvas)
         """
-        pass
-    
-    def update_display(self) -> None:
+        self.cv.create_line(start[0], -start[1], end[0], -end[1], fill=MARKING_COLOR,
+                            width=2, dash=(int(dash_length), int(gap_length)),
+                            tags=BACKGROUND_TAG)
+
+    def _fill_rectangle(self, x: float, y: float, width: float, height: float,
+                        color: str) -> None:
         """
-        Met à jour l'affichage de la scène
+        Remplit un rectangle à partir de son coin inférieur gauche
         """
-        pass
-    
+        # Repère Turtle (y vers le haut) -> repère du canvas (y vers le bas)
+        self.cv.create_rectangle(x, -(y + height), x + width, -y, fill=color, outline=color,
+                                 tags=BACKGROUND_TAG)
+
+    def render(self, previous: Optional[FrameSnapshot], current: FrameSnapshot,
+               alpha: float = 1.0) -> None:
+        """
+        Dessine un instantané, les véhicules étant interpolés depuis previous
+
+        Args:
+            alpha: Fraction du chemin entre previous (0) et current (1)
+        """
+        for light in current.lights:
+            self.draw_traffic_light(light.position, light.state, light.color)
+
+        visible = set()
+        for vehicle in interpolate_vehicles(previous, current, alpha):
+            self.draw_vehicle(vehicle.display_id, (vehicle.x, vehicle.y), vehicle.direction,
+                              vehicle.color, vehicle.vehicle_type)
+            visible.add(vehicle.display_id)
+        for vehicle_id in [vehicle_id for vehicle_id in self.vehicle_sprites
+                           if vehicle_id not in visible]:
+            self.remove_vehicle(vehicle_id)
+
+        self.update_display()
+        self.frames_rendered += 1
+
+    def get_render_statistics(self) -> Dict[str, Any]:
+        """
+        Retourne les compteurs de rendu (opérations du canvas par frame)
+        """
+        frames = self.frames_rendered
+        return {
+            "frames_rendered": frames,
+            "canvas_ops_last_frame": self.canvas_ops,
+            "canvas_ops_per_frame": self.total_canvas_ops / frames if frames else 0.0,
+            "sprites_visible": len(self.vehicle_sprites),
+            "sprites_created": self.sprites_created,
+            "sprites_reused": self.sprites_reused,
+            "sprite_pool_size": len(self.sprite_pool)
+        }
+
+    def reset(self) -> None:
+        """
+        Efface les véhicules ; le décor n'est pas redessiné
+        """
+        self.clear()
+        self.draw_road_network()
+        self.update_display()
+
     def clear(self) -> None:
         """
-        Efface tout le dessin
+        Efface les véhicules (le décor et les feux sont conservés)
+        """
+        for vehicle_id in list(self.vehicle_sprites):
+            self.remove_vehicle(vehicle_id)
+
+    def draw_traffic_light(self, position: Tuple[float, float],
+                          state: str, color: Optional[str] = None) -> None:
+        """
+        Dessine un feu tricolore
+
+        Args:
+            color: Couleur affichée (par ex. éteinte pendant le clignotement) ;
+                déduite de state si absente
+        """
+        color = color or LIGHT_STATE_COLORS.get(state, LIGHT_OFF)
+        if self.light_colors.get(position) != color:
+            self._set_light_color(position, color)
+            self.light_colors[position] = color
+
+    def draw_vehicle(self, vehicle_id: int, position: Tuple[float, float],
+                    direction: str, color: str,
+                    vehicle_type: str = "car") -> None:
+        """
+        Dessine un véhicule
+
+        Le sprite d'un véhicule déjà affiché est seulement déplacé ; un nouveau
+        véhicule reprend un sprite du pool et reçoit sa forme et sa couleur.
+        """
+        sprite = self.vehicle_sprites.get(vehicle_id)
+        if sprite is not None:
+            last = self.sprite_positions[vehicle_id]
+            if (abs(position[0] - last[0]) < MIN_MOVE_PIXELS
+                    and abs(position[1] - last[1]) < MIN_MOVE_PIXELS):
+                return
+            self._move_sprite(sprite, position, last)
+            self.sprite_positions[vehicle_id] = position
+            return
+
+        if self.sprite_pool:
+            sprite = self.sprite_pool.pop()
+            self.sprites_reused += 1
+        else:
+            sprite = self._new_sprite()
+            self.sprites_created += 1
+        self._place_sprite(sprite, position, vehicle_type, direction, color)
+        self.vehicle_sprites[vehicle_id] = sprite
+        self.sprite_positions[vehicle_id] = position
+
+    def remove_vehicle(self, vehicle_id: int) -> None:
+        """
+        Supprime un véhicule de l'affichage et rend son sprite au pool
+        """
+        sprite = self.vehicle_sprites.pop(vehicle_id, None)
+        if sprite is not None:
+            del self.sprite_positions[vehicle_id]
+            self._hide_sprite(sprite)
+            self.sprite_pool.append(sprite)
+
+    @abstractmethod
+    def _new_sprite(self) -> Any:
+        """
+        Crée un sprite de véhicule caché
         """
         pass
-    
-    def close(self) -> None:
+
+    @abstractmethod
+    def _place_sprite(self, sprite: Any, position: Tuple[float, float],
+                      vehicle_type: str, direction: str, color: str) -> None:
         """
-        Ferme proprement la fenêtre Turtle
+        Donne forme, couleur et position à un sprite et l'affiche
         """
         pass
-    
-    def draw_traffic_light(self, position: Tuple[float, float], 
-                          state: str) -> None:
+
+    @abstractmethod
+    def _move_sprite(self, sprite: Any, position: Tuple[float, float],
+                     last: Tuple[float, float]) -> None:
         """
-        Dessine un feu tricolore
+        Déplace un sprite affiché en last vers position
         """
         pass
-    
-    def draw_vehicle(self, vehicle_id: int, position: Tuple[float, float], 
-                    direction: str, color: str, 
-                    vehicle_type: str = "car") -> None:
+
+    @abstractmethod
+    def _hide_sprite(self, sprite: Any) -> None:
         """
-        Dessine un véhicule
+        Cache un sprite rendu au pool
         """
         pass
-    
-    def remove_vehicle(self, vehicle_id: int) -> None:
+
+    @abstractmethod
+    def _set_light_color(self, position: Tuple[float, float], color: str) -> None:
         """
-        Supprime un véhicule de l'affichage
+        Affiche le feu situé en position avec une couleur (le crée au besoin)
         """
         pass
 
 
+class RoadScene(SceneRenderer):
+    """
+    Affichage avec Turtle
+
+    Turtle est en tracer(0) : les sprites modifiés sont marqués « sales » et
+    update_display() ne redessine qu'eux avant l'unique mise à jour du canvas
+    de la frame.
+    """
+
+    def __init__(self, canvas=None):
+        """
+        Initialise la scène Turtle
+        """
+        super().__init__(canvas)
+        self.screen: Optional[turtle.TurtleScreen] = None
+        self.light_sprites: Dict[Tuple[float, float], turtle.RawTurtle] = {}
+        self._dirty: Set[turtle.RawTurtle] = set()
+
+    def setup(self) -> bool:
+        """
+        Configure l'environnement Turtle
+        """
+        try:
+            if self.canvas is not None:
+                self.screen = turtle.TurtleScreen(self.canvas)
+            else:
+                self.screen = turtle.Screen()
+                self.screen.setup(SCREEN_WIDTH, SCREEN_HEIGHT)
+                self.screen.title("Simulation feu tricolore - Thiès")
+            self.screen.tracer(0)
+            self.screen.bgcolor(BACKGROUND_COLOR)
+            self.cv = self.screen.getcanvas()
+            self._register_vehicle_shapes()
+            self.draw_road_network()
+            self.update_display()
+            return True
+        except Exception as e:
+            print(f"Erreur lors de la configuration de la scène: {e}")
+            return False
+
+    def _register_vehicle_shapes(self) -> None:
+        """
+        Enregistre une forme par type et par sens de véhicule
+        """
+        for vehicle_type in VEHICLE_CONFIG:
+            for direction in DIRECTION_VECTORS:
+                self.screen.register_shape(vehicle_shape_name(vehicle_type, direction),
+                                           vehicle_shape(vehicle_type, direction))
+
+    def update_display(self) -> None:
+        """
+        Met à jour l'affichage de la scène
+
+        Comme TurtleScreen.update(), mais seuls les sprites modifiés depuis la
+        frame précédente sont redessinés (un élément du canvas chacun).
+        """
+        if self.screen is None:
+            return
+        redraw_turtles(self.screen, self._dirty)
+        self.canvas_ops = len(self._dirty)
+        self.total_canvas_ops += self.canvas_ops
+        self._dirty.clear()
+
+    def close(self) -> None:
+        """
+        Ferme proprement la fenêtre Turtle
+        """
+        if self.screen is None:
+            return
+        try:
+            if self.canvas is None:
+                self.screen.bye()
+        except Exception:
+            pass
+        self.screen = None
+
+    def _new_sprite(self) -> turtle.RawTurtle:
+        """
+        Crée un sprite Turtle caché
+        """
+        # Sans historique d'annulation : un déplacement ne copie rien
+        sprite = turtle.RawTurtle(self.screen, visible=False, undobuffersize=0)
+        sprite.penup()
+        return sprite
+
+    def _place_sprite(self, sprite: turtle.RawTurtle, position: Tuple[float, float],
+                      vehicle_type: str, direction: str, color: str) -> None:
+        """
+        Donne forme, couleur et position à un sprite Turtle et l'affiche
+        """
+        sprite.shape(vehicle_shape_name(vehicle_type, direction))
+        sprite.color(VEHICLE_OUTLINE, color)
+        sprite.goto(position)
+        sprite.showturtle()
+        self._dirty.add(sprite)
+
+    def _move_sprite(self, sprite: turtle.RawTurtle, position: Tuple[float, float],
+                     last: Tuple[float, float]) -> None:
+        """
+        Déplace un sprite Turtle
+        """
+        sprite.goto(position)
+        self._dirty.add(sprite)
+
+    def _hide_sprite(self, sprite: turtle.RawTurtle) -> None:
+        """
+        Cache un sprite Turtle
+        """
+        sprite.hideturtle()
+        self._dirty.add(sprite)
+
+    def _set_light_color(self, position: Tuple[float, float], color: str) -> None:
+        """
+        Colore le sprite Turtle d'un feu
+        """
+        sprite = self.light_sprites.get(position)
+        if sprite is None:
+            sprite = turtle.RawTurtle(self.screen, shape="circle", visible=False,
+                                      undobuffersize=0)
+            sprite.penup()
+            sprite.shapesize(LIGHT_DIAMETER / BASE_SHAPE_SIZE, LIGHT_DIAMETER / BASE_SHAPE_SIZE, 2)
+            sprite.goto(position)
+            sprite.showturtle()
+            self.light_sprites[position] = sprite
+        sprite.color("black", color)
+        self._dirty.add(sprite)
+
+
+class CanvasScene(SceneRenderer):
+    """
+    Affichage direct sur un Canvas Tkinter, sans Turtle
+
+    Chaque véhicule est un polygone du canvas identifié par son ID d'élément :
+    coords() le place, itemconfig() change sa couleur ou le cache, et move()
+    le déplace d'un seul appel par frame. Les opérations sont envoyées au fil
+    de l'eau ; update_display() ne fait que la mise à jour du canvas.
+    """
+
+    def __init__(self, canvas=None):
+        """
+        Initialise la scène Canvas
+        """
+        super().__init__(canvas)
+        self.root: Optional[tk.Tk] = None
+        self.light_items: Dict[Tuple[float, float], int] = {}
+        # Polygone de chaque (type, sens) dans le repère du canvas (y vers le bas)
+        self.outlines = {
+            (vehicle_type, direction): tuple((x, -y) for x, y in
+                                             vehicle_outline(vehicle_type, direction))
+            for vehicle_type in VEHICLE_CONFIG for direction in DIRECTION_VECTORS
+        }
+        self._frame_ops = 0
+
+    def setup(self) -> bool:
+        """
+        Configure le canvas (origine au centre) et dessine le décor
+        """
+        try:
+            if self.canvas is None:
+                self.root = tk.Tk()
+                self.root.title("Simulation feu tricolore - Thiès")
+                self.canvas = tk.Canvas(self.root, width=SCREEN_WIDTH, height=SCREEN_HEIGHT,
+                                        highlightthickness=0)
+                self.canvas.pack()
+            self.cv = self.canvas
+            width, height = int(self.cv.cget("width")), int(self.cv.cget("height"))
+            self.cv.config(bg=BACKGROUND_COLOR, scrollregion=(
+                -width // 2, -height // 2, (width + 1) // 2, (height + 1) // 2))
+            self.draw_road_network()
+            self.update_display()
+            return True
+        except tk.TclError as e:
+            print(f"Erreur lors de la configuration de la scène: {e}")
+            return False
+
+    def update_display(self) -> None:
+        """
+        Met à jour l'affichage de la scène
+        """
+        if self.cv is None:
+            return
+        self.canvas_ops = self._frame_ops
+        self.total_canvas_ops += self._frame_ops
+        self._frame_ops = 0
+        self.cv.update_idletasks()
+
+    def close(self) -> None:
+        """
+        Ferme la fenêtre autonome éventuelle
+        """
+        if self.root is not None:
+            try:
+                self.root.destroy()
+            except tk.TclError:
+                pass
+            self.root = None
+        self.cv = None
+
+    def _new_sprite(self) -> int:
+        """
+        Crée un polygone de véhicule caché
+        """
+        return self.cv.create_polygon(0, 0, 0, 0, 0, 0, outline=VEHICLE_OUTLINE,
+                                      state=tk.HIDDEN)
+
+    def _place_sprite(self, sprite: int, position: Tuple[float, float],
+                      vehicle_type: str, direction: str, color: str) -> None:
+        """
+        Donne forme, couleur et position à un polygone et l'affiche
+        """
+        x, y = position[0], -position[1]
+        points = []
+        for dx, dy in self.outlines[(vehicle_type, direction)]:
+            points.append(x + dx)
+            points.append(y + dy)
+        self.cv.coords(sprite, *points)
+        self.cv.itemconfig(sprite, fill=color, state=tk.NORMAL)
+        self._frame_ops += 2
+
+    def _move_sprite(self, sprite: int, position: Tuple[float, float],
+                     last: Tuple[float, float]) -> None:
+        """
+        Déplace un polygone du chemin parcouru depuis sa dernière position
+        """
+        self.cv.move(sprite, position[0] - last[0], last[1] - position[1])
+        self._frame_ops += 1
+
+    def _hide_sprite(self, sprite: int) -> None:
+        """
+        Cache un polygone
+        """
+        self.cv.itemconfig(sprite, state=tk.HIDDEN)
+        self._frame_ops += 1
+
+    def _set_light_color(self, position: Tuple[float, float], color: str) -> None:
+        """
+        Colore l'ovale d'un feu
+        """
+        item = self.light_items.get(position)
+        if item is None:
+            radius = LIGHT_DIAMETER / 2
+            x, y = position[0], -position[1]
+            item = self.cv.create_oval(x - radius, y - radius, x + radius, y + radius,
+                                       outline="black", width=2)
+            self.light_items[position] = item
+        self.cv.itemconfig(item, fill=color)
+        self._frame_ops += 1
+
+
+# Backends d'affichage disponibles (option --renderer de main.py)
+RENDERERS = {
+    "turtle": RoadScene,
+    "canvas": CanvasScene
+}
+
+
+def create_scene(renderer: str = "turtle", canvas=None) -> SceneRenderer:
+    """
+    Crée la scène du backend demandé
+
+    Args:
+        renderer: Nom du backend ("turtle" ou "canvas")
+        canvas: Canvas Tkinter hôte
+    """
+    try:
+        return RENDERERS[renderer](canvas)
+    except KeyError:
+        raise ValueError(f"Backend d'affichage inconnu: {renderer}")
+
+
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    pass
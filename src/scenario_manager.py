@@ -26,7 +26,17 @@ class Scenario(ABC):
         """
         Initialise un scénario
         """
-        pass
+        self.name = name
+        self.traffic_light_timings = TRAFFIC_LIGHT_TIMINGS[name.value]
+        self.spawn_rate = SPAWN_RATES[name.value]
+        self.max_vehicles = MAX_VEHICLES[name.value]
+        self.description = ""
+    
+    def get_name(self) -> str:
+        """
+        Retourne le nom du scénario
+        """
+        return self.name.value
     
     @abstractmethod
     def apply_traffic_light_settings(self, traffic_light) -> None:
@@ -66,7 +76,33 @@ class NormalScenario(Scenario):
         """
         Initialise le scénario normal
         """
-        pass
+        super().__init__(ScenarioType.NORMAL)
+        self.description = "Circulation standard pour une journée typique"
+    
+    def apply_traffic_light_settings(self, traffic_light) -> None:
+        """
+        Applique les paramètres du scénario aux feux
+        """
+        traffic_light.set_scenario(self.name.value)
+        traffic_light.set_automatic(True)
+    
+    def apply_vehicle_settings(self, vehicle_manager) -> None:
+        """
+        Applique les paramètres du scénario aux véhicules
+        """
+        vehicle_manager.set_scenario(self.name.value)
+    
+    def get_spawn_rate(self) -> float:
+        """
+        Retourne le taux d'apparition des véhicules
+        """
+        return self.spawn_rate
+    
+    def get_max_vehicles(self) -> int:
+        """
+        Retourne le nombre maximum de véhicules
+        """
+        return self.max_vehicles
 
 
 class RushHourScenario(Scenario):
@@ -78,7 +114,33 @@ class RushHourScenario(Scenario):
         """
         Initialise le scénario heure de pointe
         """
-        pass
+        super().__init__(ScenarioType.RUSH_HOUR)
+        self.description = "Trafic dense avec des phases vertes allongées"
+    
+    def apply_traffic_light_settings(self, traffic_light) -> None:
+        """
+        Applique les paramètres du scénario aux feux
+        """
+        traffic_light.set_scenario(self.name.value)
+        traffic_light.set_automatic(True)
+    
+    def apply_vehicle_settings(self, vehicle_manager) -> None:
+        """
+        Applique les paramètres du scénario aux véhicules
+        """
+        vehicle_manager.set_scenario(self.name.value)
+    
+    def get_spawn_rate(self) -> float:
+        """
+        Retourne le taux d'apparition des véhicules
+        """
+        return self.spawn_rate
+    
+    def get_max_vehicles(self) -> int:
+        """
+        Retourne le nombre maximum de véhicules
+        """
+        return self.max_vehicles
 
 
 class NightScenario(Scenario):
@@ -90,7 +152,33 @@ class NightScenario(Scenario):
         """
         Initialise le scénario nuit
         """
-        pass
+        super().__init__(ScenarioType.NIGHT)
+        self.description = "Trafic faible et feux orange clignotants"
+    
+    def apply_traffic_light_settings(self, traffic_light) -> None:
+        """
+        Applique les paramètres du scénario aux feux
+        """
+        traffic_light.set_scenario(self.name.value)
+        traffic_light.set_automatic(True)
+    
+    def apply_vehicle_settings(self, vehicle_manager) -> None:
+        """
+        Applique les paramètres du scénario aux véhicules
+        """
+        vehicle_manager.set_scenario(self.name.value)
+    
+    def get_spawn_rate(self) -> float:
+        """
+        Retourne le taux d'apparition des véhicules
+        """
+        return self.spawn_rate
+    
+    def get_max_vehicles(self) -> int:
+        """
+        Retourne le nombre maximum de véhicules
+        """
+        return self.max_vehicles
 
 
 class ManualScenario(Scenario):
@@ -102,7 +190,33 @@ class ManualScenario(Scenario):
         """
         Initialise le scénario manuel
         """
-        pass
+        super().__init__(ScenarioType.MANUAL)
+        self.description = "Feux contrôlés par l'utilisateur"
+    
+    def apply_traffic_light_settings(self, traffic_light) -> None:
+        """
+        Applique les paramètres du scénario aux feux
+        """
+        traffic_light.set_scenario(self.name.value)
+        traffic_light.set_automatic(False)
+    
+    def apply_vehicle_settings(self, vehicle_manager) -> None:
+        """
+        Applique les paramètres du scénario aux véhicules
+        """
+        vehicle_manager.set_scenario(self.name.value)
+    
+    def get_spawn_rate(self) -> float:
+        """
+        Retourne le taux d'apparition des véhicules
+        """
+        return self.spawn_rate
+    
+    def get_max_vehicles(self) -> int:
+        """
+        Retourne le nombre maximum de véhicules
+        """
+        return self.max_vehicles
 
 
 class ScenarioManager:
@@ -114,37 +228,58 @@ class ScenarioManager:
         """
         Initialise le gestionnaire de scénarios
         """
-        pass
+        self.logger = logger
+        self.scenarios: Dict[ScenarioType, Scenario] = {}
+        self.current_scenario: Optional[Scenario] = None
     
     def setup(self) -> None:
         """
         Configure le gestionnaire
         """
-        pass
+        self.scenarios = {
+            ScenarioType.NORMAL: NormalScenario(),
+            ScenarioType.RUSH_HOUR: RushHourScenario(),
+            ScenarioType.NIGHT: NightScenario(),
+            ScenarioType.MANUAL: ManualScenario()
+        }
+        self.current_scenario = self.scenarios[ScenarioType.NORMAL]
     
     def change_scenario(self, scenario_type: ScenarioType) -> bool:
         """
         Change le scénario actuel
         """
-        pass
+        if scenario_type not in self.scenarios:
+            return False
+
+        old_name = self.get_current_scenario_name()
+        self.current_scenario = self.scenarios[scenario_type]
+
+        if self.logger:
+            self.logger.log_scenario_change(old_name, scenario_type.value)
+        return True
     
     def get_current_scenario(self) -> Scenario:
         """
         Retourne le scénario actuel
         """
-        pass
+        return self.current_scenario
     
     def get_current_scenario_name(self) -> str:
         """
         Retourne le nom du scénario actuel
         """
-        pass
+        if self.current_scenario is None:
+            return ScenarioType.NORMAL.value
+        return self.current_scenario.get_name()
     
     def apply_current_scenario(self, traffic_light, vehicle_manager) -> None:
         """
         Applique le scénario actuel aux composants
         """
-        pass
+        if self.current_scenario is None:
+            return
+        self.current_scenario.apply_traffic_light_settings(traffic_light)
+        self.current_scenario.apply_vehicle_settings(vehicle_manager)
 
 
 if __name__ == "__main__":
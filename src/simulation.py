@@ -4,105 +4,440 @@ Responsable : Ndeye Khady Syll
 """
 
 import time
+import random
 import threading
-from typing import Optional
+from typing import Optional, Dict, Any, List, Tuple
 from constants import *
+from traffic_light import TrafficLightManager, TrafficLightState
+from vehicle import VehicleManager
+from scenario_manager import ScenarioManager, ScenarioType
+from arrivals import ArrivalSchedule, arrival_rate
+from snapshot import FrameSnapshot, LightSnapshot, SnapshotBuffer, VehicleSnapshot
+from frame_timing import FrameProfiler
 
 class Simulation:
     """
     Classe principale qui orchestre toute la simulation
     """
     
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, seed: Optional[int] = None, headless: bool = False):
         """
         Initialise la simulation
+
+        Args:
+            logger: EventLogger optionnel
+            seed: Graine du générateur aléatoire (reproductibilité)
+            headless: Si True, la boucle ne publie aucun instantané pour l'affichage
         """
-        pass
+        self.logger = logger
+        self.seed = seed
+        self.headless = headless
+        self.rng = random.Random(seed)
+
+        self.traffic_light_manager: Optional[TrafficLightManager] = None
+        self.vehicle_manager: Optional[VehicleManager] = None
+        self.scenario_manager: Optional[ScenarioManager] = None
+        self.arrivals: Optional[ArrivalSchedule] = None
+
+        # Instantanés lus par l'affichage (autre thread), jamais l'état vivant
+        self.snapshots = SnapshotBuffer()
+        # Temps par phase de la boucle temps réel (et du rendu, côté interface)
+        self.frame_profiler = FrameProfiler()
+
+        self.running = False
+        self.paused = False
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.RLock()
+
+        # Horloge virtuelle : avance uniquement par pas de simulation
+        self.sim_time = 0.0
+        self.frame_count = 0
+        self.current_light_state: Optional[str] = None
+        self._pending_removals: List[int] = []
     
     def setup(self) -> bool:
         """
         Configure tous les composants de la simulation
         """
-        pass
+        try:
+            self.traffic_light_manager = TrafficLightManager()
+            self.traffic_light_manager.setup_lights()
+
+            self.vehicle_manager = VehicleManager(self.logger, rng=self.rng)
+            self.vehicle_manager.setup()
+
+            self.scenario_manager = ScenarioManager(self.logger)
+            self.scenario_manager.setup()
+            self.scenario_manager.apply_current_scenario(self.traffic_light_manager,
+                                                         self.vehicle_manager)
+            self.current_light_state = self.traffic_light_manager.get_current_state()
+
+            # Générateur dédié : les arrivées ne dépendent pas des tirages des véhicules
+            self.arrivals = ArrivalSchedule(self.vehicle_manager.get_entry_lanes(),
+                                            self._arrival_rate(),
+                                            random.Random(self.rng.getrandbits(64)))
+            self.publish_snapshot()
+            return True
+        except Exception as e:
+            print(f"Erreur lors de la configuration de la simulation: {e}")
+            if self.logger:
+                self.logger.log_error(str(e), "simulation")
+            return False
     
     def start(self) -> bool:
         """
         Démarre la simulation
         """
-        pass
+        if self.vehicle_manager is None and not self.setup():
+            return False
+
+        if self.running:
+            # Reprise après une pause
+            self.paused = False
+            return True
+
+        self.running = True
+        self.paused = False
+        self.thread = threading.Thread(target=self._simulation_loop, daemon=True)
+        self.thread.start()
+
+        if self.logger:
+            self.logger.log_simulation_event("START")
+        return True
     
     def pause(self) -> None:
         """
         Met en pause la simulation
         """
-        pass
+        if self.running and not self.paused:
+            self.paused = True
+            if self.logger:
+                self.logger.log_simulation_event("PAUSE")
     
     def stop(self) -> None:
         """
         Arrête la simulation
         """
-        pass
+        if not self.running:
+            return
+
+        self.running = False
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=1.0)
+        self.thread = None
+
+        if self.logger:
+            self.logger.log_simulation_event("STOP")
     
     def reset(self) -> None:
         """
         Réinitialise la simulation
         """
-        pass
+        self.stop()
+        if self.logger:
+            self.logger.end_trajectories()
+        with self.lock:
+            self.sim_time = 0.0
+            self.frame_count = 0
+            self._pending_removals = []
+            self.vehicle_manager.setup()
+            self.traffic_light_manager.setup_lights()
+            self.scenario_manager.apply_current_scenario(self.traffic_light_manager,
+                                                         self.vehicle_manager)
+            self.current_light_state = self.traffic_light_manager.get_current_state()
+            self.arrivals.reset(0.0, rate=self._arrival_rate())
+            self.snapshots.clear()
+            self.publish_snapshot()
+
+        if self.logger:
+            self.logger.log_simulation_event("RESET")
     
     def change_scenario(self, scenario_type: str) -> bool:
         """
         Change le scénario de circulation
         """
-        pass
+        try:
+            scenario = ScenarioType(scenario_type)
+        except ValueError:
+            return False
+
+        with self.lock:
+            if not self.scenario_manager.change_scenario(scenario):
+                return False
+            self.scenario_manager.apply_current_scenario(self.traffic_light_manager,
+                                                         self.vehicle_manager)
+            self.current_light_state = self.traffic_light_manager.get_current_state()
+            self.arrivals.reset(self.sim_time, rate=self._arrival_rate())
+            self.publish_snapshot()
+        return True
+    
+    def set_demand_profile(self, profile: Optional[List[Tuple[float, float]]]) -> None:
+        """
+        Module la demande dans le temps
+
+        Args:
+            profile: Paliers [(instant en secondes, multiplicateur du débit), ...],
+                None pour une demande constante
+        """
+        with self.lock:
+            self.arrivals.profile = sorted(profile) if profile else None
+            self.arrivals.reset(self.sim_time)
+    
+    def set_traffic_light_timings(self, timings: Dict[str, float]) -> None:
+        """
+        Remplace les durées des phases des feux (en secondes)
+
+        Args:
+            timings: Durées à modifier, par ex. {"green": 20, "red": 6}
+        """
+        with self.lock:
+            self.traffic_light_manager.set_timings(timings)
     
     def change_traffic_light_manual(self, state: str) -> None:
         """
         Change manuellement l'état du feu
+
+        Args:
+            state: Nom ("RED") ou valeur ("ROUGE") d'un TrafficLightState
         """
-        pass
+        try:
+            new_state = TrafficLightState[state.upper()]
+        except KeyError:
+            new_state = TrafficLightState(state.upper())
+
+        with self.lock:
+            previous = self.current_light_state
+            self.traffic_light_manager.change_all_states(new_state, manual=True)
+            self.current_light_state = new_state.value
+            self.publish_snapshot()
+
+        if self.logger:
+            self.logger.log_traffic_light_event(previous, new_state.value, manual=True)
     
     def is_running(self) -> bool:
         """
         Vérifie si la simulation est en cours
         """
-        pass
+        return self.running
     
     def is_paused(self) -> bool:
         """
         Vérifie si la simulation est en pause
         """
-        pass
+        return self.paused
     
-    def get_statistics(self) -> Dict:
+    def get_statistics(self) -> Dict[str, Any]:
         """
         Retourne des statistiques sur la simulation
         """
-        pass
+        stats: Dict[str, Any] = {
+            "sim_time": self.sim_time,
+            "frame_count": self.frame_count,
+            "running": self.running,
+            "paused": self.paused,
+            "traffic_light_state": self.current_light_state
+        }
+        if self.vehicle_manager:
+            stats["vehicle_count"] = self.vehicle_manager.get_vehicle_count()
+            stats["total_spawned"] = self.vehicle_manager.total_spawned
+            stats["total_removed"] = self.vehicle_manager.total_removed
+            stats.update(self.vehicle_manager.get_pool_statistics())
+        if self.scenario_manager:
+            stats["scenario"] = self.scenario_manager.get_current_scenario_name()
+        stats["frame_timings"] = self.frame_profiler.get_statistics()
+        stats["frames_over_budget"] = self.frame_profiler.frames_over_budget
+        return stats
+    
+    def run_for(self, sim_seconds: float, dt: float = 1.0 / FPS) -> Dict[str, Any]:
+        """
+        Exécute la simulation sans affichage sur une durée de temps virtuel
+
+        Aucun dessin, aucune interface et aucune attente : l'horloge de
+        simulation avance de dt à chaque pas, aussi vite que possible.
+
+        Args:
+            sim_seconds: Durée de simulation en secondes
+            dt: Pas de temps fixe en secondes
+
+        Returns:
+            Dict: Statistiques de fin de simulation et vitesse obtenue
+        """
+        if dt <= 0:
+            raise ValueError("dt doit être strictement positif")
+        if self.vehicle_manager is None and not self.setup():
+            raise RuntimeError("Impossible de configurer la simulation")
+
+        steps = int(round(sim_seconds / dt))
+        start = time.perf_counter()
+        for _ in range(steps):
+            self._step(dt)
+        wall_time = time.perf_counter() - start
+
+        stats = self.get_statistics()
+        stats["wall_time"] = wall_time
+        stats["speedup"] = steps * dt / wall_time if wall_time > 0 else float("inf")
+        return stats
+    
+    def save_checkpoint(self, path: str) -> int:
+        """
+        Sauvegarde l'état complet de la simulation (format binaire versionné)
+
+        Returns:
+            int: Taille du fichier en octets
+        """
+        from checkpoint import save_checkpoint
+        return save_checkpoint(self, path)
+    
+    def load_checkpoint(self, path: str) -> None:
+        """
+        Restaure un état sauvegardé par save_checkpoint (sans phase de chauffe)
+        """
+        from checkpoint import load_checkpoint
+        load_checkpoint(self, path)
+    
+    def capture_snapshot(self) -> FrameSnapshot:
+        """
+        Copie l'état affichable de la simulation dans un instantané immuable
+        """
+        with self.lock:
+            lights = tuple(LightSnapshot(light.position, light.get_current_state(),
+                                         light.get_color())
+                           for light in self.traffic_light_manager.lights)
+            vehicles = tuple(VehicleSnapshot(vehicle.display_id, vehicle.x, vehicle.y,
+                                             vehicle.direction, vehicle.color,
+                                             vehicle.vehicle_type.value)
+                             for vehicle in self.vehicle_manager.get_all_vehicles())
+            return FrameSnapshot(self.sim_time, self.frame_count, time.perf_counter(),
+                                 self.current_light_state,
+                                 self.scenario_manager.get_current_scenario_name(),
+                                 lights, vehicles)
+    
+    def publish_snapshot(self) -> None:
+        """
+        Publie l'état courant pour l'affichage
+        """
+        if not self.headless:
+            self.snapshots.publish(self.capture_snapshot())
+    
+    def _step(self, dt: float, profiler: Optional[FrameProfiler] = None) -> None:
+        """
+        Avance la simulation d'un pas de temps fixe
+
+        Args:
+            profiler: Si fourni, reçoit la durée de chaque phase du pas
+        """
+        with self.lock:
+            self.sim_time += dt
+            self.frame_count += 1
+            if profiler is None:
+                self._update_components(dt)
+                self._handle_vehicle_spawning(dt)
+                self._handle_vehicle_removal()
+                return
+
+            clock = time.perf_counter
+            start = clock()
+            self._update_components(dt)
+            updated = clock()
+            self._handle_vehicle_spawning(dt)
+            spawned = clock()
+            self._handle_vehicle_removal()
+            removed = clock()
+        profiler.record("update", updated - start)
+        profiler.record("spawn", spawned - updated)
+        profiler.record("removal", removed - spawned)
     
     def _simulation_loop(self) -> None:
         """
-        Boucle principale de simulation
+        Boucle principale de simulation, à cadence fixe
+
+        La boucle ne dessine rien : elle publie un instantané après chaque pas
+        et l'affichage le lit à son propre rythme, sans jamais la bloquer.
         """
-        pass
+        interval = UPDATE_INTERVAL / 1000.0
+        dt = SIMULATION_SPEED / FPS
+        clock = time.perf_counter
+        profiler = self.frame_profiler
+        next_frame = clock()
+
+        while self.running:
+            if not self.paused:
+                if not profiler.enabled:
+                    self._step(dt)
+                    self.publish_snapshot()
+                else:
+                    frame_start = clock()
+                    log_time = self.logger.log_time if self.logger else 0.0
+                    self._step(dt, profiler)
+                    published = clock()
+                    self.publish_snapshot()
+                    frame_end = clock()
+                    profiler.record("publish", frame_end - published)
+                    if self.logger:
+                        profiler.record("log", self.logger.log_time - log_time)
+                    profiler.record_frame(frame_end - frame_start)
+
+            next_frame += interval
+            delay = next_frame - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # En retard : on repart de maintenant plutôt que d'accumuler
+                next_frame = time.perf_counter()
     
-    def _update_components(self) -> None:
+    def _update_components(self, dt: float = 1.0 / FPS) -> None:
         """
         Met à jour tous les composants
         """
-        pass
+        self.traffic_light_manager.update_all(self.sim_time)
+        new_state = self.traffic_light_manager.get_current_state()
+        if new_state != self.current_light_state:
+            if self.logger:
+                self.logger.log_traffic_light_event(self.current_light_state, new_state)
+            self.current_light_state = new_state
+
+        self._pending_removals = self.vehicle_manager.update(self.current_light_state, dt)
+        if self.logger and self.logger.log_positions:
+            self._log_positions()
+    
+    def _log_positions(self) -> None:
+        """
+        Transmet la position de chaque véhicule au logger (images clés seulement)
+        """
+        log = self.logger.log_vehicle_position
+        for vehicle in self.vehicle_manager.vehicles.values():
+            log(vehicle.display_id, self.sim_time, vehicle.x, vehicle.y, vehicle.speed,
+                vehicle.state.value)
+    
+    def _handle_vehicle_spawning(self, dt: float = 1.0 / FPS) -> None:
+        """
+        Fait entrer les véhicules dont l'arrivée est échue
+
+        Les instants d'arrivée sont tirés d'avance (ArrivalSchedule) : le coût
+        suit le nombre d'arrivées et la demande ne dépend pas de dt.
+        """
+        due = self.arrivals.pop_due(self.sim_time)
+        if not due:
+            return
+        scenario = self.scenario_manager.get_current_scenario_name()
+        for direction, lane_id in due:
+            self.vehicle_manager.spawn_vehicle(scenario, direction, lane_id)
     
-    def _handle_vehicle_spawning(self) -> None:
+    def _arrival_rate(self) -> float:
         """
-        Gère l'apparition de nouveaux véhicules
+        Débit d'arrivée (véhicules/s) du scénario courant
         """
-        pass
+        # SPAWN_RATES est une probabilité par frame à FPS images par seconde
+        return arrival_rate(self.scenario_manager.get_current_scenario().get_spawn_rate())
     
     def _handle_vehicle_removal(self) -> None:
         """
         Gère la suppression des véhicules
         """
-        pass
+        for vehicle_id in self._pending_removals:
+            self.vehicle_manager.remove_vehicle(vehicle_id)
+        self._pending_removals = []
 
 
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    pass
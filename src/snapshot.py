@@ -0,0 +1,131 @@
+"""
+Instantanés immuables de l'état de la simulation, publiés pour l'affichage
+Responsable : Ndeye Khady Syll
+
+Le thread de simulation publie un FrameSnapshot après chaque pas ; le thread
+d'affichage lit les deux derniers et interpole les positions entre eux. Les
+instantanés ne sont jamais modifiés après publication : la lecture ne prend
+le verrou que le temps d'échanger deux références.
+"""
+
+import threading
+from typing import List, NamedTuple, Optional, Tuple
+
+
+class VehicleSnapshot(NamedTuple):
+    """
+    État affichable d'un véhicule
+    """
+    display_id: int
+    x: float
+    y: float
+    direction: str
+    color: str
+    vehicle_type: str
+
+
+class LightSnapshot(NamedTuple):
+    """
+    État affichable d'un feu
+    """
+    position: Tuple[float, float]
+    state: str
+    color: str
+
+
+class FrameSnapshot(NamedTuple):
+    """
+    État affichable de la simulation après un pas
+    """
+    sim_time: float
+    frame_count: int
+    wall_time: float
+    light_state: Optional[str]
+    scenario: Optional[str]
+    lights: Tuple[LightSnapshot, ...]
+    vehicles: Tuple[VehicleSnapshot, ...]
+
+
+class SnapshotBuffer:
+    """
+    Double tampon d'instantanés : le dernier publié et celui d'avant
+    """
+
+    def __init__(self):
+        """
+        Initialise un tampon vide
+        """
+        self._lock = threading.Lock()
+        self._previous: Optional[FrameSnapshot] = None
+        self._current: Optional[FrameSnapshot] = None
+        self.published = 0
+
+    def publish(self, snapshot: FrameSnapshot) -> None:
+        """
+        Publie un nouvel instantané (appelé par le thread de simulation)
+        """
+        with self._lock:
+            self._previous, self._current = self._current, snapshot
+            self.published += 1
+
+    def read(self) -> Tuple[Optional[FrameSnapshot], Optional[FrameSnapshot]]:
+        """
+        Retourne (avant-dernier, dernier) instantané publié
+        """
+        with self._lock:
+            return self._previous, self._current
+
+    def latest(self) -> Optional[FrameSnapshot]:
+        """
+        Retourne le dernier instantané publié
+        """
+        return self._current
+
+    def clear(self) -> None:
+        """
+        Oublie les instantanés publiés (réinitialisation)
+        """
+        with self._lock:
+            self._previous = self._current = None
+
+
+def interpolation_alpha(previous: Optional[FrameSnapshot], current: Optional[FrameSnapshot],
+                        now: float) -> float:
+    """
+    Fraction du chemin entre previous et current à afficher à l'instant now
+
+    L'affichage a un pas de retard : il atteint current quand le pas suivant
+    devrait être publié. Sans nouvel instantané (pause), il reste sur current.
+    """
+    if previous is None or current is None:
+        return 1.0
+    span = current.wall_time - previous.wall_time
+    if span <= 0:
+        return 1.0
+    return min(1.0, max(0.0, (now - current.wall_time) / span))
+
+
+def interpolate_vehicles(previous: Optional[FrameSnapshot], current: FrameSnapshot,
+                         alpha: float) -> List[VehicleSnapshot]:
+    """
+    Retourne les véhicules de current à leur position interpolée
+
+    Un véhicule absent de previous (il vient d'apparaître) est affiché à sa
+    position courante.
+    """
+    if previous is None or alpha >= 1.0:
+        return list(current.vehicles)
+
+    before = {vehicle.display_id: vehicle for vehicle in previous.vehicles}
+    vehicles = []
+    for vehicle in current.vehicles:
+        old = before.get(vehicle.display_id)
+        if old is not None:
+            vehicle = vehicle._replace(x=old.x + (vehicle.x - old.x) * alpha,
+                                       y=old.y + (vehicle.y - old.y) * alpha)
+        vehicles.append(vehicle)
+    return vehicles
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,131 @@
+"""
+Index spatial en grille uniforme pour les requêtes de voisinage
+Responsable : Ndeye Khady Syll
+"""
+
+import math
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from constants import *
+
+class SpatialGrid:
+    """
+    Hachage spatial uniforme sur le monde SCREEN_WIDTH x SCREEN_HEIGHT
+
+    Le monde est centré sur l'origine (repère Turtle). Chaque cellule garde
+    l'ensemble des IDs qu'elle contient ; un véhicule ne change d'ensemble
+    que lorsqu'il franchit une frontière de cellule. Les positions hors du
+    monde sont rattachées à la cellule de bord la plus proche.
+    """
+    
+    def __init__(self, cell_size: float = LANE_WIDTH,
+                 width: float = SCREEN_WIDTH, height: float = SCREEN_HEIGHT):
+        """
+        Initialise la grille
+
+        Args:
+            cell_size: Côté d'une cellule (une largeur de voie par défaut)
+        """
+        self.cell_size = cell_size
+        self.width = width
+        self.height = height
+        self.columns = max(1, math.ceil(width / cell_size))
+        self.rows = max(1, math.ceil(height / cell_size))
+        self.cells: List[Set[int]] = [set() for _ in range(self.columns * self.rows)]
+        self.cell_by_id: Dict[int, int] = {}
+    
+    def __len__(self) -> int:
+        """
+        Retourne le nombre d'objets indexés
+        """
+        return len(self.cell_by_id)
+    
+    def cell_of(self, x: float, y: float) -> int:
+        """
+        Retourne l'index de la cellule contenant un point
+        """
+        column = min(self.columns - 1, max(0, int((x + self.width / 2) // self.cell_size)))
+        row = min(self.rows - 1, max(0, int((y + self.height / 2) // self.cell_size)))
+        return row * self.columns + column
+    
+    def update(self, object_id: int, x: float, y: float) -> None:
+        """
+        Insère ou déplace un objet (sans effet s'il reste dans sa cellule)
+        """
+        self.move(object_id, self.cell_of(x, y))
+    
+    def move(self, object_id: int, cell: int) -> None:
+        """
+        Place un objet dans une cellule déjà calculée
+        """
+        current = self.cell_by_id.get(object_id)
+        if current == cell:
+            return
+        if current is not None:
+            self.cells[current].discard(object_id)
+        self.cells[cell].add(object_id)
+        self.cell_by_id[object_id] = cell
+    
+    def remove(self, object_id: int) -> bool:
+        """
+        Retire un objet de la grille
+        """
+        cell = self.cell_by_id.pop(object_id, None)
+        if cell is None:
+            return False
+        self.cells[cell].discard(object_id)
+        return True
+    
+    def clear(self) -> None:
+        """
+        Vide la grille
+        """
+        for cell in self.cells:
+            cell.clear()
+        self.cell_by_id.clear()
+    
+    def query_box(self, x_min: float, y_min: float, x_max: float, y_max: float,
+                  position_of: Optional[Callable[[int], Tuple[float, float]]] = None) -> List[int]:
+        """
+        Retourne les objets situés dans un rectangle
+
+        Args:
+            position_of: Fonction donnant la position d'un objet ; si absente,
+                tous les objets des cellules touchées sont retournés
+        """
+        first = self.cell_of(x_min, y_min)
+        last = self.cell_of(x_max, y_max)
+        first_row, first_column = divmod(first, self.columns)
+        last_row, last_column = divmod(last, self.columns)
+
+        found = []
+        for row in range(first_row, last_row + 1):
+            base = row * self.columns
+            for column in range(first_column, last_column + 1):
+                found.extend(self.cells[base + column])
+
+        if position_of is None:
+            return found
+        result = []
+        for object_id in found:
+            x, y = position_of(object_id)
+            if x_min <= x <= x_max and y_min <= y <= y_max:
+                result.append(object_id)
+        return result
+    
+    def query_radius(self, x: float, y: float, radius: float,
+                     position_of: Callable[[int], Tuple[float, float]]) -> List[int]:
+        """
+        Retourne les objets à une distance inférieure ou égale à radius d'un point
+        """
+        candidates = self.query_box(x - radius, y - radius, x + radius, y + radius)
+        radius_squared = radius * radius
+        result = []
+        for object_id in candidates:
+            other_x, other_y = position_of(object_id)
+            if (other_x - x) ** 2 + (other_y - y) ** 2 <= radius_squared:
+                result.append(object_id)
+        return result
+
+
+if __name__ == "__main__":
+    pass
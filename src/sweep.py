@@ -0,0 +1,313 @@
+"""
+Balayage de paramètres (scénario × durées des feux × graine) sur plusieurs processus
+Responsable : Modou Sarr
+
+Usage :
+    python src/sweep.py --scenarios normal rush_hour night --seeds 0-49 \
+        --timings green=20,orange=3,red=6 --duration 600
+
+Chaque exécution terminée est ajoutée aussitôt au fichier de résultats
+(JSON lines) ; relancer la même commande ne refait que les exécutions
+manquantes. Les KPI agrégés par configuration sont écrits dans un CSV.
+"""
+
+import argparse
+import csv
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set
+
+# Ajouter le répertoire courant au path Python
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from constants import *
+from simulation import Simulation
+
+# Indicateurs agrégés dans le fichier de synthèse
+KPI_NAMES = (
+    "throughput_per_hour", "mean_vehicles", "mean_stopped",
+    "max_stopped", "mean_speed", "speedup"
+)
+
+# Vitesse (pixels par frame) en dessous de laquelle un véhicule est compté à l'arrêt
+STOPPED_SPEED = 0.1
+
+
+class SweepRun(NamedTuple):
+    """
+    Paramètres d'une exécution du balayage
+    """
+    scenario: str
+    seed: int
+    timings: Optional[Dict[str, float]] = None
+    duration: float = 600.0
+    dt: float = 1.0 / FPS
+
+    @property
+    def timings_label(self) -> str:
+        """
+        Libellé des durées de feux ("default" pour celles du scénario)
+        """
+        if not self.timings:
+            return "default"
+        return ",".join(f"{key}={value:g}" for key, value in sorted(self.timings.items()))
+
+    @property
+    def run_id(self) -> str:
+        """
+        Identifiant stable de l'exécution (sert à la reprise)
+        """
+        return f"{self.scenario}|{self.timings_label}|{self.seed}|{self.duration:g}|{self.dt:g}"
+
+
+def build_runs(scenarios: List[str], seeds: List[int],
+               timings_grid: Optional[List[Optional[Dict[str, float]]]] = None,
+               duration: float = 600.0, dt: float = 1.0 / FPS) -> List[SweepRun]:
+    """
+    Construit le produit cartésien scénarios × durées de feux × graines
+    """
+    timings_grid = timings_grid or [None]
+    return [SweepRun(scenario, seed, timings, duration, dt)
+            for scenario in scenarios
+            for timings in timings_grid
+            for seed in seeds]
+
+
+def run_single(run: SweepRun) -> Dict[str, Any]:
+    """
+    Exécute une simulation headless et retourne ses KPI
+
+    Les véhicules sont échantillonnés une fois par seconde simulée.
+    """
+    simulation = Simulation(seed=run.seed, headless=True)
+    if not simulation.setup() or not simulation.change_scenario(run.scenario):
+        raise ValueError(f"Scénario inconnu: {run.scenario}")
+    if run.timings:
+        simulation.set_traffic_light_timings(run.timings)
+
+    vehicle_counts, stopped_counts, speeds = [], [], []
+    start = time.perf_counter()
+    steps_per_sample = max(1, int(round(1.0 / run.dt)))
+    samples, remainder = divmod(int(round(run.duration / run.dt)), steps_per_sample)
+    for _ in range(samples):
+        simulation.run_for(steps_per_sample * run.dt, run.dt)
+        vehicle_speeds = [vehicle.speed for vehicle in
+                          simulation.vehicle_manager.get_all_vehicles()]
+        vehicle_counts.append(len(vehicle_speeds))
+        stopped_counts.append(sum(1 for speed in vehicle_speeds if speed < STOPPED_SPEED))
+        speeds.extend(vehicle_speeds)
+    if remainder:
+        simulation.run_for(remainder * run.dt, run.dt)
+    wall_time = time.perf_counter() - start
+
+    stats = simulation.get_statistics()
+    hours = simulation.sim_time / 3600.0
+    return {
+        "run_id": run.run_id,
+        "scenario": run.scenario,
+        "timings": run.timings_label,
+        "seed": run.seed,
+        "duration": run.duration,
+        "dt": run.dt,
+        "total_spawned": stats["total_spawned"],
+        "total_removed": stats["total_removed"],
+        "throughput_per_hour": stats["total_removed"] / hours if hours > 0 else 0.0,
+        "mean_vehicles": statistics.fmean(vehicle_counts) if vehicle_counts else 0.0,
+        "mean_stopped": statistics.fmean(stopped_counts) if stopped_counts else 0.0,
+        "max_stopped": max(stopped_counts, default=0),
+        "mean_speed": statistics.fmean(speeds) if speeds else 0.0,
+        "wall_time": wall_time,
+        "speedup": simulation.sim_time / wall_time if wall_time > 0 else float("inf")
+    }
+
+
+def load_results(results_path: str) -> List[Dict[str, Any]]:
+    """
+    Relit les résultats déjà écrits (une ligne JSON par exécution)
+
+    Une dernière ligne tronquée (processus interrompu) est ignorée.
+    """
+    rows = []
+    if not os.path.exists(results_path):
+        return rows
+    with open(results_path, encoding="utf-8") as results_file:
+        for line in results_file:
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return rows
+
+
+def drop_partial_line(results_path: str) -> None:
+    """
+    Supprime une dernière ligne tronquée (sans fin de ligne) avant d'ajouter
+    de nouveaux résultats, qui seraient sinon collés à elle
+    """
+    if not os.path.exists(results_path):
+        return
+    with open(results_path, "rb+") as results_file:
+        data = results_file.read()
+        if data and not data.endswith(b"\n"):
+            results_file.truncate(data.rfind(b"\n") + 1)
+
+
+def run_sweep(runs: List[SweepRun], results_path: str,
+              workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Exécute les simulations en parallèle et produit chaque résultat dès sa fin
+
+    Les exécutions déjà présentes (sans erreur) dans results_path sont sautées ;
+    une dernière ligne tronquée est supprimée (son exécution est refaite).
+
+    Args:
+        runs: Exécutions à réaliser
+        results_path: Fichier JSON lines complété au fil de l'eau
+        workers: Nombre de processus (tous les cœurs par défaut)
+    """
+    done: Set[str] = {row["run_id"] for row in load_results(results_path)
+                      if "error" not in row}
+    pending = [run for run in runs if run.run_id not in done]
+    if not pending:
+        return
+
+    drop_partial_line(results_path)
+    with open(results_path, "a", encoding="utf-8") as results_file, \
+            ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {executor.submit(run_single, run): run for run in pending}
+        for future in as_completed(futures):
+            run = futures[future]
+            try:
+                row = future.result()
+            except Exception as e:
+                row = {"run_id": run.run_id, "scenario": run.scenario,
+                       "timings": run.timings_label, "seed": run.seed, "error": str(e)}
+            results_file.write(json.dumps(row) + "\n")
+            results_file.flush()
+            yield row
+
+
+def aggregate(rows: List[Dict[str, Any]], runs: Optional[List[SweepRun]] = None
+              ) -> List[Dict[str, Any]]:
+    """
+    Agrège les KPI par configuration (scénario, durées des feux) sur les graines
+
+    Args:
+        runs: Si fourni, seules les exécutions de ce balayage sont prises en compte
+    """
+    wanted = {run.run_id for run in runs} if runs is not None else None
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for row in rows:
+        if "error" in row or (wanted is not None and row["run_id"] not in wanted):
+            continue
+        groups.setdefault((row["scenario"], row["timings"]), []).append(row)
+
+    summary = []
+    for (scenario, timings), group in sorted(groups.items()):
+        entry: Dict[str, Any] = {"scenario": scenario, "timings": timings, "runs": len(group)}
+        for name in KPI_NAMES:
+            values = [row[name] for row in group]
+            entry[f"{name}_mean"] = statistics.fmean(values)
+            entry[f"{name}_std"] = statistics.stdev(values) if len(values) > 1 else 0.0
+            entry[f"{name}_min"] = min(values)
+            entry[f"{name}_max"] = max(values)
+        summary.append(entry)
+    return summary
+
+
+def write_summary(summary: List[Dict[str, Any]], output_path: str) -> None:
+    """
+    Écrit les KPI agrégés dans un fichier CSV
+    """
+    fieldnames = ["scenario", "timings", "runs"]
+    for name in KPI_NAMES:
+        fieldnames.extend(f"{name}_{suffix}" for suffix in ("mean", "std", "min", "max"))
+    with open(output_path, "w", newline="", encoding="utf-8") as output_file:
+        writer = csv.DictWriter(output_file, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(summary)
+
+
+def parse_seeds(values: List[str]) -> List[int]:
+    """
+    Convertit "0-49" ou "1 2 3" en liste de graines
+    """
+    seeds = []
+    for value in values:
+        if "-" in value.lstrip("-"):
+            first, last = value.split("-", 1)
+            seeds.extend(range(int(first), int(last) + 1))
+        else:
+            seeds.append(int(value))
+    return seeds
+
+
+def parse_timings(value: str) -> Optional[Dict[str, float]]:
+    """
+    Convertit "green=20,orange=3,red=6" en dictionnaire ("default" pour aucun)
+    """
+    if value == "default":
+        return None
+    timings = {}
+    for item in value.split(","):
+        key, _, number = item.partition("=")
+        if key not in ("green", "orange", "red", "blink_interval"):
+            raise argparse.ArgumentTypeError(f"Phase inconnue: {key}")
+        timings[key] = float(number)
+    return timings
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse les arguments de ligne de commande
+    """
+    parser = argparse.ArgumentParser(description="Balayage scénario × graine en parallèle")
+    parser.add_argument("--scenarios", nargs="+", default=["normal", "rush_hour", "night"],
+                        choices=["normal", "rush_hour", "night", "manual"])
+    parser.add_argument("--seeds", nargs="+", default=["0-9"],
+                        help="Graines : liste ou intervalles (ex. 0-49)")
+    parser.add_argument("--timings", type=parse_timings, action="append", default=None,
+                        help="Durées de feux à tester (répétable), ex. green=20,red=6 ou default")
+    parser.add_argument("--duration", type=float, default=600.0,
+                        help="Durée simulée de chaque exécution (secondes)")
+    parser.add_argument("--dt", type=float, default=1.0 / FPS)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Nombre de processus (tous les cœurs par défaut)")
+    parser.add_argument("--results", default="sweep_runs.jsonl",
+                        help="Résultats par exécution, complétés au fil de l'eau")
+    parser.add_argument("--output", default="sweep_summary.csv",
+                        help="Fichier des KPI agrégés")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Fonction principale
+    """
+    args = parse_arguments(argv)
+    runs = build_runs(args.scenarios, parse_seeds(args.seeds), args.timings,
+                      args.duration, args.dt)
+
+    total = len(runs)
+    finished = 0
+    for row in run_sweep(runs, args.results, args.workers):
+        finished += 1
+        if "error" in row:
+            print(f"✗ {row['run_id']}: {row['error']}")
+        else:
+            print(f"[{finished}] {row['run_id']}: {row['throughput_per_hour']:.0f} véh/h, "
+                  f"{row['mean_stopped']:.1f} à l'arrêt, x{row['speedup']:.0f}")
+
+    summary = aggregate(load_results(args.results), runs)
+    write_summary(summary, args.output)
+    complete = sum(entry["runs"] for entry in summary)
+    print(f"✓ {complete}/{total} exécutions agrégées dans {args.output}")
+    return 0 if complete == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,9 +3,11 @@ Module de gestion des feux tricolores
 Responsable : Mbene Diagne
 """
 
+import heapq
+import itertools
 import time
 from enum import Enum
-from typing import Optional, Tuple
+from typing import Optional, Tuple, List, Dict
 from constants import *
 
 class TrafficLightState(Enum):
@@ -17,6 +19,27 @@ class TrafficLightState(Enum):
     GREEN = "VERT"
     ORANGE_BLINKING = "ORANGE_CLIGNOTANT"
 
+
+# Cycle automatique : VERT -> ORANGE -> ROUGE -> VERT
+NEXT_STATE = {
+    TrafficLightState.GREEN: TrafficLightState.ORANGE,
+    TrafficLightState.ORANGE: TrafficLightState.RED,
+    TrafficLightState.RED: TrafficLightState.GREEN
+}
+
+STATE_TIMING_KEYS = {
+    TrafficLightState.GREEN: "green",
+    TrafficLightState.ORANGE: "orange",
+    TrafficLightState.RED: "red"
+}
+
+STATE_COLORS = {
+    TrafficLightState.RED: RED,
+    TrafficLightState.ORANGE: ORANGE,
+    TrafficLightState.GREEN: GREEN,
+    TrafficLightState.ORANGE_BLINKING: ORANGE
+}
+
 class TrafficLight:
     """
     Représente un feu tricolore avec sa logique et son affichage
@@ -26,98 +49,337 @@ class TrafficLight:
         """
         Initialise un feu tricolore
         """
-        pass
+        self.position = position
+        self.direction = direction
+        self.state = TrafficLightState.GREEN
+        self.scenario = "normal"
+        self.timings = TRAFFIC_LIGHT_TIMINGS["normal"]
+        self.automatic = True
+        self.blink_on = True
+
+        # Temps de simulation (secondes) fourni par update()
+        self.current_time = 0.0
+        self.state_start_time = 0.0
     
-    def update(self) -> None:
+    def update(self, current_time: Optional[float] = None) -> None:
         """
         Met à jour l'état du feu selon son cycle
+
+        Args:
+            current_time: Temps de simulation en secondes (horloge murale si absent)
+        """
+        self.current_time = time.time() if current_time is None else current_time
+        self.advance_to(self.current_time)
+    
+    def next_transition_time(self) -> Optional[float]:
+        """
+        Retourne l'instant du prochain changement (None hors cycle automatique)
+        """
+        if not self.automatic:
+            return None
+        if self.is_blinking():
+            return self.state_start_time + self.timings["blink_interval"]
+        return self.state_start_time + self._get_state_duration()
+    
+    def advance_to(self, current_time: float) -> None:
+        """
+        Applique toutes les transitions échues jusqu'à current_time
+
+        Les cycles complets (ou les clignotements) sautés sont rattrapés en
+        une seule opération : un grand saut de temps coûte O(1).
+        """
+        if not self.automatic:
+            return
+
+        if self.is_blinking():
+            interval = self.timings["blink_interval"]
+            skipped = int((current_time - self.state_start_time) // interval) - 1
+            if skipped > 0:
+                self.state_start_time += skipped * interval
+                self.blink_on ^= skipped % 2 == 1
+        else:
+            cycle = sum(self.timings[key] for key in STATE_TIMING_KEYS.values())
+            skipped = int((current_time - self.state_start_time) // cycle) - 1
+            if skipped > 0:
+                self.state_start_time += skipped * cycle
+
+        next_time = self.next_transition_time()
+        while next_time <= current_time:
+            self._transition()
+            next_time = self.next_transition_time()
+    
+    def _transition(self) -> None:
+        """
+        Passe à la phase suivante (ou bascule le clignotement)
         """
-        pass
+        if self.is_blinking():
+            self.state_start_time += self.timings["blink_interval"]
+            self.blink_on = not self.blink_on
+        else:
+            self.state_start_time += self._get_state_duration()
+            self.state = NEXT_STATE[self.state]
     
     def change_state(self, new_state: TrafficLightState, manual: bool = False) -> str:
         """
         Change l'état du feu
+
+        Returns:
+            str: L'état précédent du feu
         """
-        pass
+        previous_state = self.state.value
+        if manual:
+            self.automatic = False
+        self.state = new_state
+        self.state_start_time = self.current_time
+        self.blink_on = True
+        return previous_state
     
     def get_current_state(self) -> str:
         """
         Retourne l'état actuel du feu
         """
-        pass
+        return self.state.value
     
     def get_color(self) -> str:
         """
         Retourne la couleur actuelle du feu
         """
-        pass
+        if self.is_blinking() and not self.blink_on:
+            return LIGHT_OFF
+        return STATE_COLORS[self.state]
     
     def set_scenario(self, scenario_name: str) -> None:
         """
         Configure les paramètres selon le scénario
         """
-        pass
+        self.scenario = scenario_name
+        self.timings = TRAFFIC_LIGHT_TIMINGS.get(scenario_name, TRAFFIC_LIGHT_TIMINGS["normal"])
+
+        if "blink_interval" in self.timings:
+            self.change_state(TrafficLightState.ORANGE_BLINKING)
+        elif self.is_blinking():
+            self.change_state(TrafficLightState.RED)
     
     def enable_automatic_cycle(self) -> None:
         """
         Active le cycle automatique
         """
-        pass
+        if not self.automatic:
+            self.automatic = True
+            self.state_start_time = self.current_time
     
     def disable_automatic_cycle(self) -> None:
         """
         Désactive le cycle automatique (mode manuel)
         """
-        pass
+        self.automatic = False
     
-    def get_time_remaining(self) -> float:
+    def get_time_remaining(self, current_time: Optional[float] = None) -> float:
         """
         Retourne le temps restant dans l'état actuel
+
+        Args:
+            current_time: Temps courant (dernier temps reçu par update() si absent)
         """
-        pass
+        next_time = self.next_transition_time()
+        if next_time is None:
+            return 0.0
+        now = self.current_time if current_time is None else current_time
+        return max(0.0, next_time - now)
     
     def is_blinking(self) -> bool:
         """
         Vérifie si le feu est en mode clignotant
         """
-        pass
+        return self.state == TrafficLightState.ORANGE_BLINKING
+    
+    def _get_state_duration(self) -> float:
+        """
+        Retourne la durée de l'état actuel pour le scénario courant
+        """
+        return self.timings[STATE_TIMING_KEYS[self.state]]
+
+
+class LightScheduler:
+    """
+    Échéancier des changements de feux, trié par temps de simulation
+
+    Un tas contient le prochain instant de transition de chaque feu : entre
+    deux transitions, un feu ne coûte rien. Chaque feu n'a qu'une entrée
+    valide ; une reprogrammation rend les anciennes entrées obsolètes.
+    """
+    
+    def __init__(self):
+        """
+        Initialise un échéancier vide
+        """
+        self.current_time = 0.0
+        self._heap: List[Tuple[float, int, TrafficLight]] = []
+        self._tokens: Dict[int, int] = {}
+        self._counter = itertools.count()
+    
+    def schedule(self, light: TrafficLight) -> None:
+        """
+        (Re)programme la prochaine transition d'un feu
+        """
+        token = next(self._counter)
+        self._tokens[id(light)] = token
+        next_time = light.next_transition_time()
+        if next_time is not None:
+            heapq.heappush(self._heap, (next_time, token, light))
+    
+    def clear(self) -> None:
+        """
+        Supprime toutes les transitions programmées
+        """
+        self._heap.clear()
+        self._tokens.clear()
+    
+    def advance(self, current_time: float) -> int:
+        """
+        Applique les transitions échues jusqu'à current_time
+
+        Returns:
+            int: Nombre de feux ayant changé
+        """
+        self.current_time = current_time
+        heap = self._heap
+        changed = 0
+        while heap and heap[0][0] <= current_time:
+            _, token, light = heapq.heappop(heap)
+            if self._tokens.get(id(light)) != token:
+                continue  # Entrée obsolète (feu reprogrammé depuis)
+            light.current_time = current_time
+            light.advance_to(current_time)
+            self.schedule(light)
+            changed += 1
+        return changed
+    
+    def next_event_time(self) -> Optional[float]:
+        """
+        Retourne l'instant de la prochaine transition programmée
+        """
+        heap = self._heap
+        while heap and self._tokens.get(id(heap[0][2])) != heap[0][1]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
 
 
 class TrafficLightManager:
     """
     Gère tous les feux tricolores du carrefour
+
+    Les feux ne sont pas interrogés à chaque frame : update_all() ne traite
+    que les transitions échues de l'échéancier.
     """
     
     def __init__(self):
         """
         Initialise le gestionnaire de feux
         """
-        pass
+        self.lights: List[TrafficLight] = []
+        self.scenario = "normal"
+        self.scheduler = LightScheduler()
     
     def setup_lights(self) -> None:
         """
         Configure les 4 feux du carrefour
         """
-        pass
+        directions = ["north", "south", "east", "west"]
+        self.lights = [TrafficLight(position, direction)
+                       for position, direction in zip(TRAFFIC_LIGHT_POSITIONS, directions)]
+        # Nouveaux feux : l'échéancier repart de t = 0, comme leur horloge
+        self.scheduler = LightScheduler()
+        self.reschedule()
     
-    def update_all(self) -> None:
+    def reschedule(self) -> None:
         """
-        Met à jour tous les feux
+        Reprogramme tous les feux (après une modification directe de leur état)
         """
-        pass
+        self.scheduler.clear()
+        for light in self.lights:
+            self.scheduler.schedule(light)
     
-    def change_all_states(self, state: TrafficLightState) -> None:
+    def update_all(self, current_time: Optional[float] = None) -> None:
+        """
+        Met à jour les feux dont une transition est échue
+
+        Args:
+            current_time: Temps de simulation en secondes (horloge murale si absent)
+        """
+        self.scheduler.advance(time.time() if current_time is None else current_time)
+    
+    def change_all_states(self, state: TrafficLightState, manual: bool = True) -> None:
         """
         Change l'état de tous les feux
         """
-        pass
+        for light in self._synced_lights():
+            light.change_state(state, manual)
+            self.scheduler.schedule(light)
     
     def get_light_at_position(self, position: Tuple[float, float]) -> Optional[TrafficLight]:
         """
         Retourne le feu à une position donnée
         """
-        pass
+        for light in self.lights:
+            if (abs(light.position[0] - position[0]) < 1e-6
+                    and abs(light.position[1] - position[1]) < 1e-6):
+                return light
+        return None
+    
+    def set_scenario(self, scenario_name: str) -> None:
+        """
+        Applique un scénario à tous les feux
+        """
+        self.scenario = scenario_name
+        for light in self._synced_lights():
+            light.set_scenario(scenario_name)
+            self.scheduler.schedule(light)
+    
+    def set_timings(self, timings: Dict[str, float]) -> None:
+        """
+        Remplace les durées des phases du scénario courant (ex. {"green": 20})
+        """
+        for light in self.lights:
+            light.timings = {**light.timings, **timings}
+            self.scheduler.schedule(light)
+    
+    def set_automatic(self, enabled: bool) -> None:
+        """
+        Active ou désactive le cycle automatique de tous les feux
+        """
+        for light in self._synced_lights():
+            if enabled:
+                light.enable_automatic_cycle()
+            else:
+                light.disable_automatic_cycle()
+            self.scheduler.schedule(light)
+    
+    def get_current_state(self) -> Optional[str]:
+        """
+        Retourne l'état commun des feux du carrefour
+        """
+        if not self.lights:
+            return None
+        return self.lights[0].get_current_state()
+    
+    def get_time_remaining(self) -> float:
+        """
+        Retourne le temps avant le prochain changement de feu
+        """
+        next_time = self.scheduler.next_event_time()
+        if next_time is None:
+            return 0.0
+        return max(0.0, next_time - self.scheduler.current_time)
+    
+    def _synced_lights(self) -> List[TrafficLight]:
+        """
+        Retourne les feux après avoir mis leur horloge à l'heure de l'échéancier
+        """
+        for light in self.lights:
+            light.current_time = self.scheduler.current_time
+        return self.lights
 
 
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    pass
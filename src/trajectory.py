@@ -0,0 +1,203 @@
+"""
+Compression des trajectoires en images clés et reconstruction
+Responsable : Ndeye Khady Syll
+
+Au lieu d'une ligne par véhicule et par pas, seules les images clés sont
+journalisées : première et dernière position, changements d'état, et points
+où l'interpolation linéaire entre images clés s'écarterait de plus de
+POSITION_TOLERANCE (ou SPEED_TOLERANCE pour la vitesse). L'état reconstruit
+entre deux images clés est celui de la première.
+
+Le test est à coût constant : chaque segment est prolongé au taux observé
+juste après son image clé de départ ; dès qu'un échantillon s'écarte de cette
+droite de plus de la moitié de la tolérance, l'échantillon précédent devient
+une image clé. La droite entre deux images clés reste alors à moins d'une
+demi-tolérance de la droite prolongée, donc à moins d'une tolérance de chaque
+échantillon.
+"""
+
+import math
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from constants import *
+from database import EVENT_COLUMNS
+
+_COLUMN = {name: index for index, name in enumerate(EVENT_COLUMNS)}
+
+
+class Keyframe(NamedTuple):
+    """
+    Position d'un véhicule à un instant de simulation
+    """
+    sim_time: float
+    x: float
+    y: float
+    speed: float
+    state: str
+
+
+class _Track:
+    """
+    Segment en cours d'un véhicule
+    """
+
+    __slots__ = ("anchor", "last", "rate")
+
+    def __init__(self, anchor: Keyframe):
+        self.anchor = anchor
+        self.last = anchor
+        # (vx, vy, accélération) observés juste après l'image clé de départ
+        self.rate: Optional[tuple] = None
+
+
+def _rate(start: Keyframe, end: Keyframe) -> tuple:
+    """
+    Taux de variation (vx, vy, dv) entre deux échantillons
+    """
+    dt = end.sim_time - start.sim_time
+    if dt <= 0:
+        return 0.0, 0.0, 0.0
+    return (end.x - start.x) / dt, (end.y - start.y) / dt, (end.speed - start.speed) / dt
+
+
+class TrajectoryCompressor:
+    """
+    Sélectionne en ligne les images clés des trajectoires de tous les véhicules
+    """
+
+    def __init__(self, tolerance: float = POSITION_TOLERANCE,
+                 speed_tolerance: float = SPEED_TOLERANCE):
+        """
+        Initialise le compresseur
+
+        Args:
+            tolerance: Écart maximal (px) de la trajectoire reconstruite
+            speed_tolerance: Écart maximal (px/frame) de la vitesse reconstruite
+        """
+        self.tolerance = tolerance
+        self.speed_tolerance = speed_tolerance
+        self.tracks: Dict[int, _Track] = {}
+        self.samples = 0
+        self.keyframes = 0
+
+    def add(self, vehicle_id: int, sample: Keyframe) -> List[Keyframe]:
+        """
+        Ajoute un échantillon et retourne les images clés à journaliser
+        """
+        self.samples += 1
+        track = self.tracks.get(vehicle_id)
+        if track is None:
+            self.tracks[vehicle_id] = _Track(sample)
+            return self._emit([sample])
+
+        emitted = []
+        if track.rate is not None:
+            anchor = track.anchor
+            vx, vy, dv = track.rate
+            dt = sample.sim_time - anchor.sim_time
+            error = math.hypot(anchor.x + vx * dt - sample.x, anchor.y + vy * dt - sample.y)
+            speed_error = abs(anchor.speed + dv * dt - sample.speed)
+            if error > self.tolerance / 2 or speed_error > self.speed_tolerance / 2:
+                emitted.append(track.last)
+                track.anchor = track.last
+                track.rate = _rate(track.anchor, sample)
+
+        if sample.state != track.last.state:
+            # Changement d'état : l'échantillon ouvre un nouveau segment
+            emitted.append(sample)
+            track.anchor = sample
+            track.rate = None
+        elif track.rate is None:
+            track.rate = _rate(track.anchor, sample)
+        track.last = sample
+        return self._emit(emitted)
+
+    def finish(self, vehicle_id: int) -> List[Keyframe]:
+        """
+        Termine la trajectoire d'un véhicule (sortie) : dernière image clé
+        """
+        track = self.tracks.pop(vehicle_id, None)
+        if track is None or track.last is track.anchor:
+            return []
+        return self._emit([track.last])
+
+    def clear(self) -> None:
+        """
+        Oublie les trajectoires en cours
+        """
+        self.tracks.clear()
+
+    def get_statistics(self) -> Dict[str, float]:
+        """
+        Nombre d'échantillons reçus, d'images clés gardées et taux de compression
+        """
+        return {"samples": self.samples, "keyframes": self.keyframes,
+                "ratio": self.samples / self.keyframes if self.keyframes else 0.0}
+
+    def _emit(self, keyframes: List[Keyframe]) -> List[Keyframe]:
+        """
+        Compte les images clés retournées
+        """
+        self.keyframes += len(keyframes)
+        return keyframes
+
+
+def interpolate(keyframes: List[Keyframe], sim_time: float) -> Optional[Keyframe]:
+    """
+    Position reconstruite à un instant (None hors de la trajectoire)
+
+    L'état est celui de l'image clé qui précède.
+    """
+    if not keyframes or not keyframes[0].sim_time <= sim_time <= keyframes[-1].sim_time:
+        return None
+    low, high = 0, len(keyframes) - 1
+    while high - low > 1:
+        middle = (low + high) // 2
+        if keyframes[middle].sim_time <= sim_time:
+            low = middle
+        else:
+            high = middle
+    start, end = keyframes[low], keyframes[high]
+    span = end.sim_time - start.sim_time
+    alpha = (sim_time - start.sim_time) / span if span > 0 else 0.0
+    if alpha >= 1.0:
+        return end._replace(sim_time=sim_time)
+    return Keyframe(sim_time, start.x + (end.x - start.x) * alpha,
+                    start.y + (end.y - start.y) * alpha,
+                    start.speed + (end.speed - start.speed) * alpha, start.state)
+
+
+def rebuild_trajectory(keyframes: Iterable[Keyframe], step: float = 1.0 / FPS) -> List[Keyframe]:
+    """
+    Trajectoire dense (un point tous les step secondes) à partir des images clés
+    """
+    keyframes = sorted(keyframes)
+    if not keyframes:
+        return []
+    start, end = keyframes[0].sim_time, keyframes[-1].sim_time
+    count = int(math.floor((end - start) / step + 1e-9))
+    points = [interpolate(keyframes, min(start + index * step, end)) for index in range(count + 1)]
+    if points[-1].sim_time < end:
+        points.append(keyframes[-1])
+    return points
+
+
+def read_keyframes(database, vehicle_id: int) -> List[Keyframe]:
+    """
+    Lit les images clés d'un véhicule dans la base d'événements
+    """
+    return sorted(Keyframe(row[_COLUMN["sim_time"]], row[_COLUMN["position_x"]],
+                           row[_COLUMN["position_y"]], row[_COLUMN["vitesse"]],
+                           row[_COLUMN["action"]])
+                  for row in database.get_vehicle_events(vehicle_id)
+                  if row[_COLUMN["event_type"]] == "VEHICLE_POSITION")
+
+
+def read_trajectory(database, vehicle_id: int, step: float = 1.0 / FPS) -> List[Keyframe]:
+    """
+    Reconstruit la trajectoire dense d'un véhicule depuis la base
+    """
+    return rebuild_trajectory(read_keyframes(database, vehicle_id), step)
+
+
+if __name__ == "__main__":
+    pass
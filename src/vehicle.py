@@ -6,9 +6,17 @@ Responsable comportement : Ndeye Khady Syll
 
 import random
 import math
-from typing import Tuple, List, Dict, Optional
+from typing import Tuple, List, Dict, Iterator, Optional
 from enum import Enum
 from constants import *
+from vehicle_store import VehicleStore, DIRECTIONS, DIRECTION_CODES
+from lane_queue import LaneQueue
+from spatial_index import SpatialGrid
+
+try:
+    import numpy as np
+except ImportError:  # Sans NumPy, la mise à jour reste scalaire
+    np = None
 
 class VehicleType(Enum):
     """
@@ -27,26 +35,293 @@ class VehicleState(Enum):
     SLOWING = "slowing"
     ACCELERATING = "accelerating"
 
+
+# Codes entiers utilisés dans le VehicleStore
+VEHICLE_TYPES = list(VehicleType)
+VEHICLE_TYPE_CODES = {vehicle_type: code for code, vehicle_type in enumerate(VEHICLE_TYPES)}
+VEHICLE_STATES = list(VehicleState)
+VEHICLE_STATE_CODES = {state: code for code, state in enumerate(VEHICLE_STATES)}
+
+LANES_PER_DIRECTION = max(len(lanes) for lanes in LANE_STARTS.values())
+
+# Vecteurs de direction indexés par code (mise à jour vectorisée)
+if np is not None:
+    DIRECTION_DX = np.array([DIRECTION_VECTORS[d][0] for d in DIRECTIONS], dtype=float)
+    DIRECTION_DY = np.array([DIRECTION_VECTORS[d][1] for d in DIRECTIONS], dtype=float)
+
+# États du feu (valeurs de TrafficLightState) imposant un arrêt
+RED_LIGHT_STATE = "ROUGE"
+ORANGE_LIGHT_STATE = "ORANGE"
+
+
+def compute_obstacle_distance(front: float, speed: float, deceleration: float,
+                              leader_rear: Optional[float],
+                              traffic_light_state: Optional[str]) -> float:
+    """
+    Calcule la distance libre devant l'avant d'un véhicule
+
+    Args:
+        front: Position de l'avant du véhicule sur la voie
+        speed: Vitesse actuelle (pixels par frame)
+        deceleration: Décélération maximale (pixels par frame²)
+        leader_rear: Position de l'arrière du véhicule qui précède (None si aucun)
+        traffic_light_state: État du feu
+
+    Returns:
+        float: Distance avant l'obstacle le plus proche (math.inf si aucun)
+    """
+    obstacle = math.inf
+    if leader_rear is not None:
+        obstacle = leader_rear - SAFE_DISTANCE - front
+
+    if front <= STOP_LINE_DISTANCE:
+        stop_distance = STOP_LINE_DISTANCE - front
+        if traffic_light_state == RED_LIGHT_STATE:
+            obstacle = min(obstacle, stop_distance)
+        elif traffic_light_state == ORANGE_LIGHT_STATE:
+            # On s'arrête à l'orange seulement si le freinage est possible
+            if speed * speed / (2 * deceleration) <= stop_distance:
+                obstacle = min(obstacle, stop_distance)
+
+    return obstacle
+
+
+def _column_property(column: str, doc: str) -> property:
+    """
+    Crée une propriété qui lit et écrit une colonne flottante du VehicleStore
+    """
+    def getter(self):
+        return float(self._store.columns[column][self._row])
+
+    def setter(self, value):
+        self._store.columns[column][self._row] = value
+
+    return property(getter, setter, doc=doc)
+
+
+def _code_property(column: str, values: list, codes: dict, doc: str) -> property:
+    """
+    Crée une propriété qui traduit une colonne de codes entiers en valeurs
+    """
+    def getter(self):
+        return values[self._store.columns[column][self._row]]
+
+    def setter(self, value):
+        self._store.columns[column][self._row] = codes[value]
+
+    return property(getter, setter, doc=doc)
+
+
 class Vehicle:
     """
     Représente un véhicule dans la simulation
+
+    L'état dynamique est stocké dans une ligne d'un VehicleStore ; l'objet
+    n'est qu'une vue légère sur cette ligne.
     """
     
-    _next_id = 1  # Compteur pour les IDs uniques
+    __slots__ = ("id", "height", "color", "_store", "_row")
     
-    def __init__(self, vehicle_type: VehicleType = VehicleType.CAR, 
-                 lane_id: int = 0, direction: str = "east"):
+    _next_id = 1  # Compteur des IDs affichés (uniques, jamais recyclés)
+    
+    x = _column_property("x", "Position horizontale")
+    y = _column_property("y", "Position verticale")
+    speed = _column_property("speed", "Vitesse (pixels par frame)")
+    current_acceleration = _column_property("acceleration", "Accélération du dernier pas")
+    distance = _column_property("distance", "Distance parcourue depuis le départ de la voie")
+    max_speed = _column_property("max_speed", "Vitesse de croisière")
+    acceleration = _column_property("accel_rate", "Accélération maximale")
+    deceleration = _column_property("decel_rate", "Décélération maximale")
+    width = _column_property("length", "Longueur dans le sens de la marche")
+    start_x = _column_property("start_x", "Abscisse de départ de la voie")
+    start_y = _column_property("start_y", "Ordonnée de départ de la voie")
+    direction = _code_property("direction", DIRECTIONS, DIRECTION_CODES, "Sens de circulation")
+    vehicle_type = _code_property("type", VEHICLE_TYPES, VEHICLE_TYPE_CODES, "Type de véhicule")
+    state = _code_property("state", VEHICLE_STATES, VEHICLE_STATE_CODES, "État du véhicule")
+    
+    def __init__(self, vehicle_type: VehicleType = VehicleType.CAR,
+                 lane_id: int = 0, direction: str = "east",
+                 rng: Optional[random.Random] = None,
+                 store: Optional[VehicleStore] = None,
+                 vehicle_id: Optional[int] = None,
+                 display_id: Optional[int] = None):
         """
         Initialise un véhicule
+
+        Args:
+            store: Stockage partagé (un stockage privé est créé si absent)
+            vehicle_id: ID interne imposé (par défaut égal à display_id)
+            display_id: ID affiché et journalisé (sinon pris dans le compteur global)
         """
-        pass
+        self._reset(vehicle_type, lane_id, direction, rng,
+                    store if store is not None else VehicleStore(capacity=1),
+                    vehicle_id, display_id)
     
-    def update(self, traffic_light_state: Optional[str] = None, 
-               vehicles_ahead: List['Vehicle'] = None) -> bool:
+    @classmethod
+    def blank(cls) -> 'Vehicle':
+        """
+        Crée une vue sans ligne, prête à être initialisée par _reset (pool)
+        """
+        vehicle = cls.__new__(cls)
+        vehicle.id = -1
+        vehicle.height = 0
+        vehicle.color = ""
+        vehicle._store = None
+        vehicle._row = -1
+        return vehicle
+    
+    def _reset(self, vehicle_type: VehicleType, lane_id: int, direction: str,
+               rng: Optional[random.Random], store: VehicleStore,
+               vehicle_id: Optional[int] = None, display_id: Optional[int] = None) -> None:
+        """
+        (Ré)initialise le véhicule sur une nouvelle ligne du stockage
+        """
+        rng = rng or random
+
+        self._store = store
+        self._row = store.allocate(self)
+
+        # L'ID affiché est unique et croissant, même quand l'ID interne est recyclé
+        if display_id is None:
+            display_id = Vehicle._next_id
+            Vehicle._next_id += 1
+        self.id = display_id if vehicle_id is None else vehicle_id
+        store.columns["id"][self._row] = self.id
+        self.display_id = display_id
+
+        self.vehicle_type = vehicle_type
+        self.lane_id = lane_id
+        self.direction = direction
+
+        config = VEHICLE_CONFIG.get(vehicle_type.value, VEHICLE_CONFIG["car"])
+        self.width = config["width"]
+        self.height = config["height"]
+        self.max_speed = rng.uniform(config["min_speed"], config["max_speed"])
+        self.acceleration = config["acceleration"]
+        self.deceleration = config["deceleration"]
+
+        colors = TRUCK_COLORS if vehicle_type == VehicleType.TRUCK else CAR_COLORS
+        self.color = rng.choice(colors)
+
+        self.start_x, self.start_y = LANE_STARTS[direction][lane_id]
+        self.distance = 0.0
+        self.x = self.start_x
+        self.y = self.start_y
+        self.speed = self.max_speed
+        self.current_acceleration = 0.0
+        self.state = VehicleState.MOVING
+    
+    def _attach(self, store: VehicleStore, row: int, color: str) -> None:
+        """
+        Associe la vue à une ligne déjà remplie du stockage (restauration)
+        """
+        self._store = store
+        self._row = row
+        self.id = int(store.columns["id"][row])
+        self.height = VEHICLE_CONFIG[self.vehicle_type.value]["height"]
+        self.color = color
+        store.views[row] = self
+    
+    @property
+    def lane_id(self) -> int:
+        """
+        Index de la voie dans LANE_STARTS[direction]
+        """
+        return int(self._store.columns["lane"][self._row])
+    
+    @lane_id.setter
+    def lane_id(self, value: int) -> None:
+        self._store.columns["lane"][self._row] = value
+    
+    @property
+    def display_id(self) -> int:
+        """
+        ID unique affiché et journalisé (jamais recyclé)
+        """
+        return int(self._store.columns["display_id"][self._row])
+    
+    @display_id.setter
+    def display_id(self, value: int) -> None:
+        self._store.columns["display_id"][self._row] = value
+    
+    def update(self, traffic_light_state: Optional[str] = None,
+               vehicles_ahead: List['Vehicle'] = None,
+               dt: float = 1.0 / FPS) -> bool:
         """
         Met à jour la position et l'état du véhicule
+
+        Args:
+            traffic_light_state: État du feu (valeur de TrafficLightState)
+            vehicles_ahead: Véhicules de la même voie susceptibles de précéder
+            dt: Pas de temps de simulation en secondes
+
+        Returns:
+            bool: True si le véhicule est toujours sur la scène
         """
-        pass
+        leader = None
+        for other in vehicles_ahead or []:
+            if other.distance > self.distance and (leader is None or other.distance < leader.distance):
+                leader = other
+
+        leader_rear = leader.distance - leader.width / 2 if leader else None
+        self._advance(traffic_light_state, leader_rear, dt * FPS)
+        return not self.should_be_removed()
+    
+    def _advance(self, traffic_light_state: Optional[str],
+                 leader_rear: Optional[float], frames: float) -> None:
+        """
+        Applique un pas de cinématique (vitesses exprimées en pixels par frame)
+        """
+        # Lecture de la ligne une seule fois, écriture groupée à la fin
+        speed = self.speed
+        distance = self.distance
+        deceleration = self.deceleration
+        max_speed = self.max_speed
+        obstacle = compute_obstacle_distance(distance + self.width / 2, speed,
+                                             deceleration, leader_rear,
+                                             traffic_light_state)
+
+        # On n'accélère que si l'on peut encore s'arrêter avant l'obstacle
+        faster = min(max_speed, speed + self.acceleration * frames)
+
+        if obstacle <= 0:
+            new_speed = 0.0
+            state = VehicleState.STOPPED
+        elif self._stopping_distance(speed, frames) >= obstacle:
+            new_speed = max(0.0, speed - deceleration * frames)
+            state = VehicleState.SLOWING if new_speed > 0 else VehicleState.STOPPED
+        elif speed < max_speed and self._stopping_distance(faster, frames) < obstacle:
+            new_speed = faster
+            state = VehicleState.ACCELERATING
+        else:
+            new_speed = speed
+            state = VehicleState.MOVING if speed > 0 else VehicleState.STOPPED
+
+        # Ne jamais dépasser l'obstacle, même avec un grand pas de temps
+        distance += min(new_speed * frames, max(obstacle, 0.0))
+        dx, dy = DIRECTION_VECTORS[self.direction]
+
+        self.speed = new_speed
+        self.current_acceleration = (new_speed - speed) / frames if frames else 0.0
+        self.state = state
+        self.distance = distance
+        self.x = self.start_x + dx * distance
+        self.y = self.start_y + dy * distance
+    
+    def _stopping_distance(self, speed: float, frames: float) -> float:
+        """
+        Distance parcourue pendant ce pas puis pendant un freinage complet
+        """
+        return speed * speed / (2 * self.deceleration) + speed * frames
+    
+    def place(self, distance: float) -> None:
+        """
+        Place le véhicule à une distance donnée du départ de sa voie
+        """
+        dx, dy = DIRECTION_VECTORS[self.direction]
+        self.distance = distance
+        self.x = self.start_x + dx * distance
+        self.y = self.start_y + dy * distance
     
     def draw(self) -> None:
         """
@@ -58,25 +333,34 @@ class Vehicle:
         """
         Retourne la position actuelle du véhicule
         """
-        pass
+        return (self.x, self.y)
     
     def get_speed(self) -> float:
         """
         Retourne la vitesse actuelle du véhicule
         """
-        pass
+        return self.speed
     
     def is_in_intersection(self) -> bool:
         """
         Vérifie si le véhicule est dans l'intersection
         """
-        pass
+        half = INTERSECTION_SIZE / 2
+        return abs(self.x) <= half and abs(self.y) <= half
     
     def should_be_removed(self) -> bool:
         """
         Vérifie si le véhicule doit être supprimé
         """
-        pass
+        return self.distance - self.width / 2 > LANE_LENGTH
+    
+    def _release(self) -> None:
+        """
+        Libère la ligne du véhicule ; la vue ne doit plus être lue avant _reset
+        """
+        self._store.release(self._row)
+        self._store = None
+        self._row = -1
 
 
 class VehicleManager:
@@ -84,54 +368,450 @@ class VehicleManager:
     Gère tous les véhicules de la simulation
     """
     
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, rng: Optional[random.Random] = None,
+                 vectorized: Optional[bool] = None,
+                 id_sequence: Optional[Iterator[int]] = None,
+                 pool_size: int = VEHICLE_POOL_SIZE):
         """
         Initialise le gestionnaire de véhicules
+
+        Args:
+            vectorized: Force (True) ou désactive (False) la mise à jour NumPy ;
+                par défaut, elle est utilisée si NumPy est installé
+            id_sequence: Source d'IDs affichés propre au gestionnaire (réseaux
+                multi-carrefours) ; le compteur global de Vehicle sinon
+            pool_size: Nombre de véhicules préalloués
         """
-        pass
+        self.logger = logger
+        self.rng = rng or random.Random()
+        self.vectorized = (np is not None) if vectorized is None else (vectorized and np is not None)
+        self.store = VehicleStore()
+        self.vehicles: Dict[int, Vehicle] = {}
+        self.lanes: Dict[Tuple[str, int], LaneQueue] = {
+            (direction, lane_id): LaneQueue(direction, lane_id)
+            for direction, starts in LANE_STARTS.items()
+            for lane_id in range(len(starts))
+        }
+        self.grid = SpatialGrid()
+        self.id_sequence = id_sequence
+        # Sens dans lesquels de nouveaux véhicules peuvent apparaître
+        self.entry_directions = list(LANE_STARTS)
+        self.scenario = "normal"
+        self.total_spawned = 0
+        self.total_removed = 0
+
+        # Pool : vues libres réutilisées et IDs internes recyclés
+        self.pool: List[Vehicle] = [Vehicle.blank() for _ in range(pool_size)]
+        self.free_ids: List[int] = []
+        self.next_vehicle_id = 1
+        self.pool_hits = 0
+        self.pool_misses = 0
+        self.pool_high_water = 0
     
     def setup(self) -> None:
         """
         Configure le gestionnaire
         """
-        pass
+        self.clear_all_vehicles()
+        self.total_spawned = 0
+        self.total_removed = 0
     
-    def update(self, traffic_light_state: Optional[str] = None) -> List[int]:
+    def set_scenario(self, scenario: str) -> None:
+        """
+        Applique le scénario courant aux nouveaux véhicules
+        """
+        self.scenario = scenario
+    
+    def update(self, traffic_light_state: Optional[str] = None,
+               dt: float = 1.0 / FPS) -> List[int]:
         """
         Met à jour tous les véhicules
+
+        Les deux implémentations voient les positions du début du pas : un
+        véhicule réagit à la position de son prédécesseur avant son déplacement.
+
+        Returns:
+            List[int]: IDs des véhicules sortis de la scène
         """
-        pass
+        if self.vectorized:
+            return self._update_vectorized(traffic_light_state, dt)
+        return self._update_scalar(traffic_light_state, dt)
+    
+    def _update_scalar(self, traffic_light_state: Optional[str], dt: float) -> List[int]:
+        """
+        Met à jour les véhicules un par un (repli sans NumPy)
+        """
+        vehicles = self.vehicles
+        to_remove = []
+        for lane in self.lanes.values():
+            # De la queue à la tête : le prédécesseur n'a pas encore bougé
+            for vehicle_id in reversed(lane):
+                leader_id = lane.leader(vehicle_id)
+                leader = [vehicles[leader_id]] if leader_id is not None else None
+                vehicle = vehicles[vehicle_id]
+                if not vehicle.update(traffic_light_state, leader, dt):
+                    to_remove.append(vehicle_id)
+                self._update_cell(vehicle)
+
+        return to_remove
+    
+    def _update_vectorized(self, traffic_light_state: Optional[str], dt: float) -> List[int]:
+        """
+        Met à jour tous les véhicules en une série d'opérations NumPy
+
+        Même formules que Vehicle._advance, appliquées colonne par colonne.
+        """
+        store = self.store
+        columns = store.columns
+        rows = np.flatnonzero(columns["alive"][:store.size])
+        if rows.size == 0:
+            return []
+
+        frames = dt * FPS
+        direction = columns["direction"][rows]
+        distance = columns["distance"][rows]
+        length = columns["length"][rows]
+        speed = columns["speed"][rows]
+        max_speed = columns["max_speed"][rows]
+        accel_rate = columns["accel_rate"][rows]
+        decel_rate = columns["decel_rate"][rows]
+
+        # Tri par voie puis par distance : le prédécesseur est l'élément suivant
+        lane_key = direction * LANES_PER_DIRECTION + columns["lane"][rows]
+        order = np.lexsort((distance, lane_key))
+        leader_rear = np.full(rows.size, np.inf)
+        same_lane = lane_key[order[1:]] == lane_key[order[:-1]]
+        followers = order[:-1][same_lane]
+        leaders = order[1:][same_lane]
+        leader_rear[followers] = distance[leaders] - length[leaders] / 2
+
+        # Distance à l'obstacle : prédécesseur puis ligne d'arrêt
+        front = distance + length / 2
+        obstacle = leader_rear - SAFE_DISTANCE - front
+        stop_distance = STOP_LINE_DISTANCE - front
+        if traffic_light_state == RED_LIGHT_STATE:
+            must_stop = front <= STOP_LINE_DISTANCE
+        elif traffic_light_state == ORANGE_LIGHT_STATE:
+            must_stop = (front <= STOP_LINE_DISTANCE) & (speed * speed / (2 * decel_rate) <= stop_distance)
+        else:
+            must_stop = np.zeros(rows.size, dtype=bool)
+        obstacle = np.where(must_stop, np.minimum(obstacle, stop_distance), obstacle)
+
+        # Choix de l'action (mêmes règles que la version scalaire)
+        faster = np.minimum(max_speed, speed + accel_rate * frames)
+        stopping = speed * speed / (2 * decel_rate) + speed * frames
+        stopping_faster = faster * faster / (2 * decel_rate) + faster * frames
+        slower = np.maximum(0.0, speed - decel_rate * frames)
+
+        blocked = obstacle <= 0
+        braking = ~blocked & (stopping >= obstacle)
+        accelerating = ~blocked & ~braking & (speed < max_speed) & (stopping_faster < obstacle)
+        new_speed = np.select([blocked, braking, accelerating], [0.0, slower, faster], speed)
+
+        stopped = VEHICLE_STATE_CODES[VehicleState.STOPPED]
+        state = np.select(
+            [blocked, braking & (new_speed > 0), braking, accelerating, speed > 0],
+            [stopped, VEHICLE_STATE_CODES[VehicleState.SLOWING], stopped,
+             VEHICLE_STATE_CODES[VehicleState.ACCELERATING], VEHICLE_STATE_CODES[VehicleState.MOVING]],
+            stopped)
+
+        distance = distance + np.minimum(new_speed * frames, np.maximum(obstacle, 0.0))
+
+        columns["speed"][rows] = new_speed
+        columns["acceleration"][rows] = (new_speed - speed) / frames if frames else 0.0
+        columns["state"][rows] = state
+        columns["distance"][rows] = distance
+        x = columns["start_x"][rows] + DIRECTION_DX[direction] * distance
+        y = columns["start_y"][rows] + DIRECTION_DY[direction] * distance
+        columns["x"][rows] = x
+        columns["y"][rows] = y
+
+        # Index spatial : seuls les véhicules qui changent de cellule sont déplacés
+        grid = self.grid
+        grid_column = np.clip((x + grid.width / 2) // grid.cell_size, 0, grid.columns - 1)
+        grid_row = np.clip((y + grid.height / 2) // grid.cell_size, 0, grid.rows - 1)
+        cell = (grid_row * grid.columns + grid_column).astype(np.int32)
+        changed = np.flatnonzero(cell != columns["cell"][rows])
+        if changed.size:
+            for vehicle_id, new_cell in zip(columns["id"][rows[changed]].tolist(),
+                                            cell[changed].tolist()):
+                grid.move(vehicle_id, new_cell)
+            columns["cell"][rows[changed]] = cell[changed]
+
+        leaving = distance - length / 2 > LANE_LENGTH
+        return columns["id"][rows[leaving]].tolist()
     
-    def spawn_vehicle(self, scenario: str) -> Optional[Vehicle]:
+    def spawn_vehicle(self, scenario: str, direction: Optional[str] = None,
+                      lane_id: Optional[int] = None) -> Optional[Vehicle]:
         """
         Crée un nouveau véhicule
+
+        Args:
+            direction: Sens d'entrée (tiré parmi entry_directions si absent)
+            lane_id: Voie d'entrée (tirée au hasard si absente)
         """
-        pass
+        if len(self.vehicles) >= MAX_VEHICLES.get(scenario, MAX_VEHICLES["normal"]):
+            return None
+
+        if direction is None:
+            if not self.entry_directions:
+                return None
+            direction = self.rng.choice(self.entry_directions)
+        if lane_id is None:
+            lane_id = self.rng.randrange(len(LANE_STARTS[direction]))
+        vehicle_type = VehicleType.TRUCK if self.rng.random() < TRUCK_PROBABILITY else VehicleType.CAR
+
+        if not self._is_lane_entry_clear(direction, lane_id, VEHICLE_CONFIG[vehicle_type.value]["width"]):
+            return None
+
+        vehicle = self._add_vehicle(vehicle_type, lane_id, direction)
+        self.total_spawned += 1
+
+        if self.logger:
+            self.logger.log_vehicle_event(vehicle.display_id, "VEHICLE_CREATED",
+                                          vehicle.x, vehicle.y, vehicle.speed)
+        return vehicle
+    
+    def accept_vehicle(self, display_id: int, vehicle_type: VehicleType, lane_id: int,
+                       direction: str, distance: float, speed: float,
+                       max_speed: float, color: str) -> Vehicle:
+        """
+        Reçoit un véhicule transmis par un carrefour voisin
+
+        Le véhicule entre en queue de voie. S'il n'y a pas la place, il est
+        placé derrière le dernier véhicule (distance négative : file d'attente
+        hors de l'écran) et ne roule pas plus vite que lui.
+        """
+        vehicle = self._add_vehicle(vehicle_type, lane_id, direction, display_id)
+        vehicle.max_speed = max_speed
+        vehicle.color = color
+
+        tail_id = self.lanes[(direction, lane_id)].leader(vehicle.id)
+        if tail_id is not None:
+            tail = self.vehicles[tail_id]
+            limit = tail.distance - tail.width / 2 - SAFE_DISTANCE - vehicle.width / 2
+            if distance > limit:
+                distance = limit
+                speed = min(speed, tail.speed)
+        vehicle.speed = speed
+        vehicle.place(distance)
+        self._update_cell(vehicle)
+        return vehicle
     
     def remove_vehicle(self, vehicle_id: int) -> bool:
         """
         Supprime un véhicule
         """
-        pass
+        vehicle = self.vehicles.pop(vehicle_id, None)
+        if vehicle is None:
+            return False
+        self.lanes[(vehicle.direction, vehicle.lane_id)].remove(vehicle_id)
+        self.grid.remove(vehicle_id)
+
+        self.total_removed += 1
+        if self.logger:
+            self.logger.log_vehicle_event(vehicle.display_id, "VEHICLE_REMOVED",
+                                          vehicle.x, vehicle.y, vehicle.speed)
+
+        # Retour au pool : la vue et son ID interne serviront au prochain véhicule
+        vehicle._release()
+        self.pool.append(vehicle)
+        self.free_ids.append(vehicle_id)
+        return True
+    
+    def get_pool_statistics(self) -> Dict[str, int]:
+        """
+        Retourne les compteurs du pool de véhicules
+        """
+        return {
+            "pool_hits": self.pool_hits,
+            "pool_misses": self.pool_misses,
+            "pool_high_water": self.pool_high_water,
+            "pool_free": len(self.pool)
+        }
+    
+    def get_entry_lanes(self) -> List[Tuple[str, int]]:
+        """
+        Retourne les voies (sens, index) où de nouveaux véhicules peuvent apparaître
+        """
+        return [(direction, lane_id) for direction in self.entry_directions
+                for lane_id in range(len(LANE_STARTS[direction]))]
     
     def get_vehicle_count(self) -> int:
         """
         Retourne le nombre de véhicules actifs
         """
-        pass
+        return len(self.vehicles)
     
-    def get_vehicles_in_lane(self, lane_id: int) -> List[Vehicle]:
+    def get_vehicles_in_lane(self, lane_id: int, direction: Optional[str] = None) -> List[Vehicle]:
         """
-        Retourne les véhicules dans une voie donnée
+        Retourne les véhicules dans une voie donnée, du plus avancé au dernier
+
+        Args:
+            lane_id: Index de la voie dans LANE_STARTS[direction]
+            direction: Sens de circulation (toutes les directions si absent)
         """
-        pass
+        directions = [direction] if direction is not None else list(LANE_STARTS)
+        return [self.vehicles[vehicle_id]
+                for d in directions if (d, lane_id) in self.lanes
+                for vehicle_id in self.lanes[(d, lane_id)]]
+    
+    def get_vehicles_in_intersection(self) -> List[Vehicle]:
+        """
+        Retourne les véhicules présents dans le carrefour (via l'index spatial)
+        """
+        half = INTERSECTION_SIZE / 2
+        return [self.vehicles[vehicle_id]
+                for vehicle_id in self.grid.query_box(-half, -half, half, half,
+                                                      self._position_of)]
+    
+    def get_neighbors(self, vehicle_id: int, radius: float) -> List[Vehicle]:
+        """
+        Retourne les véhicules à moins de radius pixels d'un véhicule
+        """
+        vehicle = self.vehicles.get(vehicle_id)
+        if vehicle is None:
+            return []
+        x, y = vehicle.get_position()
+        return [self.vehicles[other_id]
+                for other_id in self.grid.query_radius(x, y, radius, self._position_of)
+                if other_id != vehicle_id]
+    
+    def get_leader(self, vehicle_id: int) -> Optional[Vehicle]:
+        """
+        Retourne le véhicule qui précède dans la même voie
+        """
+        vehicle = self.vehicles.get(vehicle_id)
+        if vehicle is None:
+            return None
+        leader_id = self.lanes[(vehicle.direction, vehicle.lane_id)].leader(vehicle_id)
+        return self.vehicles[leader_id] if leader_id is not None else None
+    
+    def get_follower(self, vehicle_id: int) -> Optional[Vehicle]:
+        """
+        Retourne le véhicule qui suit dans la même voie
+        """
+        vehicle = self.vehicles.get(vehicle_id)
+        if vehicle is None:
+            return None
+        follower_id = self.lanes[(vehicle.direction, vehicle.lane_id)].follower(vehicle_id)
+        return self.vehicles[follower_id] if follower_id is not None else None
+    
+    def get_all_vehicles(self) -> List[Vehicle]:
+        """
+        Retourne tous les véhicules actifs
+        """
+        return list(self.vehicles.values())
+    
+    def export_vehicles(self, column_names: Tuple[str, ...]) -> Tuple[Dict[str, bytes], List[str]]:
+        """
+        Exporte les colonnes des véhicules, voie par voie de la tête à la queue
+
+        Returns:
+            Tuple: (octets bruts de chaque colonne, couleur de chaque véhicule)
+        """
+        ordered = [self.vehicles[vehicle_id] for lane in self.lanes.values() for vehicle_id in lane]
+        rows = [vehicle._row for vehicle in ordered]
+        columns = {name: self.store.column_bytes(name, rows) for name in column_names}
+        return columns, [vehicle.color for vehicle in ordered]
+    
+    def import_vehicles(self, columns: Dict[str, bytes], colors: List[str]) -> None:
+        """
+        Remplace tous les véhicules par ceux exportés avec export_vehicles
+        """
+        self.clear_all_vehicles()
+        count = len(colors)
+        store = VehicleStore(capacity=max(16, count))
+        for name, data in columns.items():
+            store.load_column_bytes(name, data, count)
+        for row in range(count):
+            store.allocate()
+        self.store = store
+
+        vehicles = self.vehicles
+        lanes = self.lanes
+        grid = self.grid
+        cells = store.columns["cell"]
+        pool = self.pool
+        for row in range(count):
+            vehicle = pool.pop() if pool else Vehicle.blank()
+            vehicle._attach(store, row, colors[row])
+            vehicles[vehicle.id] = vehicle
+            # Export dans l'ordre de marche : l'ajout en queue reconstruit chaque voie
+            lanes[(vehicle.direction, vehicle.lane_id)].push_tail(vehicle.id)
+            grid.move(vehicle.id, int(cells[row]))
     
     def clear_all_vehicles(self) -> None:
         """
         Supprime tous les véhicules
         """
-        pass
+        # Toutes les vues retournent au pool et tous les IDs internes sont libres
+        for vehicle in self.vehicles.values():
+            vehicle._store = None
+            vehicle._row = -1
+            self.pool.append(vehicle)
+        self.free_ids.clear()
+        self.next_vehicle_id = 1
+        self.store = VehicleStore()
+        self.vehicles.clear()
+        self.grid.clear()
+        for lane in self.lanes.values():
+            lane.clear()
+    
+    def _add_vehicle(self, vehicle_type: VehicleType, lane_id: int, direction: str,
+                     display_id: Optional[int] = None) -> Vehicle:
+        """
+        Prend un véhicule dans le pool, le réinitialise et l'ajoute en queue de sa voie
+        """
+        if display_id is None and self.id_sequence is not None:
+            display_id = next(self.id_sequence)
+
+        if self.free_ids:
+            vehicle_id = self.free_ids.pop()
+        else:
+            vehicle_id = self.next_vehicle_id
+            self.next_vehicle_id += 1
+
+        if self.pool:
+            vehicle = self.pool.pop()
+            self.pool_hits += 1
+        else:
+            vehicle = Vehicle.blank()
+            self.pool_misses += 1
+        vehicle._reset(vehicle_type, lane_id, direction, self.rng, self.store,
+                       vehicle_id, display_id)
+
+        self.vehicles[vehicle_id] = vehicle
+        self.pool_high_water = max(self.pool_high_water, len(self.vehicles))
+        self.lanes[(direction, lane_id)].push_tail(vehicle_id)
+        self._update_cell(vehicle)
+        return vehicle
+    
+    def _position_of(self, vehicle_id: int) -> Tuple[float, float]:
+        """
+        Retourne la position d'un véhicule (utilisée par l'index spatial)
+        """
+        return self.vehicles[vehicle_id].get_position()
+    
+    def _update_cell(self, vehicle: Vehicle) -> None:
+        """
+        Met à jour la cellule d'un véhicule dans l'index spatial
+        """
+        cell = self.grid.cell_of(vehicle.x, vehicle.y)
+        self.grid.move(vehicle.id, cell)
+        vehicle._store.columns["cell"][vehicle._row] = cell
+    
+    def _is_lane_entry_clear(self, direction: str, lane_id: int, length: float) -> bool:
+        """
+        Vérifie qu'il reste de la place à l'entrée d'une voie
+        """
+        # Seul le dernier véhicule entré peut gêner
+        tail_id = self.lanes[(direction, lane_id)].tail
+        if tail_id is None:
+            return True
+        tail = self.vehicles[tail_id]
+        return tail.distance - tail.width / 2 >= length + SAFE_DISTANCE
 
 
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    pass
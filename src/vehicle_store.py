@@ -0,0 +1,200 @@
+"""
+Stockage en colonnes (struct-of-arrays) de l'état des véhicules
+Responsable : Ndeye Khady Syll
+"""
+
+import array
+from typing import Dict, List, Optional, Any
+from constants import *
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : repli sur le module array
+    np = None
+
+# Codes entiers des colonnes catégorielles
+DIRECTIONS = ["north", "south", "east", "west"]
+DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+
+# Colonnes flottantes (float64) et entières (int32)
+FLOAT_COLUMNS = (
+    "x", "y", "speed", "acceleration", "distance",
+    "max_speed", "accel_rate", "decel_rate", "length",
+    "start_x", "start_y"
+)
+INT_COLUMNS = ("id", "display_id", "lane", "direction", "type", "state", "alive", "cell")
+
+ARRAY_TYPECODES = {"f8": "d", "i4": "i"}
+ITEM_SIZES = {"f8": 8, "i4": 4}
+
+
+def _new_column(kind: str, capacity: int):
+    """
+    Crée une colonne de zéros (tableau NumPy si disponible, sinon array.array)
+    """
+    if np is not None:
+        return np.zeros(capacity, dtype=kind)
+    return array.array(ARRAY_TYPECODES[kind], bytes(ITEM_SIZES[kind] * capacity))
+
+
+class VehicleStore:
+    """
+    Stocke l'état de tous les véhicules dans des tableaux contigus
+
+    Chaque véhicule occupe une ligne ; les objets Vehicle ne sont que des vues
+    sur leur ligne. Les lignes libérées sont marquées mortes (alive = 0) puis
+    récupérées par compactage avant tout doublement de la capacité.
+    """
+
+    def __init__(self, capacity: int = 16):
+        """
+        Initialise le stockage
+
+        Args:
+            capacity: Nombre de lignes allouées au départ
+        """
+        self.capacity = max(1, capacity)
+        self.size = 0       # Lignes utilisées (vivantes ou libérées)
+        self.free = 0       # Lignes libérées en attente de compactage
+        self.columns: Dict[str, Any] = {}
+        for name in FLOAT_COLUMNS:
+            self.columns[name] = _new_column("f8", self.capacity)
+        for name in INT_COLUMNS:
+            self.columns[name] = _new_column("i4", self.capacity)
+
+        # Vue (Vehicle) associée à chaque ligne, pour mettre à jour son index
+        self.views: List[Optional[Any]] = [None] * self.capacity
+
+    def __len__(self) -> int:
+        """
+        Retourne le nombre de lignes vivantes
+        """
+        return self.size - self.free
+
+    def allocate(self, view: Any = None) -> int:
+        """
+        Réserve une ligne pour un nouveau véhicule
+
+        Returns:
+            int: Index de la ligne allouée
+        """
+        if self.size == self.capacity:
+            if self.free:
+                self.compact()
+            else:
+                self._grow(self.capacity * 2)
+
+        row = self.size
+        self.size += 1
+        self.columns["alive"][row] = 1
+        self.views[row] = view
+        return row
+
+    def release(self, row: int) -> None:
+        """
+        Libère une ligne (récupérée au prochain compactage)
+        """
+        if not self.columns["alive"][row]:
+            return
+        self.columns["alive"][row] = 0
+        self.views[row] = None
+        self.free += 1
+
+        # Compactage automatique quand plus de la moitié des lignes sont mortes
+        if self.free > self.size // 2:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Regroupe les lignes vivantes au début des tableaux en gardant leur ordre
+        """
+        if not self.free:
+            return
+
+        alive = self.columns["alive"]
+        rows = [row for row in range(self.size) if alive[row]]
+        count = len(rows)
+
+        for name, column in self.columns.items():
+            if np is not None:
+                column[:count] = column[rows]
+            else:
+                values = [column[row] for row in rows]
+                column[:count] = array.array(column.typecode, values)
+
+        views = [self.views[row] for row in rows]
+        for new_row, view in enumerate(views):
+            self.views[new_row] = view
+            if view is not None:
+                view._row = new_row
+        for row in range(count, self.size):
+            self.views[row] = None
+            alive[row] = 0
+
+        self.size = count
+        self.free = 0
+
+    def clear(self) -> None:
+        """
+        Libère toutes les lignes
+        """
+        for row in range(self.size):
+            self.columns["alive"][row] = 0
+            self.views[row] = None
+        self.size = 0
+        self.free = 0
+
+    def alive_rows(self) -> List[int]:
+        """
+        Retourne les index des lignes vivantes
+        """
+        alive = self.columns["alive"]
+        return [row for row in range(self.size) if alive[row]]
+
+    def column(self, name: str):
+        """
+        Retourne la partie utilisée d'une colonne (vue NumPy ou copie array)
+        """
+        return self.columns[name][:self.size]
+
+    def column_bytes(self, name: str, rows: List[int]) -> bytes:
+        """
+        Retourne les valeurs d'une colonne pour des lignes données, en octets bruts
+        """
+        column = self.columns[name]
+        if np is not None:
+            return column[np.asarray(rows, dtype=np.intp)].tobytes()
+        return array.array(column.typecode, [column[row] for row in rows]).tobytes()
+
+    def load_column_bytes(self, name: str, data: bytes, count: int) -> None:
+        """
+        Remplit les count premières lignes d'une colonne à partir d'octets bruts
+        """
+        if count > self.capacity:
+            self._grow(count)
+        column = self.columns[name]
+        if np is not None:
+            column[:count] = np.frombuffer(data, dtype=column.dtype, count=count)
+        else:
+            values = array.array(column.typecode)
+            values.frombytes(data)
+            column[:count] = values
+
+    def _grow(self, capacity: int) -> None:
+        """
+        Agrandit tous les tableaux à la capacité donnée
+        """
+        for name, column in self.columns.items():
+            if np is not None:
+                grown = np.zeros(capacity, dtype=column.dtype)
+                grown[:self.size] = column[:self.size]
+                self.columns[name] = grown
+            else:
+                column.extend(_new_column("f8" if column.typecode == "d" else "i4",
+                                          capacity - self.capacity))
+        self.views.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,82 @@
+"""
+Tests unitaires pour la suite de bancs d'essai
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Ajouter le répertoire src au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from benchmark import (populate_network, run_suite, compare_results, save_report,
+                       load_report, VEHICLES_PER_JUNCTION)
+from scenario_manager import ScenarioType
+
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Tests pour la suite de bancs d'essai
+    """
+    
+    def test_populate_network(self):
+        """
+        Test du placement des véhicules sur un réseau juste assez grand
+        """
+        vehicles = VEHICLES_PER_JUNCTION * 3 + 7
+        network = populate_network(vehicles, "normal", seed=1)
+        self.assertEqual(network.get_statistics()["vehicle_count"], vehicles)
+        self.assertGreaterEqual(len(network.junctions), 4)
+        for junction in network.junctions.values():
+            for lane in junction.vehicle_manager.lanes.values():
+                distances = [junction.vehicle_manager.vehicles[vehicle_id].distance
+                             for vehicle_id in lane]
+                self.assertTrue(all(d >= 0 for d in distances))
+    
+    def test_run_suite(self):
+        """
+        Test d'une exécution réduite : tous les scénarios et tous les bancs headless
+        """
+        report = run_suite(sizes=[10], render=False)
+        self.assertEqual(report["render_skipped"], "désactivé")
+        scenarios = {result["scenario"] for result in report["results"]
+                     if result["bench"] == "steps"}
+        self.assertEqual(scenarios, {scenario.value for scenario in ScenarioType})
+        benches = {result["bench"] for result in report["results"]}
+        self.assertEqual(benches, {"steps", "churn", "logger"})
+        for result in report["results"]:
+            self.assertEqual(result["vehicles"], 0 if result["bench"] == "logger" else 10)
+            for value in result["metrics"].values():
+                self.assertGreater(value, 0)
+        logger = [result for result in report["results"] if result["bench"] == "logger"]
+        self.assertEqual(len(logger), 1)
+        self.assertGreater(logger[0]["metrics"]["events"], 1000)
+    
+    def test_compare_results(self):
+        """
+        Test de la détection des régressions par rapport à une référence
+        """
+        def report(steps_per_second, us_per_spawn):
+            return {"results": [
+                {"bench": "steps", "vehicles": 100, "scenario": "normal",
+                 "metrics": {"steps_per_second": steps_per_second}},
+                {"bench": "churn", "vehicles": 100,
+                 "metrics": {"us_per_spawn": us_per_spawn}}
+            ]}
+        
+        baseline = report(1000.0, 10.0)
+        self.assertEqual(compare_results(report(900.0, 11.0), baseline, 0.2), [])
+        regressions = compare_results(report(700.0, 13.0), baseline, 0.2)
+        self.assertEqual({r["metric"] for r in regressions}, {"steps_per_second", "us_per_spawn"})
+        # Une mesure absente de la référence n'est pas comparée
+        self.assertEqual(compare_results(report(1.0, 100.0), {"results": []}), [])
+        
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "baseline.json")
+            save_report(baseline, filename)
+            self.assertEqual(load_report(filename), baseline)
+
+
+if __name__ == '__main__':
+    unittest.main()
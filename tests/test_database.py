@@ -3,13 +3,21 @@ Tests unitaires pour le module database
 """
 
 import unittest
+import tempfile
 import sys
 import os
+import threading
+import csv
+import gzip
+from datetime import datetime, timedelta
 
 # Ajouter le répertoire src au path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from database import DatabaseManager
+from database import (DatabaseManager, np, ADDED_COLUMNS, EVENT_COLUMNS, EVENT_INDEXES, LEGACY_PARTITION,
+                      SELECT_BY_TYPE_SQL, SELECT_BY_SCENARIO_SQL, SELECT_BY_VEHICLE_SQL,
+                      index_name, partition_name)
+from constants import EVENTS_TABLE, STATS_TABLE
 
 
 class TestDatabase(unittest.TestCase):
@@ -21,43 +29,285 @@ class TestDatabase(unittest.TestCase):
         """
         Préparation avant chaque test
         """
-        pass
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "test.db")
+        self.db = DatabaseManager(self.db_path)
+        self.assertTrue(self.db.connect())
     
     def tearDown(self):
         """
         Nettoyage après chaque test
         """
-        pass
+        self.db.disconnect()
+        self.tmpdir.cleanup()
     
     def test_database_connection(self):
         """
         Test la connexion à la base de données
         """
-        pass
+        self.assertIsNotNone(self.db.connection)
+        self.db.disconnect()
+        self.assertIsNone(self.db.connection)
+        self.assertTrue(self.db.connect())
     
     def test_table_creation(self):
         """
         Test la création des tables
         """
-        pass
+        tables = [row[0] for row in self.db.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'view')")]
+        self.assertIn(EVENTS_TABLE, tables)
+        self.assertTrue(self.db.create_tables())
+    
+    def test_indexes_and_journal(self):
+        """
+        Test du mode WAL et de l'usage des index par les requêtes filtrées
+        """
+        self.assertEqual(self.db.journal_mode, "wal")
+        self.db.insert_event("SIMULATION_START", "START", scenario="normal")
+        partition = partition_name(datetime.now().isoformat())
+        indexes = {row[0] for row in self.db.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertTrue({index_name(partition, suffix) for suffix in EVENT_INDEXES} <= indexes)
+        for query, params, suffix in ((SELECT_BY_TYPE_SQL, ("ERROR", 10), "type_time"),
+                                      (SELECT_BY_SCENARIO_SQL, ("night", 10), "scenario_time"),
+                                      (SELECT_BY_VEHICLE_SQL, (1,), "vehicle_time")):
+            plan = " ".join(row[-1] for row in self.db.connection.execute(
+                f"EXPLAIN QUERY PLAN {query}", params))
+            self.assertIn(f"USING INDEX {index_name(partition, suffix)}", plan)
+            # Le tri par horodatage est lu dans l'index
+            self.assertNotIn("TEMP B-TREE", plan)
+    
+    def test_partitions_and_retention(self):
+        """
+        Test de la répartition par jour et de la suppression de partitions entières
+        """
+        now = datetime.now()
+        rows = []
+        for days in (40, 35, 0):
+            timestamp = (now - timedelta(days=days)).isoformat()
+            rows += [(timestamp, "VEHICLE_CREATED", "VEHICLE_CREATED", None, "normal",
+                      days, 0.0, 0.0, 1.0, None)] * 3
+        self.assertEqual(self.db.insert_events(rows), 9)
+        self.assertEqual(len(self.db.partitions), 3)
+        self.assertEqual(len(self.db.get_all_events()), 9)
+        self.assertEqual(len(self.db.get_vehicle_events(40)), 3)
+        ids = [row[0] for row in self.db.get_all_events()]
+        self.assertEqual(len(set(ids)), 9)
+        
+        self.assertEqual(self.db.clear_old_events(30), 6)
+        self.assertEqual(self.db.partitions, [partition_name(now.isoformat())])
+        self.assertEqual(len(self.db.get_all_events()), 3)
+        # Les IDs continuent après une reconnexion
+        self.db.disconnect()
+        self.assertTrue(self.db.connect())
+        self.assertGreater(self.db.insert_event("ERROR", "test"), max(ids))
+        
+        self.assertTrue(self.db.reset_database())
+        self.assertEqual(self.db.partitions, [])
+        self.assertEqual(self.db.get_all_events(), [])
+    
+    def test_two_managers_same_file(self):
+        """
+        Test de deux gestionnaires (processus) écrivant dans le même fichier
+        """
+        other = DatabaseManager(self.db_path)
+        self.assertTrue(other.connect())
+        try:
+            self.assertEqual(self.db.insert_event("ERROR", "a"), 1)
+            self.assertEqual(other.insert_event("ERROR", "b"), 2)
+            old = (datetime.now() - timedelta(days=40)).isoformat()
+            self.assertEqual(other.insert_events(
+                [(old, "ERROR", "b", None, None, None, None, None, None, None)] * 3), 3)
+            self.assertEqual(other.insert_event("ERROR", "b"), 6)
+            recent = (datetime.now() - timedelta(days=20)).isoformat()
+            self.assertEqual(self.db.insert_events(
+                [(recent, "ERROR", "a", None, None, None, None, None, None, None)]), 1)
+            # La vue reconstruite garde la partition créée par l'autre gestionnaire
+            self.assertEqual(len(self.db.get_all_events()), 7)
+            self.assertEqual(self.db.get_statistics()["total_events"], 7)
+            
+            # Écritures concurrentes par lots (loggers de deux processus)
+            threads = [threading.Thread(target=manager.insert_events, args=(
+                [(datetime.now().isoformat(), "ERROR", name, None, None, None, None, None,
+                  None, None)] * 200,)) for manager, name in ((self.db, "a"), (other, "b"))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            ids = [row[0] for row in self.db.get_all_events(1000)]
+            self.assertEqual(sorted(ids), list(range(1, 408)))
+        finally:
+            other.disconnect()
+    
+    def test_legacy_table_migration(self):
+        """
+        Test de la reprise d'une ancienne table non partitionnée
+        """
+        self.db.reset_database()
+        self.db.connection.execute(f"DROP VIEW {EVENTS_TABLE}")
+        # Ancien schéma : sans les colonnes ajoutées depuis (sim_time)
+        old_columns = [column for column in EVENT_COLUMNS if column not in ADDED_COLUMNS]
+        self.db.connection.execute(f"CREATE TABLE {EVENTS_TABLE} ({', '.join(old_columns)})")
+        self.db.connection.execute(f"INSERT INTO {EVENTS_TABLE} VALUES "
+                                   f"(7, '2020-01-01T00:00:00', 'ERROR', 'old', "
+                                   f"NULL, NULL, NULL, NULL, NULL, NULL)")
+        self.db.connection.commit()
+        self.assertTrue(self.db.create_tables())
+        self.assertEqual(self.db.partitions, [LEGACY_PARTITION])
+        self.assertEqual(self.db.insert_event("ERROR", "new", sim_time=2.5), 8)
+        self.assertEqual(self.db.get_events_by_type("ERROR")[0][-1], 2.5)
+        self.assertEqual(len(self.db.get_events_by_type("ERROR")), 2)
+        self.assertEqual(self.db.clear_old_events(30), 1)
+        self.assertEqual(len(self.db.get_all_events()), 1)
     
     def test_event_insertion(self):
         """
         Test l'insertion d'événements
         """
-        pass
+        first = self.db.insert_event("SIMULATION_START", "START", scenario="normal")
+        second = self.db.insert_event("VEHICLE_CREATED", "VEHICLE_CREATED", etat_feu="VERT",
+                                      scenario="normal", id_voiture=1,
+                                      position_x=-400.0, position_y=0.0, vitesse=2.0)
+        self.assertGreater(second, first)
+        self.assertEqual(len(self.db.get_all_events()), 2)
     
     def test_event_retrieval(self):
         """
         Test la récupération d'événements
         """
-        pass
+        self.db.insert_event("VEHICLE_CREATED", "VEHICLE_CREATED", scenario="normal", id_voiture=1)
+        self.db.insert_event("VEHICLE_CREATED", "VEHICLE_CREATED", scenario="night", id_voiture=2)
+        self.db.insert_event("VEHICLE_REMOVED", "VEHICLE_REMOVED", scenario="night", id_voiture=1)
+        self.assertEqual(len(self.db.get_events_by_type("VEHICLE_CREATED")), 2)
+        self.assertEqual(len(self.db.get_events_by_scenario("night")), 2)
+        events = self.db.get_vehicle_events(1)
+        self.assertEqual([event[2] for event in events], ["VEHICLE_CREATED", "VEHICLE_REMOVED"])
     
     def test_statistics_calculation(self):
         """
         Test le calcul des statistiques
         """
-        pass
+        self.db.insert_event("VEHICLE_CREATED", "VEHICLE_CREATED", scenario="normal",
+                             id_voiture=1, vitesse=1.0)
+        self.db.insert_event("VEHICLE_REMOVED", "VEHICLE_REMOVED", scenario="normal",
+                             id_voiture=1, vitesse=3.0)
+        stats = self.db.get_statistics()
+        self.assertEqual(stats["total_events"], 2)
+        self.assertEqual(stats["events_by_type"]["VEHICLE_CREATED"], 1)
+        self.assertEqual(stats["total_vehicles"], 1)
+        self.assertAlmostEqual(stats["average_speed"], 2.0)
+    
+    def test_incremental_statistics(self):
+        """
+        Test des agrégats maintenus à l'insertion et de leur reconstruction
+        """
+        now = datetime.now()
+        old = (now - timedelta(days=40)).isoformat()
+        self.db.insert_events([
+            (old, "VEHICLE_CREATED", "VEHICLE_CREATED", "ROUGE", "night", 1, 0.0, 0.0, 4.0, None),
+            (now.isoformat(), "VEHICLE_CREATED", "VEHICLE_CREATED", "VERT", "normal", 2, 0.0, 0.0, 1.0, None)
+        ])
+        self.db.insert_events([
+            (now.isoformat(), "VEHICLE_REMOVED", "VEHICLE_REMOVED", "VERT", "normal", 2, 0.0, 0.0, 2.0, None),
+            (now.isoformat(), "TRAFFIC_LIGHT_CHANGE", "VERT -> ORANGE", None, "normal",
+             None, None, None, None, None)
+        ])
+        stats = self.db.get_statistics()
+        self.assertEqual(stats["total_events"], 4)
+        self.assertEqual(stats["events_by_type"], {"VEHICLE_CREATED": 2, "VEHICLE_REMOVED": 1,
+                                                   "TRAFFIC_LIGHT_CHANGE": 1})
+        self.assertEqual(stats["events_by_scenario"], {"night": 1, "normal": 3})
+        self.assertEqual(stats["events_by_light_state"], {"ROUGE": 1, "VERT": 2})
+        self.assertEqual(stats["total_vehicles"], 2)
+        self.assertEqual(stats["vehicles_exited"], 1)
+        self.assertAlmostEqual(stats["average_speed"], 7.0 / 3)
+        self.assertEqual((stats["min_speed"], stats["max_speed"]), (1.0, 4.0))
+        
+        # Les images clés de trajectoire ne comptent pas dans les vitesses des véhicules
+        self.db.insert_events([(now.isoformat(), "VEHICLE_POSITION", "moving", "VERT",
+                                "normal", 2, 5.0, 5.0, 9.0, 1.5)])
+        stats = self.db.get_statistics()
+        self.assertEqual(stats["events_by_type"]["VEHICLE_POSITION"], 1)
+        self.assertAlmostEqual(stats["average_speed"], 7.0 / 3)
+        self.assertEqual(stats["max_speed"], 4.0)
+        
+        # Agrégats faussés puis réconciliés avec les événements
+        self.db.connection.execute(f"UPDATE {STATS_TABLE} SET count = count + 100")
+        self.db.connection.commit()
+        self.assertNotEqual(self.db.get_statistics(), stats)
+        self.assertTrue(self.db.rebuild_statistics())
+        self.assertEqual(self.db.get_statistics(), stats)
+        
+        # La rétention retire les agrégats de la partition supprimée
+        self.assertEqual(self.db.clear_old_events(30), 1)
+        stats = self.db.get_statistics()
+        self.assertEqual(stats["total_events"], 4)
+        self.assertEqual(stats["events_by_scenario"], {"normal": 4})
+        self.assertEqual(stats["max_speed"], 2.0)
+    
+    def insert_export_events(self):
+        """
+        Insère deux jours d'événements pour les tests d'export
+        """
+        self.day = datetime(2024, 5, 2, 8, 0, 0)
+        rows = []
+        for index in range(10):
+            timestamp = (self.day + timedelta(hours=index * 6)).isoformat()
+            scenario = "night" if index % 2 else "normal"
+            rows.append((timestamp, "VEHICLE_CREATED", "VEHICLE_CREATED", "VERT", scenario,
+                         index, float(index), -float(index), 1.5, None))
+        rows.append(((self.day + timedelta(hours=61)).isoformat(), "ERROR", "[test] erreur",
+                     None, None, None, None, None, None, None))
+        self.db.insert_events(rows)
+    
+    def test_export_to_csv(self):
+        """
+        Test de l'export CSV par blocs, filtré et compressé
+        """
+        self.insert_export_events()
+        filename = os.path.join(self.tmpdir.name, "events.csv")
+        self.assertTrue(self.db.export_to_csv(filename, chunk_size=3))
+        with open(filename, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], EVENT_COLUMNS)
+        self.assertEqual([int(row[0]) for row in rows[1:]], list(range(1, 12)))
+        
+        filename = os.path.join(self.tmpdir.name, "events.csv.gz")
+        self.assertTrue(self.db.export_to_csv(filename, start=self.day + timedelta(hours=12),
+                                              end=self.day + timedelta(days=2),
+                                              scenario="normal", chunk_size=2))
+        with gzip.open(filename, "rt", newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))[1:]
+        # 08h + 12h, 24h, 36h (index 2, 4, 6) ; index 8 est hors de la fenêtre
+        self.assertEqual([int(row[6]) for row in rows], [2, 4, 6])
+        
+        self.assertTrue(self.db.export_to_csv(filename, event_type="ERROR"))
+        with gzip.open(filename, "rt", newline="", encoding="utf-8") as f:
+            self.assertEqual(len(list(csv.reader(f))), 2)
+    
+    @unittest.skipIf(np is None, "NumPy n'est pas installé")
+    def test_export_to_npz(self):
+        """
+        Test de l'export colonnaire NumPy
+        """
+        self.insert_export_events()
+        filename = os.path.join(self.tmpdir.name, "events.npz")
+        self.assertTrue(self.db.export_to_npz(filename, chunk_size=4))
+        with np.load(filename) as data:
+            self.assertEqual(len(data["id"]), 11)
+            self.assertEqual(data["id_voiture"][-1], -1)
+            self.assertTrue(np.isnan(data["vitesse"][-1]))
+            self.assertEqual(data["timestamp"][0], np.datetime64(self.day.isoformat(), "us"))
+            labels = data["event_type_labels"]
+            self.assertEqual(labels[data["event_type"][-1]], "ERROR")
+            self.assertEqual(data["etat_feu"][-1], -1)
+            np.testing.assert_array_equal(data["position_x"][:10], np.arange(10.0))
+        
+        self.assertTrue(self.db.export_to_npz(filename, scenario="night"))
+        with np.load(filename) as data:
+            np.testing.assert_array_equal(data["id_voiture"], [1, 3, 5, 7, 9])
+            self.assertEqual(list(data["scenario_labels"]), ["night"])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,144 @@
+"""
+Tests unitaires pour le module logger
+"""
+
+import unittest
+import tempfile
+import threading
+import sys
+import os
+
+# Ajouter le répertoire src au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from database import DatabaseManager
+from logger import EventLogger
+from constants import EVENTS_TABLE
+
+
+class TestEventLogger(unittest.TestCase):
+    """
+    Tests pour l'écriture des événements par lots
+    """
+    
+    def setUp(self):
+        """
+        Préparation avant chaque test
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.tmpdir.name, "test.db"))
+        self.assertTrue(self.db.connect())
+    
+    def tearDown(self):
+        """
+        Nettoyage après chaque test
+        """
+        self.db.disconnect()
+        self.tmpdir.cleanup()
+    
+    def count_events(self) -> int:
+        """
+        Nombre d'événements en base
+        """
+        return self.db.connection.execute(f"SELECT COUNT(*) FROM {EVENTS_TABLE}").fetchone()[0]
+    
+    def test_flush_writes_everything(self):
+        """
+        Test de flush : tous les événements journalisés sont en base, par lots
+        """
+        logger = EventLogger(self.db, batch_size=100, flush_interval=60.0)
+        logger.current_scenario = "night"
+        for vehicle_id in range(250):
+            logger.log_vehicle_event(vehicle_id, "VEHICLE_CREATED", 1.0, 2.0, 0.5)
+        self.assertTrue(logger.flush(timeout=10.0))
+        self.assertEqual(self.count_events(), 250)
+        stats = logger.get_queue_statistics()
+        self.assertEqual(stats["written"], 250)
+        self.assertEqual(stats["batches"], 3)
+        self.assertEqual(len(self.db.get_events_by_scenario("night", 1000)), 250)
+        logger.close()
+    
+    def test_flush_by_interval(self):
+        """
+        Test de l'écriture d'un lot incomplet après le délai
+        """
+        logger = EventLogger(self.db, batch_size=1000, flush_interval=0.05)
+        logger.log_simulation_event("START")
+        written = threading.Event()
+        for _ in range(100):
+            if logger.get_queue_statistics()["written"]:
+                written.set()
+                break
+            written.wait(0.05)
+        self.assertTrue(written.is_set())
+        logger.close()
+    
+    def test_close_then_log(self):
+        """
+        Test de close : la file est vidée, les événements suivants sont écrits directement
+        """
+        logger = EventLogger(self.db, flush_interval=60.0)
+        for vehicle_id in range(10):
+            logger.log_vehicle_event(vehicle_id, "VEHICLE_REMOVED")
+        logger.close()
+        self.assertEqual(self.count_events(), 10)
+        logger.log_simulation_event("STOP")
+        self.assertEqual(self.count_events(), 11)
+    
+    def test_overflow_policies(self):
+        """
+        Test des politiques de saturation de la file
+        """
+        # Thread d'écriture bloqué par le verrou de la base : la file se remplit
+        for policy, expected_dropped in (("drop_oldest", 15), ("sample", 18)):
+            logger = EventLogger(self.db, queue_size=5, batch_size=5,
+                                 flush_interval=60.0, overflow=policy, sample_every=5)
+            with self.db.lock:
+                for vehicle_id in range(20):
+                    logger.log_vehicle_event(vehicle_id, "VEHICLE_CREATED")
+                dropped = logger.get_queue_statistics()["dropped"]
+            logger.close()
+            # Le thread a pu retirer un premier lot avant d'être bloqué
+            self.assertLessEqual(dropped, expected_dropped)
+            self.assertGreater(dropped, 0)
+            stats = logger.get_queue_statistics()
+            self.assertEqual(stats["written"] + stats["dropped"], 20)
+        
+        with self.assertRaises(ValueError):
+            EventLogger(self.db, overflow="ignore")
+    
+    def test_block_policy_loses_nothing(self):
+        """
+        Test de la politique "block" : l'appelant attend, aucun événement perdu
+        """
+        logger = EventLogger(self.db, queue_size=8, batch_size=4, flush_interval=60.0,
+                             overflow="block")
+        for vehicle_id in range(40):
+            logger.log_vehicle_event(vehicle_id, "VEHICLE_CREATED")
+        logger.close()
+        self.assertEqual(self.count_events(), 40)
+        self.assertEqual(logger.get_queue_statistics()["dropped"], 0)
+        self.assertLessEqual(logger.get_queue_statistics()["max_queue_depth"], 8)
+    
+    def test_sample_rates(self):
+        """
+        Test de l'échantillonnage par type d'événement
+        """
+        logger = EventLogger(self.db, flush_interval=60.0,
+                             sample_rates={"VEHICLE_CREATED": 0.25, "ERROR": 0.0})
+        for vehicle_id in range(100):
+            logger.log_vehicle_event(vehicle_id, "VEHICLE_CREATED")
+            logger.log_vehicle_event(vehicle_id, "VEHICLE_REMOVED")
+        logger.log_error("ignorée")
+        logger.close()
+        self.assertEqual(len(self.db.get_events_by_type("VEHICLE_CREATED", 1000)), 25)
+        self.assertEqual(len(self.db.get_events_by_type("VEHICLE_REMOVED", 1000)), 100)
+        self.assertEqual(self.db.get_events_by_type("ERROR"), [])
+        self.assertEqual(logger.get_queue_statistics()["sampled_out"], 76)
+        
+        with self.assertRaises(ValueError):
+            EventLogger(self.db, sample_rates={"ERROR": 1.5})
+
+
+if __name__ == '__main__':
+    unittest.main()
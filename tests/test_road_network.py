@@ -0,0 +1,151 @@
+"""
+Tests unitaires pour le module road_network
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire src au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from road_network import RoadNetwork, Handoff, JUNCTION_SPACING
+from parallel_network import ParallelRoadNetwork, HandoffOutbox, partition_indices
+from vehicle import VehicleType
+from constants import *
+
+
+class TestRoadNetwork(unittest.TestCase):
+    """
+    Tests pour le réseau multi-carrefours
+    """
+    
+    def setUp(self):
+        """
+        Préparation avant chaque test
+        """
+        self.network = RoadNetwork(2, 3, seed=7, scenario="rush_hour")
+        self.assertTrue(self.network.setup())
+    
+    def test_grid_connections(self):
+        """
+        Test des liaisons entre carrefours voisins
+        """
+        self.assertEqual(len(self.network.junctions), 6)
+        corner = self.network.junction_at(0, 0)
+        self.assertEqual(corner.neighbors, {"north": 3, "east": 1})
+        # Les véhicules n'apparaissent que sur les entrées en bordure du réseau
+        self.assertEqual(sorted(corner.vehicle_manager.entry_directions), ["east", "north"])
+        center = self.network.junction_at(1, 1)
+        self.assertEqual(sorted(center.vehicle_manager.entry_directions), ["south"])
+    
+    def test_corridor(self):
+        """
+        Test de la création d'un corridor
+        """
+        corridor = RoadNetwork.corridor(4, seed=1)
+        corridor.setup()
+        self.assertEqual((corridor.rows, corridor.columns), (1, 4))
+        self.assertNotIn("east", corridor.junction_at(0, 1).vehicle_manager.entry_directions)
+    
+    def test_vehicles_are_conserved(self):
+        """
+        Test que chaque véhicule créé est soit sorti du réseau, soit encore présent
+        """
+        stats = self.network.run_for(60.0)
+        self.assertGreater(stats["total_handed_off"], 0)
+        self.assertEqual(stats["total_handed_off"], stats["total_received"])
+        self.assertEqual(stats["total_spawned"],
+                         stats["total_exited"] + stats["vehicle_count"])
+    
+    def test_unique_vehicle_ids(self):
+        """
+        Test que les IDs restent uniques à travers le réseau
+        """
+        self.network.run_for(30.0)
+        ids = [state[1] for state in self.network.get_vehicle_states()]
+        self.assertEqual(len(ids), len(set(ids)))
+    
+    def test_same_seed_same_result(self):
+        """
+        Test du déterminisme avec une graine fixée
+        """
+        other = RoadNetwork(2, 3, seed=7, scenario="rush_hour")
+        other.setup()
+        self.network.run_for(20.0)
+        other.run_for(20.0)
+        self.assertEqual(self.network.get_vehicle_states(), other.get_vehicle_states())
+    
+    def test_receive_handoff(self):
+        """
+        Test de l'entrée d'un véhicule transmis par un voisin
+        """
+        junction = self.network.junction_at(0, 1)
+        junction.receive(Handoff(junction.index, 0, 999, VehicleType.CAR, "east", 0,
+                                 810.0 - JUNCTION_SPACING, 2.0, 3.0, "blue"))
+        vehicle, = [vehicle for vehicle in junction.vehicle_manager.get_all_vehicles()
+                    if vehicle.display_id == 999]
+        self.assertEqual(vehicle.direction, "east")
+        self.assertAlmostEqual(vehicle.distance, 10.0)
+        self.assertEqual(junction.total_received, 1)
+    
+    def test_invalid_size(self):
+        """
+        Test du refus d'un réseau vide
+        """
+        with self.assertRaises(ValueError):
+            RoadNetwork(0, 3)
+
+
+class TestParallelRoadNetwork(unittest.TestCase):
+    """
+    Tests pour l'exécution partitionnée sur plusieurs processus
+    """
+    
+    def test_partition_indices(self):
+        """
+        Test du découpage en blocs contigus
+        """
+        self.assertEqual(partition_indices(7, 3), [[0, 1, 2], [3, 4], [5, 6]])
+        self.assertEqual(partition_indices(2, 4), [[0], [1]])
+        # Grille 4x5 sur 2 processus : deux lignes entières chacun
+        self.assertEqual(partition_indices(20, 2), [list(range(10)), list(range(10, 20))])
+    
+    def test_outbox_round_trip(self):
+        """
+        Test de l'écriture puis lecture d'une boîte d'envoi partagée
+        """
+        outbox = HandoffOutbox(workers=2, capacity=4)
+        reader = HandoffOutbox(2, 4, name=outbox.name)
+        try:
+            handoff = Handoff(3, 1, 42, VehicleType.TRUCK, "north", 1, 2.5, 1.25, 2.0, "#FF0000")
+            outbox.write(1, [handoff])
+            outbox.write(0, [])
+            self.assertEqual(reader.read(1), [handoff])
+            self.assertEqual(reader.read(0), [])
+            with self.assertRaises(OverflowError):
+                outbox.write(0, [handoff] * 5)
+        finally:
+            reader.close()
+            outbox.close()
+    
+    def test_same_result_as_single_process(self):
+        """
+        Test qu'à graine égale le mode parallèle reproduit le mode mono-processus
+        """
+        single = RoadNetwork(3, 3, seed=11, scenario="rush_hour")
+        single.setup()
+        expected = single.run_for(20.0)
+
+        with ParallelRoadNetwork(3, 3, seed=11, scenario="rush_hour", workers=3) as network:
+            stats = network.run_for(20.0)
+            states = network.get_vehicle_states()
+
+        self.assertGreater(stats["total_received"], 0)
+        for key in ("vehicle_count", "total_spawned", "total_exited", "total_received"):
+            self.assertEqual(stats[key], expected[key])
+        self.assertEqual(states, single.get_vehicle_states())
+
+
+if __name__ == '__main__':
+    unittest.main()
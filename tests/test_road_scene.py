@@ -0,0 +1,245 @@
+"""
+Tests unitaires pour le module road_scene (sans affichage)
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire src au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from road_scene import RoadScene, CanvasScene, MIN_MOVE_PIXELS, vehicle_shape, vehicle_shape_name
+from constants import *
+
+
+class FakeSprite:
+    """
+    Sprite Turtle factice : compte les redessins
+    """
+
+    def __init__(self):
+        self.position = None
+        self.visible = False
+        self.fill = None
+        self.draws = 0
+
+    def shape(self, name):
+        self.shape_name = name
+
+    def color(self, outline, fill):
+        self.fill = fill
+
+    def goto(self, position):
+        self.position = position
+
+    def showturtle(self):
+        self.visible = True
+
+    def hideturtle(self):
+        self.visible = False
+
+    def _drawturtle(self):
+        self.draws += 1
+
+
+class FakeScreen:
+    """
+    Écran Turtle factice exposant les internes utilisés par RoadScene
+    """
+
+    def __init__(self):
+        self._tracing = 0
+        self.refreshes = 0
+        self.full_updates = 0
+        self.shapes = {}
+
+    def register_shape(self, name, shape):
+        self.shapes[name] = shape
+
+    def _update(self):
+        self.refreshes += 1
+
+    def update(self):
+        self.full_updates += 1
+
+
+class PublicScreen:
+    """
+    Écran Turtle factice sans internes : seul update() existe
+    """
+
+    def __init__(self):
+        self.full_updates = 0
+
+    def update(self):
+        self.full_updates += 1
+
+
+class FakeCanvas:
+    """
+    Canvas Tkinter factice : chaque élément est un entier
+    """
+
+    def __init__(self):
+        self.items = 0
+
+    def create_polygon(self, *args, **kwargs):
+        self.items += 1
+        return self.items
+
+    create_oval = create_polygon
+
+    def coords(self, item, *points):
+        pass
+
+    def itemconfig(self, item, **options):
+        pass
+
+    def move(self, item, dx, dy):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+
+def turtle_scene(screen=None) -> RoadScene:
+    """
+    Scène Turtle branchée sur un écran et des sprites factices
+    """
+    scene = RoadScene()
+    scene.screen = screen or FakeScreen()
+    scene._new_sprite = FakeSprite
+    return scene
+
+
+class TestRoadScene(unittest.TestCase):
+    """
+    Tests du dessin différentiel de la scène Turtle
+    """
+
+    def test_only_dirty_sprites_are_redrawn(self):
+        """
+        Test que seuls les sprites modifiés sont redessinés, une fois par frame
+        """
+        scene = turtle_scene()
+        scene.draw_vehicle(1, (0.0, 0.0), "east", "red")
+        scene.draw_vehicle(2, (50.0, 0.0), "west", "blue")
+        scene.update_display()
+        self.assertEqual(scene.canvas_ops, 2)
+        first, second = scene.vehicle_sprites[1], scene.vehicle_sprites[2]
+        self.assertTrue(first.visible)
+
+        # Déplacement sous le seuil : rien à redessiner
+        scene.draw_vehicle(1, (MIN_MOVE_PIXELS / 2, 0.0), "east", "red")
+        scene.update_display()
+        self.assertEqual(scene.canvas_ops, 0)
+        self.assertEqual(scene.sprite_positions[1], (0.0, 0.0))
+
+        scene.draw_vehicle(1, (MIN_MOVE_PIXELS, 0.0), "east", "red")
+        scene.update_display()
+        self.assertEqual(scene.canvas_ops, 1)
+        self.assertEqual((first.draws, second.draws), (2, 1))
+
+        scene.remove_vehicle(2)
+        scene.update_display()
+        self.assertEqual(scene.canvas_ops, 1)
+        self.assertFalse(second.visible)
+        self.assertEqual(scene.total_canvas_ops, 4)
+        self.assertEqual(scene.screen.refreshes, 4)
+        self.assertEqual(scene.screen._tracing, 0)
+
+    def test_light_recolour(self):
+        """
+        Test qu'un feu n'est redessiné que si sa couleur change
+        """
+        scene = turtle_scene()
+        light = FakeSprite()
+        scene.light_sprites[(10.0, 10.0)] = light
+        scene.draw_traffic_light((10.0, 10.0), "ROUGE")
+        scene.update_display()
+        self.assertEqual((scene.canvas_ops, light.fill), (1, RED))
+        scene.draw_traffic_light((10.0, 10.0), "ROUGE")
+        scene.update_display()
+        self.assertEqual(scene.canvas_ops, 0)
+        scene.draw_traffic_light((10.0, 10.0), "ORANGE_CLIGNOTANT", LIGHT_OFF)
+        scene.update_display()
+        self.assertEqual((scene.canvas_ops, light.fill), (1, LIGHT_OFF))
+
+    def test_fallback_without_turtle_internals(self):
+        """
+        Test du repli sur screen.update() si les internes de Turtle manquent
+        """
+        scene = turtle_scene(PublicScreen())
+        scene.draw_vehicle(1, (0.0, 0.0), "east", "red")
+        scene.update_display()
+        self.assertEqual(scene.screen.full_updates, 1)
+        self.assertEqual(scene.canvas_ops, 1)
+        self.assertEqual(scene.vehicle_sprites[1].draws, 0)
+
+    def test_canvas_ops_counting(self):
+        """
+        Test du nombre d'opérations du canvas par frame (backend Canvas)
+        """
+        scene = CanvasScene()
+        scene.cv = FakeCanvas()
+        scene.draw_vehicle(1, (0.0, 0.0), "east", "red")
+        scene.draw_traffic_light((10.0, 10.0), "VERT")
+        scene.update_display()
+        self.assertEqual(scene.canvas_ops, 3)   # coords + itemconfig, couleur du feu
+        scene.draw_vehicle(1, (MIN_MOVE_PIXELS / 2, 0.0), "east", "red")
+        scene.draw_traffic_light((10.0, 10.0), "VERT")
+        scene.update_display()
+        self.assertEqual(scene.canvas_ops, 0)
+        scene.draw_vehicle(1, (5.0, 0.0), "east", "red")
+        scene.remove_vehicle(1)
+        scene.update_display()
+        self.assertEqual(scene.canvas_ops, 2)   # move, puis itemconfig (caché)
+        self.assertEqual(scene.total_canvas_ops, 5)
+
+    def test_sprite_pool(self):
+        """
+        Test de la réutilisation des sprites des véhicules sortis
+        """
+        scene = turtle_scene()
+        for vehicle_id in range(3):
+            scene.draw_vehicle(vehicle_id, (vehicle_id * 50.0, 0.0), "east", "red")
+        first = scene.vehicle_sprites[0]
+        scene.remove_vehicle(0)
+        scene.remove_vehicle(1)
+        scene.remove_vehicle(7)   # Véhicule inconnu : sans effet
+        self.assertEqual(scene.get_render_statistics()["sprite_pool_size"], 2)
+
+        scene.draw_vehicle(3, (0.0, 50.0), "north", "blue", "truck")
+        scene.draw_vehicle(4, (0.0, 100.0), "south", "green", "bus")
+        scene.draw_vehicle(5, (0.0, 150.0), "west", "red")
+        stats = scene.get_render_statistics()
+        self.assertEqual((stats["sprites_created"], stats["sprites_reused"]), (4, 2))
+        self.assertEqual((stats["sprites_visible"], stats["sprite_pool_size"]), (4, 0))
+        # Un sprite repris reçoit la forme et la couleur du nouveau véhicule
+        self.assertIn(first, (scene.vehicle_sprites[3], scene.vehicle_sprites[4]))
+        self.assertTrue(first.visible)
+        reused = scene.vehicle_sprites[4]
+        self.assertEqual((reused.shape_name, reused.fill),
+                         (vehicle_shape_name("bus", "south"), "green"))
+
+        scene.clear()
+        self.assertEqual(scene.get_render_statistics()["sprite_pool_size"], 4)
+
+    def test_vehicle_shapes_registered(self):
+        """
+        Test de l'enregistrement d'une forme par type et par sens
+        """
+        scene = turtle_scene()
+        scene._register_vehicle_shapes()
+        shapes = scene.screen.shapes
+        self.assertEqual(len(shapes), len(VEHICLE_CONFIG) * len(DIRECTION_VECTORS))
+        for vehicle_type in VEHICLE_CONFIG:
+            for direction in DIRECTION_VECTORS:
+                self.assertEqual(shapes[vehicle_shape_name(vehicle_type, direction)],
+                                 vehicle_shape(vehicle_type, direction))
+        self.assertNotEqual(vehicle_shape("car", "east"), vehicle_shape("truck", "east"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,9 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from scenario_manager import ScenarioManager, ScenarioType
+from traffic_light import TrafficLight, TrafficLightManager, TrafficLightState
+from vehicle import VehicleManager
+from constants import *
 
 
 class TestScenarios(unittest.TestCase):
@@ -21,43 +24,155 @@ class TestScenarios(unittest.TestCase):
         """
         Préparation avant chaque test
         """
-        pass
+        self.manager = ScenarioManager()
+        self.manager.setup()
+        self.lights = TrafficLightManager()
+        self.lights.setup_lights()
+        self.vehicles = VehicleManager()
+    
+    def _apply(self, scenario_type: ScenarioType):
+        """
+        Active un scénario et l'applique aux composants
+        """
+        self.assertTrue(self.manager.change_scenario(scenario_type))
+        self.manager.apply_current_scenario(self.lights, self.vehicles)
+        return self.manager.get_current_scenario()
     
     def test_scenario_manager_creation(self):
         """
         Test la création du gestionnaire de scénarios
         """
-        pass
+        self.assertEqual(len(self.manager.scenarios), len(ScenarioType))
+        self.assertEqual(self.manager.get_current_scenario_name(), "normal")
     
     def test_normal_scenario_parameters(self):
         """
         Test les paramètres du scénario normal
         """
-        pass
+        scenario = self._apply(ScenarioType.NORMAL)
+        self.assertEqual(scenario.get_spawn_rate(), SPAWN_RATES["normal"])
+        self.assertEqual(scenario.get_max_vehicles(), MAX_VEHICLES["normal"])
+        light = self.lights.lights[0]
+        self.assertTrue(light.automatic)
+
+        # Un cycle complet VERT -> ORANGE -> ROUGE -> VERT
+        timings = TRAFFIC_LIGHT_TIMINGS["normal"]
+        light.update(timings["green"])
+        self.assertEqual(light.state, TrafficLightState.ORANGE)
+        light.update(timings["green"] + timings["orange"])
+        self.assertEqual(light.state, TrafficLightState.RED)
+        light.update(sum(timings.values()))
+        self.assertEqual(light.state, TrafficLightState.GREEN)
     
     def test_rush_hour_scenario_parameters(self):
         """
         Test les paramètres du scénario heure de pointe
         """
-        pass
+        scenario = self._apply(ScenarioType.RUSH_HOUR)
+        self.assertEqual(scenario.get_spawn_rate(), SPAWN_RATES["rush_hour"])
+        self.assertEqual(scenario.get_max_vehicles(), MAX_VEHICLES["rush_hour"])
+        self.assertEqual(self.vehicles.scenario, "rush_hour")
+        self.assertEqual(self.lights.lights[0].get_time_remaining(),
+                         TRAFFIC_LIGHT_TIMINGS["rush_hour"]["green"])
     
     def test_night_scenario_parameters(self):
         """
         Test les paramètres du scénario nuit
         """
-        pass
+        scenario = self._apply(ScenarioType.NIGHT)
+        self.assertEqual(scenario.get_max_vehicles(), MAX_VEHICLES["night"])
+        light = self.lights.lights[0]
+        self.assertTrue(light.is_blinking())
+        color = light.get_color()
+        light.update(TRAFFIC_LIGHT_TIMINGS["night"]["blink_interval"])
+        self.assertNotEqual(light.get_color(), color)
     
     def test_manual_scenario_parameters(self):
         """
         Test les paramètres du scénario manuel
         """
-        pass
+        self._apply(ScenarioType.MANUAL)
+        light = self.lights.lights[0]
+        self.assertFalse(light.automatic)
+        state = light.state
+        light.update(1000.0)
+        self.assertEqual(light.state, state)
     
     def test_scenario_changes(self):
         """
         Test les changements de scénario
         """
-        pass
+        self._apply(ScenarioType.NIGHT)
+        self._apply(ScenarioType.NORMAL)
+        self.assertFalse(self.lights.lights[0].is_blinking())
+        self.assertEqual(self.manager.get_current_scenario_name(), "normal")
+        self.assertFalse(self.manager.change_scenario("inconnu"))
+
+
+class TestLightScheduler(unittest.TestCase):
+    """
+    Tests pour l'échéancier des feux
+    """
+    
+    def setUp(self):
+        """
+        Préparation avant chaque test
+        """
+        self.lights = TrafficLightManager()
+        self.lights.setup_lights()
+        self.lights.set_scenario("normal")
+        self.timings = TRAFFIC_LIGHT_TIMINGS["normal"]
+    
+    def test_only_due_transitions_are_processed(self):
+        """
+        Test qu'aucun feu n'est traité entre deux transitions
+        """
+        scheduler = self.lights.scheduler
+        self.assertEqual(scheduler.advance(self.timings["green"] - 0.5), 0)
+        self.assertEqual(self.lights.get_current_state(), "VERT")
+        self.assertEqual(scheduler.advance(self.timings["green"]), len(self.lights.lights))
+        self.assertEqual(self.lights.get_current_state(), "ORANGE")
+        self.assertEqual(self.lights.get_time_remaining(), self.timings["orange"])
+    
+    def test_matches_polling(self):
+        """
+        Test que l'échéancier donne les mêmes états qu'une mise à jour à chaque pas
+        """
+        polled = TrafficLight((0, 0))
+        for frame in range(1, 60 * 90):
+            current_time = frame / 60
+            self.lights.update_all(current_time)
+            polled.update(current_time)
+            self.assertEqual(self.lights.lights[0].state, polled.state)
+    
+    def test_manual_state_cancels_schedule(self):
+        """
+        Test qu'un état forcé manuellement n'est plus programmé
+        """
+        self.lights.update_all(4.0)
+        self.lights.change_all_states(TrafficLightState.RED, manual=True)
+        self.assertIsNone(self.lights.scheduler.next_event_time())
+        self.lights.update_all(1000.0)
+        self.assertEqual(self.lights.get_current_state(), "ROUGE")
+
+        self.lights.set_automatic(True)
+        self.assertEqual(self.lights.scheduler.next_event_time(), 1000.0 + self.timings["red"])
+    
+    def test_skip_ahead(self):
+        """
+        Test d'un grand saut de temps, en cycle normal comme en clignotement
+        """
+        light = TrafficLight((0, 0))
+        cycle = sum(self.timings.values())
+        light.update(1000 * cycle + self.timings["green"])
+        self.assertEqual(light.state, TrafficLightState.ORANGE)
+
+        self.lights.set_scenario("night")
+        self.lights.set_automatic(True)
+        self.lights.update_all(10 ** 9 + 0.5)
+        self.assertTrue(self.lights.lights[0].blink_on)
+        self.lights.update_all(10 ** 9 + 1.5)
+        self.assertFalse(self.lights.lights[0].blink_on)
 
 
 if __name__ == '__main__':
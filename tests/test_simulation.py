@@ -0,0 +1,353 @@
+"""
+Tests unitaires pour le module simulation
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+
+# Ajouter le répertoire src au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from simulation import Simulation
+from vehicle import Vehicle
+from arrivals import ArrivalSchedule, arrival_rate, MAX_ARRIVALS_PER_FRAME
+from snapshot import (FrameSnapshot, SnapshotBuffer, VehicleSnapshot,
+                      interpolate_vehicles, interpolation_alpha)
+from frame_timing import FrameProfiler, RollingTimer, percentile
+import math
+import random
+from constants import *
+
+
+def run_until_frame(simulation: Simulation, frame: int, timeout: float = 10.0) -> bool:
+    """
+    Lance la boucle temps réel et l'arrête dès qu'un instantané de la frame
+    donnée est publié (False si le délai est dépassé)
+    """
+    reached = threading.Event()
+    publish = simulation.snapshots.publish
+
+    def publish_and_check(snapshot):
+        publish(snapshot)
+        if snapshot.frame_count >= frame:
+            reached.set()
+
+    simulation.snapshots.publish = publish_and_check
+    if not simulation.start():
+        return False
+    try:
+        return reached.wait(timeout)
+    finally:
+        simulation.stop()
+
+
+class TestHeadlessSimulation(unittest.TestCase):
+    """
+    Tests pour le moteur headless à pas fixe
+    """
+    
+    def setUp(self):
+        """
+        Préparation avant chaque test
+        """
+        self.simulation = Simulation(seed=1234, headless=True)
+        self.assertTrue(self.simulation.setup())
+    
+    def test_no_display_in_headless_mode(self):
+        """
+        Test qu'aucun instantané n'est publié pour l'affichage
+        """
+        self.simulation.run_for(1.0)
+        self.assertIsNone(self.simulation.snapshots.latest())
+    
+    def test_virtual_clock(self):
+        """
+        Test l'avancement de l'horloge virtuelle
+        """
+        stats = self.simulation.run_for(30.0, dt=0.05)
+        self.assertEqual(stats["frame_count"], 600)
+        self.assertAlmostEqual(stats["sim_time"], 30.0, places=6)
+        self.assertGreater(stats["total_spawned"], 0)
+    
+    def test_speedup_reported(self):
+        """
+        Test que le mode headless rapporte son accélération sur le temps réel
+
+        Sa valeur dépend de la machine : elle est suivie par la suite de bancs
+        d'essai (main.py --bench), pas par les tests.
+        """
+        stats = self.simulation.run_for(120.0)
+        self.assertGreater(stats["speedup"], 0)
+    
+    def test_same_seed_same_result(self):
+        """
+        Test la reproductibilité avec une graine donnée
+        """
+        other = Simulation(seed=1234, headless=True)
+        self.assertTrue(other.setup())
+        first = self.simulation.run_for(60.0)
+        second = other.run_for(60.0)
+        for key in ("total_spawned", "total_removed", "vehicle_count", "traffic_light_state"):
+            self.assertEqual(first[key], second[key])
+    
+    def test_scenario_change(self):
+        """
+        Test le changement de scénario pendant l'exécution
+        """
+        self.assertTrue(self.simulation.change_scenario("night"))
+        self.assertFalse(self.simulation.change_scenario("inconnu"))
+        stats = self.simulation.run_for(5.0)
+        self.assertEqual(stats["scenario"], "night")
+        self.assertEqual(stats["traffic_light_state"], "ORANGE_CLIGNOTANT")
+
+
+class TestCheckpoint(unittest.TestCase):
+    """
+    Tests pour la sauvegarde et la restauration de l'état
+    """
+    
+    def setUp(self):
+        """
+        Préparation avant chaque test
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "warmup.ck")
+        self.simulation = Simulation(seed=5, headless=True)
+        self.assertTrue(self.simulation.setup())
+        self.simulation.change_scenario("rush_hour")
+        self.simulation.run_for(90.0)
+    
+    def tearDown(self):
+        """
+        Nettoyage après chaque test
+        """
+        self.directory.cleanup()
+    
+    def _vehicle_states(self, simulation):
+        """
+        Retourne (ID affiché, distance, vitesse, couleur) de chaque véhicule, triés par ID
+        """
+        return sorted((vehicle.display_id, vehicle.distance, vehicle.speed, vehicle.color)
+                      for vehicle in simulation.vehicle_manager.get_all_vehicles())
+    
+    def test_restore_continues_identically(self):
+        """
+        Test qu'une simulation restaurée évolue comme l'originale
+        """
+        self.simulation.save_checkpoint(self.path)
+        next_id = Vehicle._next_id
+        expected = self.simulation.run_for(30.0)
+
+        restored = Simulation(seed=999, headless=True)
+        self.assertTrue(restored.setup())
+        restored.load_checkpoint(self.path)
+        self.assertEqual(Vehicle._next_id, next_id)
+        stats = restored.run_for(30.0)
+
+        for key in ("sim_time", "frame_count", "total_spawned", "total_removed",
+                    "traffic_light_state", "scenario"):
+            self.assertEqual(stats[key], expected[key])
+        self.assertEqual(self._vehicle_states(restored), self._vehicle_states(self.simulation))
+    
+    def test_restore_lights_and_lanes(self):
+        """
+        Test de la restauration des feux et de l'ordre des voies
+        """
+        self.simulation.save_checkpoint(self.path)
+        restored = Simulation(headless=True)
+        restored.load_checkpoint(self.path)
+
+        for original, light in zip(self.simulation.traffic_light_manager.lights,
+                                   restored.traffic_light_manager.lights):
+            self.assertEqual(light.state, original.state)
+            self.assertEqual(light.get_time_remaining(), original.get_time_remaining())
+        for key, lane in self.simulation.vehicle_manager.lanes.items():
+            self.assertEqual(list(restored.vehicle_manager.lanes[key]), list(lane))
+    
+    def test_invalid_file(self):
+        """
+        Test du refus d'un fichier qui n'est pas une sauvegarde
+        """
+        with open(self.path, "wb") as checkpoint_file:
+            checkpoint_file.write(b"pas une sauvegarde")
+        with self.assertRaises(ValueError):
+            self.simulation.load_checkpoint(self.path)
+
+
+class TestArrivals(unittest.TestCase):
+    """
+    Tests pour les calendriers d'arrivée précalculés
+    """
+    
+    def test_rate_matches_spawn_probability(self):
+        """
+        Test que le débit reproduit la probabilité par frame de SPAWN_RATES
+        """
+        for probability in SPAWN_RATES.values():
+            rate = arrival_rate(probability)
+            self.assertAlmostEqual(1.0 - math.exp(-rate / FPS), probability)
+        self.assertEqual(arrival_rate(0.0), 0.0)
+    
+    def test_certain_spawn_is_finite(self):
+        """
+        Test qu'une probabilité d'apparition de 1 donne un débit fini
+        """
+        rate = arrival_rate(1.0)
+        self.assertEqual(rate, MAX_ARRIVALS_PER_FRAME * FPS)
+        self.assertEqual(arrival_rate(0.99999), rate)
+        self.assertLess(arrival_rate(0.99), rate)
+        schedule = ArrivalSchedule([("north", 0)], rate, random.Random(1))
+        arrivals = schedule.pop_due(10.0)
+        self.assertAlmostEqual(len(arrivals) / (10.0 * rate), 1.0, delta=0.1)
+        
+        with self.assertRaises(ValueError):
+            ArrivalSchedule([("north", 0)], math.inf).pop_due(0.1)
+    
+    def test_poisson_count(self):
+        """
+        Test du nombre d'arrivées sur une heure
+        """
+        lanes = [("north", 0), ("north", 1), ("east", 0), ("east", 1)]
+        schedule = ArrivalSchedule(lanes, 2.0, random.Random(3))
+        arrivals = schedule.pop_due(3600.0)
+        self.assertAlmostEqual(len(arrivals) / 7200.0, 1.0, delta=0.05)
+        self.assertEqual(set(arrivals), set(lanes))
+        self.assertEqual(schedule.pop_due(3600.0), [])
+    
+    def test_demand_profile(self):
+        """
+        Test d'une demande nulle puis active
+        """
+        schedule = ArrivalSchedule([("west", 0)], 1.0, random.Random(1),
+                                   profile=[(0.0, 0.0), (100.0, 2.0)])
+        self.assertEqual(schedule.pop_due(99.9), [])
+        self.assertGreater(len(schedule.pop_due(200.0)), 100)
+    
+    def test_independent_of_timestep(self):
+        """
+        Test que les arrivées ne dépendent pas du pas de temps
+        """
+        totals = []
+        for dt in (1.0 / FPS, 0.1, 0.5):
+            simulation = Simulation(seed=21, headless=True)
+            self.assertTrue(simulation.setup())
+            simulation.change_scenario("rush_hour")
+            simulation.run_for(119.5, dt)
+            totals.append(simulation.arrivals.total_arrivals)
+        self.assertGreater(totals[0], 0)
+        self.assertEqual(len(set(totals)), 1)
+
+
+class TestSnapshots(unittest.TestCase):
+    """
+    Tests pour les instantanés publiés vers l'affichage
+    """
+    
+    def _frame(self, wall_time, vehicles):
+        """
+        Construit un instantané minimal
+        """
+        return FrameSnapshot(wall_time, 0, wall_time, "VERT", "normal", (),
+                             tuple(VehicleSnapshot(display_id, x, 0.0, "east", "#FF0000", "car")
+                                   for display_id, x in vehicles))
+    
+    def test_double_buffer(self):
+        """
+        Test que le tampon garde les deux derniers instantanés
+        """
+        buffer = SnapshotBuffer()
+        self.assertEqual(buffer.read(), (None, None))
+        first, second, third = (self._frame(t, []) for t in (1.0, 2.0, 3.0))
+        buffer.publish(first)
+        buffer.publish(second)
+        self.assertEqual(buffer.read(), (first, second))
+        buffer.publish(third)
+        self.assertEqual(buffer.read(), (second, third))
+        self.assertIs(buffer.latest(), third)
+        self.assertEqual(buffer.published, 3)
+    
+    def test_interpolation(self):
+        """
+        Test l'interpolation des positions entre deux instantanés
+        """
+        previous = self._frame(1.0, [(1, 0.0), (2, 50.0)])
+        current = self._frame(2.0, [(1, 10.0), (3, 100.0)])
+        self.assertEqual(interpolation_alpha(previous, current, 2.5), 0.5)
+        self.assertEqual(interpolation_alpha(previous, current, 9.0), 1.0)
+        self.assertEqual(interpolation_alpha(None, current, 2.5), 1.0)
+
+        vehicles = {vehicle.display_id: vehicle
+                    for vehicle in interpolate_vehicles(previous, current, 0.5)}
+        self.assertEqual(sorted(vehicles), [1, 3])
+        self.assertAlmostEqual(vehicles[1].x, 5.0)
+        self.assertAlmostEqual(vehicles[3].x, 100.0)
+    
+    def test_loop_publishes_snapshots(self):
+        """
+        Test que la boucle temps réel publie un instantané par pas
+        """
+        simulation = Simulation(seed=3)
+        self.assertTrue(simulation.setup())
+        self.assertTrue(run_until_frame(simulation, 5))
+        latest = simulation.snapshots.latest()
+        self.assertGreater(latest.frame_count, 0)
+        self.assertEqual(latest.frame_count, simulation.frame_count)
+        self.assertEqual(len(latest.vehicles), simulation.vehicle_manager.get_vehicle_count())
+        self.assertEqual(len(latest.lights), 4)
+
+
+class TestFrameTiming(unittest.TestCase):
+    """
+    Tests pour la mesure des temps par phase
+    """
+    
+    def test_percentiles(self):
+        """
+        Test des percentiles sur une fenêtre glissante
+        """
+        self.assertEqual(percentile([], 50), 0.0)
+        timer = RollingTimer(window=100)
+        for value in range(1, 201):
+            timer.record(value / 1000.0)
+        summary = timer.summary()
+        # Seules les 100 dernières mesures (101 à 200 ms) sont conservées
+        self.assertEqual(summary["count"], 200)
+        self.assertAlmostEqual(summary["p50_ms"], 150.0)
+        self.assertAlmostEqual(summary["p95_ms"], 195.0)
+        self.assertAlmostEqual(summary["p99_ms"], 199.0)
+        self.assertAlmostEqual(summary["max_ms"], 200.0)
+    
+    def test_frames_over_budget(self):
+        """
+        Test du comptage des frames en retard
+        """
+        profiler = FrameProfiler(budget=0.01)
+        profiler.record_frame(0.005)
+        profiler.record_frame(0.02)
+        self.assertEqual(profiler.frames_over_budget, 1)
+        self.assertIn("step", profiler.format_overlay())
+        profiler.reset()
+        self.assertEqual(profiler.get_statistics()["step"]["count"], 0)
+    
+    def test_loop_records_phases(self):
+        """
+        Test que la boucle temps réel mesure chaque phase, mais pas run_for
+        """
+        simulation = Simulation(seed=5)
+        self.assertTrue(simulation.setup())
+        simulation.run_for(1.0)
+        self.assertEqual(simulation.get_statistics()["frame_timings"]["step"]["count"], 0)
+
+        self.assertTrue(run_until_frame(simulation, 5))
+        timings = simulation.get_statistics()["frame_timings"]
+        for phase in ("update", "spawn", "removal", "publish", "step"):
+            self.assertGreater(timings[phase]["count"], 0)
+            self.assertLessEqual(timings[phase]["p50_ms"], timings[phase]["p99_ms"])
+        self.assertGreaterEqual(timings["step"]["p50_ms"], timings["update"]["p50_ms"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Tests unitaires pour le module sweep
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Ajouter le répertoire src au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from sweep import (SweepRun, build_runs, run_single, run_sweep, load_results,
+                   aggregate, parse_seeds, parse_timings)
+from constants import *
+
+
+class TestSweep(unittest.TestCase):
+    """
+    Tests pour le balayage de paramètres
+    """
+    
+    def setUp(self):
+        """
+        Préparation avant chaque test
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.results_path = os.path.join(self.directory.name, "runs.jsonl")
+    
+    def tearDown(self):
+        """
+        Nettoyage après chaque test
+        """
+        self.directory.cleanup()
+    
+    def test_build_runs(self):
+        """
+        Test du produit cartésien des paramètres
+        """
+        runs = build_runs(["normal", "night"], parse_seeds(["0-2"]),
+                          [None, parse_timings("green=20,red=5")], duration=30.0)
+        self.assertEqual(len(runs), 12)
+        self.assertEqual(len({run.run_id for run in runs}), 12)
+        self.assertEqual(runs[3].timings_label, "green=20,red=5")
+    
+    def test_parse_arguments_helpers(self):
+        """
+        Test de la lecture des graines et des durées de feux
+        """
+        self.assertEqual(parse_seeds(["1", "4-6"]), [1, 4, 5, 6])
+        self.assertIsNone(parse_timings("default"))
+        self.assertEqual(parse_timings("green=20,orange=2"), {"green": 20.0, "orange": 2.0})
+    
+    def test_custom_timings_are_applied(self):
+        """
+        Test que des durées de feux personnalisées changent le résultat
+        """
+        default = run_single(SweepRun("normal", 3, None, 60.0))
+        longer_green = run_single(SweepRun("normal", 3, {"green": 40, "red": 2}, 60.0))
+        again = run_single(SweepRun("normal", 3, None, 60.0))
+        self.assertEqual(again["mean_stopped"], default["mean_stopped"])
+        self.assertLess(longer_green["mean_stopped"], default["mean_stopped"])
+    
+    def test_resume_skips_finished_runs(self):
+        """
+        Test que relancer le balayage ne refait pas les exécutions terminées
+        """
+        runs = build_runs(["normal"], [0, 1], duration=10.0)
+        first = list(run_sweep(runs[:1], self.results_path, workers=1))
+        self.assertEqual(len(first), 1)
+
+        second = list(run_sweep(runs, self.results_path, workers=1))
+        self.assertEqual([row["seed"] for row in second], [1])
+        self.assertEqual(list(run_sweep(runs, self.results_path, workers=1)), [])
+
+        summary = aggregate(load_results(self.results_path), runs)
+        self.assertEqual(len(summary), 1)
+        self.assertEqual(summary[0]["runs"], 2)
+        self.assertIn("throughput_per_hour_mean", summary[0])
+    
+    def test_resume_after_truncated_line(self):
+        """
+        Test de la reprise après une dernière ligne tronquée (processus interrompu)
+        """
+        runs = build_runs(["normal"], [0, 1], duration=10.0)
+        list(run_sweep(runs[:1], self.results_path, workers=1))
+        with open(self.results_path, "a", encoding="utf-8") as results_file:
+            results_file.write('{"run_id": "normal|default|1", "sce')
+
+        resumed = list(run_sweep(runs, self.results_path, workers=1))
+        self.assertEqual([row["seed"] for row in resumed], [1])
+        with open(self.results_path, encoding="utf-8") as results_file:
+            lines = results_file.read().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual([row["seed"] for row in load_results(self.results_path)], [0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Tests unitaires pour le module trajectory
+"""
+
+import math
+import unittest
+import tempfile
+import sys
+import os
+
+# Ajouter le répertoire src au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from database import DatabaseManager
+from logger import EventLogger
+from trajectory import Keyframe, TrajectoryCompressor, interpolate, rebuild_trajectory, read_trajectory
+from constants import FPS, POSITION_TOLERANCE, SPEED_TOLERANCE
+
+
+def synthetic_trajectory(frames: int = 600):
+    """
+    Véhicule qui accélère, roule, tourne, freine puis s'arrête (un échantillon par frame)
+    """
+    samples = []
+    x, y, speed, heading = 0.0, 0.0, 0.0, 0.0
+    for frame in range(frames):
+        if frame < 60:
+            speed, state = speed + 0.04, "accelerating"
+        elif 200 <= frame < 260:
+            heading, state = heading + math.pi / 120, "moving"
+        elif 400 <= frame < 460:
+            speed, state = max(0.0, speed - 0.04), "slowing"
+        elif frame >= 460:
+            speed, state = 0.0, "stopped"
+        else:
+            state = "moving"
+        x += speed * math.cos(heading)
+        y += speed * math.sin(heading)
+        samples.append(Keyframe(frame / FPS, x, y, speed, state))
+    return samples
+
+
+class TestTrajectory(unittest.TestCase):
+    """
+    Tests pour la compression des trajectoires en images clés
+    """
+
+    def assert_within_tolerance(self, samples, keyframes):
+        """
+        Chaque échantillon est reconstruit à la tolérance près, avec son état
+        """
+        for sample in samples:
+            point = interpolate(keyframes, sample.sim_time)
+            self.assertLessEqual(math.hypot(point.x - sample.x, point.y - sample.y),
+                                 POSITION_TOLERANCE + 1e-9)
+            self.assertLessEqual(abs(point.speed - sample.speed), SPEED_TOLERANCE + 1e-9)
+            self.assertEqual(point.state, sample.state)
+
+    def test_compression_within_tolerance(self):
+        """
+        Test du taux de compression et de l'écart de la trajectoire reconstruite
+        """
+        samples = synthetic_trajectory()
+        compressor = TrajectoryCompressor()
+        keyframes = []
+        for sample in samples:
+            keyframes += compressor.add(1, sample)
+        keyframes += compressor.finish(1)
+
+        self.assertEqual(keyframes[0], samples[0])
+        self.assertEqual(keyframes[-1], samples[-1])
+        self.assert_within_tolerance(samples, keyframes)
+        stats = compressor.get_statistics()
+        self.assertEqual(stats["samples"], len(samples))
+        self.assertEqual(stats["keyframes"], len(keyframes))
+        self.assertGreaterEqual(stats["ratio"], 10.0)
+
+        dense = rebuild_trajectory(keyframes)
+        self.assertEqual(len(dense), len(samples))
+        self.assertIsNone(interpolate(keyframes, samples[-1].sim_time + 1.0))
+
+    def test_logger_round_trip(self):
+        """
+        Test de la journalisation des images clés et de la lecture de la trajectoire
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            db = DatabaseManager(os.path.join(directory, "test.db"))
+            self.assertTrue(db.connect())
+            logger = EventLogger(db, flush_interval=60.0, log_positions=True)
+            samples = synthetic_trajectory()
+            for sample in samples:
+                logger.log_vehicle_position(7, *sample)
+            logger.log_vehicle_event(7, "VEHICLE_REMOVED", samples[-1].x, samples[-1].y, 0.0)
+            logger.close()
+
+            keyframes = len(db.get_events_by_type("VEHICLE_POSITION", 1000))
+            self.assertLessEqual(keyframes * 10, len(samples))
+            trajectory = read_trajectory(db, 7)
+            db.disconnect()
+        self.assertEqual(len(trajectory), len(samples))
+        self.assert_within_tolerance(samples, trajectory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,13 +3,18 @@ Tests unitaires pour le module vehicle
 """
 
 import unittest
+import random
 import sys
 import os
 
 # Ajouter le répertoire src au path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from vehicle import Vehicle, VehicleManager, VehicleType
+from vehicle import Vehicle, VehicleManager, VehicleType, VehicleState, np
+from vehicle_store import VehicleStore
+from lane_queue import LaneQueue
+from spatial_index import SpatialGrid
+from constants import *
 
 
 class TestVehicle(unittest.TestCase):
@@ -21,37 +26,69 @@ class TestVehicle(unittest.TestCase):
         """
         Préparation avant chaque test
         """
-        pass
+        self.vehicle = Vehicle(VehicleType.CAR, 1, "east", rng=random.Random(0))
     
     def test_vehicle_creation(self):
         """
         Test la création d'un véhicule
         """
-        pass
+        config = VEHICLE_CONFIG["car"]
+        self.assertEqual(self.vehicle.get_position(), LANE_STARTS["east"][1])
+        self.assertGreaterEqual(self.vehicle.get_speed(), config["min_speed"])
+        self.assertLessEqual(self.vehicle.get_speed(), config["max_speed"])
+        other = Vehicle(VehicleType.TRUCK, 0, "north")
+        self.assertGreater(other.id, self.vehicle.id)
+        self.assertIn(other.color, TRUCK_COLORS)
     
     def test_vehicle_movement(self):
         """
         Test le déplacement d'un véhicule
         """
-        pass
+        x, y = self.vehicle.get_position()
+        self.assertTrue(self.vehicle.update("VERT"))
+        new_x, new_y = self.vehicle.get_position()
+        self.assertGreater(new_x, x)
+        self.assertEqual(new_y, y)
     
     def test_vehicle_stop_at_red_light(self):
         """
         Test l'arrêt au feu rouge
         """
-        pass
+        for _ in range(1000):
+            self.vehicle.update("ROUGE")
+        self.assertEqual(self.vehicle.get_speed(), 0.0)
+        self.assertEqual(self.vehicle.state, VehicleState.STOPPED)
+        self.assertLessEqual(self.vehicle.distance + self.vehicle.width / 2, STOP_LINE_DISTANCE)
+        self.assertFalse(self.vehicle.is_in_intersection())
     
     def test_vehicle_slow_at_orange_light(self):
         """
         Test le ralentissement au feu orange
         """
-        pass
+        self.vehicle.distance = STOP_LINE_DISTANCE - 100
+        states = set()
+        for _ in range(300):
+            self.vehicle.update("ORANGE")
+            states.add(self.vehicle.state)
+        self.assertIn(VehicleState.SLOWING, states)
+        self.assertEqual(self.vehicle.get_speed(), 0.0)
+        self.assertLessEqual(self.vehicle.distance + self.vehicle.width / 2, STOP_LINE_DISTANCE)
+
+        # Trop près de la ligne pour freiner : le véhicule passe
+        late = Vehicle(VehicleType.CAR, 1, "east", rng=random.Random(0))
+        late.distance = STOP_LINE_DISTANCE - late.width / 2 - 1
+        for _ in range(60):
+            late.update("ORANGE")
+        self.assertGreater(late.distance, STOP_LINE_DISTANCE)
     
     def test_vehicle_removal(self):
         """
         Test la suppression d'un véhicule
         """
-        pass
+        self.assertFalse(self.vehicle.should_be_removed())
+        self.vehicle.distance = LANE_LENGTH
+        self.assertFalse(self.vehicle.update("VERT", dt=1.0))
+        self.assertTrue(self.vehicle.should_be_removed())
 
 
 class TestVehicleManager(unittest.TestCase):
@@ -63,31 +100,297 @@ class TestVehicleManager(unittest.TestCase):
         """
         Préparation avant chaque test
         """
-        pass
+        self.manager = VehicleManager(rng=random.Random(42))
+        self.manager.setup()
     
     def test_manager_creation(self):
         """
         Test la création du gestionnaire
         """
-        pass
+        self.assertEqual(self.manager.get_vehicle_count(), 0)
     
     def test_vehicle_spawning(self):
         """
         Test l'apparition de véhicules
         """
-        pass
+        vehicle = self.manager.spawn_vehicle("normal")
+        self.assertIsNotNone(vehicle)
+        self.assertEqual(self.manager.get_vehicle_count(), 1)
+        self.assertIn(vehicle, self.manager.get_vehicles_in_lane(vehicle.lane_id, vehicle.direction))
+        self.assertTrue(self.manager.remove_vehicle(vehicle.id))
+        self.assertFalse(self.manager.remove_vehicle(vehicle.id))
     
     def test_vehicle_updates(self):
         """
         Test la mise à jour des véhicules
         """
-        pass
+        removed = []
+        for frame in range(3000):
+            if frame % 20 == 0:
+                self.manager.spawn_vehicle("rush_hour")
+            state = "ROUGE" if (frame // 600) % 2 else "VERT"
+            for vehicle_id in self.manager.update(state):
+                self.manager.remove_vehicle(vehicle_id)
+                removed.append(vehicle_id)
+
+            # Aucun véhicule ne rattrape celui qui le précède
+            for direction, lanes in LANE_STARTS.items():
+                for lane_id in range(len(lanes)):
+                    lane = sorted(self.manager.get_vehicles_in_lane(lane_id, direction),
+                                  key=lambda v: v.distance)
+                    for follower, leader in zip(lane, lane[1:]):
+                        self.assertGreaterEqual(leader.distance - leader.width / 2,
+                                                follower.distance + follower.width / 2)
+        self.assertGreater(len(removed), 0)
     
     def test_vehicle_count_limit(self):
         """
         Test la limite du nombre de véhicules
         """
-        pass
+        for _ in range(200):
+            self.manager.spawn_vehicle("night")
+        self.assertLessEqual(self.manager.get_vehicle_count(), MAX_VEHICLES["night"])
+        self.manager.clear_all_vehicles()
+        self.assertEqual(self.manager.get_vehicle_count(), 0)
+    
+    def test_vehicle_pool(self):
+        """
+        Test la réutilisation des véhicules et le recyclage des IDs internes
+        """
+        manager = VehicleManager(rng=random.Random(1), pool_size=2)
+        first = manager.spawn_vehicle("normal", "north", 0)
+        second = manager.spawn_vehicle("normal", "south", 0)
+        third = manager.spawn_vehicle("normal", "east", 0)
+        self.assertEqual(manager.get_pool_statistics(),
+                         {"pool_hits": 2, "pool_misses": 1, "pool_high_water": 3, "pool_free": 0})
+
+        first_id, first_display = first.id, first.display_id
+        manager.remove_vehicle(first_id)
+        fourth = manager.spawn_vehicle("normal", "west", 1)
+        self.assertIs(fourth, first)
+        self.assertEqual(fourth.id, first_id)
+        self.assertEqual(fourth.direction, "west")
+        self.assertEqual(fourth.distance, 0.0)
+        # L'ID affiché n'est jamais réutilisé
+        self.assertGreater(fourth.display_id, third.display_id)
+        self.assertNotEqual(fourth.display_id, first_display)
+        self.assertEqual(manager.pool_hits, 3)
+        self.assertEqual(manager.pool_high_water, 3)
+        self.assertEqual(manager.get_vehicles_in_lane(1, "west"), [fourth])
+    
+    @unittest.skipIf(np is None, "NumPy n'est pas installé")
+    def test_vectorized_matches_scalar(self):
+        """
+        Test que la mise à jour NumPy et la version scalaire donnent le même résultat
+        """
+        scalar = VehicleManager(rng=random.Random(3), vectorized=False)
+        vectorized = VehicleManager(rng=random.Random(3), vectorized=True)
+        self.assertTrue(vectorized.vectorized)
+        
+        for frame in range(2500):
+            state = ["VERT", "ORANGE", "ROUGE"][(frame // 200) % 3]
+            for manager in (scalar, vectorized):
+                if frame % 7 == 0:
+                    manager.spawn_vehicle("rush_hour")
+                for vehicle_id in manager.update(state, dt=1.5 / FPS):
+                    manager.remove_vehicle(vehicle_id)
+            
+            # Les IDs affichés sont globaux : on compare dans l'ordre de création
+            pairs = list(zip(sorted(scalar.get_all_vehicles(), key=lambda v: v.display_id),
+                             sorted(vectorized.get_all_vehicles(), key=lambda v: v.display_id)))
+            self.assertEqual(len(pairs), scalar.get_vehicle_count())
+            self.assertEqual(len(pairs), vectorized.get_vehicle_count())
+            for vehicle, other in pairs:
+                self.assertAlmostEqual(vehicle.distance, other.distance, places=9)
+                self.assertAlmostEqual(vehicle.speed, other.speed, places=9)
+                self.assertEqual(vehicle.state, other.state)
+                self.assertAlmostEqual(vehicle.x, other.x, places=9)
+                self.assertAlmostEqual(vehicle.y, other.y, places=9)
+        self.assertGreater(scalar.total_removed, 0)
+
+
+class TestVehicleStore(unittest.TestCase):
+    """
+    Tests pour le stockage en colonnes des véhicules
+    """
+    
+    def setUp(self):
+        """
+        Préparation avant chaque test
+        """
+        self.store = VehicleStore(capacity=2)
+        self.rng = random.Random(7)
+    
+    def test_capacity_doubling(self):
+        """
+        Test la croissance par doublement de capacité
+        """
+        vehicles = [Vehicle(VehicleType.CAR, i % 3, "north", rng=self.rng, store=self.store)
+                    for i in range(5)]
+        self.assertEqual(self.store.capacity, 8)
+        self.assertEqual(len(self.store), 5)
+        for vehicle in vehicles:
+            self.assertEqual(vehicle.direction, "north")
+            self.assertIs(self.store.views[vehicle._row], vehicle)
+    
+    def test_compaction_keeps_views(self):
+        """
+        Test que le compactage met à jour les vues sans perdre leurs données
+        """
+        vehicles = [Vehicle(VehicleType.TRUCK, 1, "west", rng=self.rng, store=self.store)
+                    for _ in range(6)]
+        for i, vehicle in enumerate(vehicles):
+            vehicle.distance = 10.0 * i
+        for vehicle in vehicles[:4]:
+            vehicle._release()
+        
+        # Plus de la moitié des lignes libérées : compactage automatique
+        self.assertEqual(self.store.free, 0)
+        self.assertEqual(self.store.size, 2)
+        self.assertEqual([v.distance for v in vehicles[4:]], [40.0, 50.0])
+        self.assertEqual([v._row for v in vehicles[:4]], [-1] * 4)
+        self.assertEqual(self.store.alive_rows(), [0, 1])
+        self.assertEqual(vehicles[5]._row, 1)
+    
+    def test_freed_slots_reused_before_growth(self):
+        """
+        Test que les lignes libérées sont récupérées avant d'agrandir
+        """
+        first = Vehicle(VehicleType.CAR, 0, "east", rng=self.rng, store=self.store)
+        second = Vehicle(VehicleType.CAR, 1, "east", rng=self.rng, store=self.store)
+        first._release()
+        Vehicle(VehicleType.CAR, 2, "east", rng=self.rng, store=self.store)
+        self.assertEqual(self.store.capacity, 2)
+        self.assertEqual(second._row, 0)
+        self.assertEqual(second.lane_id, 1)
+
+
+class TestLaneQueue(unittest.TestCase):
+    """
+    Tests pour les files ordonnées par voie
+    """
+    
+    def setUp(self):
+        """
+        Préparation avant chaque test
+        """
+        self.lane = LaneQueue("east", 1)
+        for vehicle_id in (1, 2, 3, 4):
+            self.lane.push_tail(vehicle_id)
+    
+    def test_travel_order(self):
+        """
+        Test l'ordre de marche et les voisins
+        """
+        self.assertEqual(list(self.lane), [1, 2, 3, 4])
+        self.assertEqual(list(reversed(self.lane)), [4, 3, 2, 1])
+        self.assertIsNone(self.lane.leader(1))
+        self.assertEqual(self.lane.leader(3), 2)
+        self.assertEqual(self.lane.follower(3), 4)
+        self.assertIsNone(self.lane.follower(4))
+    
+    def test_remove_in_middle(self):
+        """
+        Test qu'un retrait au milieu garde l'ordre des autres véhicules
+        """
+        self.assertTrue(self.lane.remove(2))
+        self.assertFalse(self.lane.remove(2))
+        self.assertEqual(list(self.lane), [1, 3, 4])
+        self.assertEqual(self.lane.leader(3), 1)
+        self.assertEqual(self.lane.pop_head(), 1)
+        self.assertIsNone(self.lane.leader(3))
+        self.lane.push_tail(5)
+        self.assertEqual(list(self.lane), [3, 4, 5])
+        self.assertEqual(len(self.lane), 3)
+    
+    def test_manager_lanes(self):
+        """
+        Test que le gestionnaire tient ses voies à jour
+        """
+        manager = VehicleManager(rng=random.Random(11))
+        for _ in range(400):
+            manager.spawn_vehicle("rush_hour")
+            for vehicle_id in manager.update("VERT"):
+                lane = manager.lanes[(manager.vehicles[vehicle_id].direction,
+                                      manager.vehicles[vehicle_id].lane_id)]
+                self.assertEqual(lane.head, vehicle_id)
+                manager.remove_vehicle(vehicle_id)
+        
+        self.assertEqual(sum(len(lane) for lane in manager.lanes.values()),
+                         manager.get_vehicle_count())
+        for (direction, lane_id), lane in manager.lanes.items():
+            distances = [v.distance for v in manager.get_vehicles_in_lane(lane_id, direction)]
+            self.assertEqual(distances, sorted(distances, reverse=True))
+            for vehicle_id in lane:
+                leader = manager.get_leader(vehicle_id)
+                if leader is not None:
+                    self.assertIs(manager.get_follower(leader.id), manager.vehicles[vehicle_id])
+
+
+class TestSpatialGrid(unittest.TestCase):
+    """
+    Tests pour l'index spatial en grille
+    """
+    
+    def setUp(self):
+        """
+        Préparation avant chaque test
+        """
+        self.grid = SpatialGrid()
+        self.positions = {1: (0.0, 0.0), 2: (120.0, 40.0), 3: (-450.0, 390.0), 4: (149.0, -149.0)}
+        for object_id, (x, y) in self.positions.items():
+            self.grid.update(object_id, x, y)
+    
+    def test_grid_dimensions(self):
+        """
+        Test le découpage du monde en cellules de la largeur d'une voie
+        """
+        self.assertEqual(self.grid.columns, SCREEN_WIDTH // LANE_WIDTH)
+        self.assertEqual(self.grid.rows, SCREEN_HEIGHT // LANE_WIDTH)
+        self.assertEqual(self.grid.cell_of(-10000, -10000), 0)
+        self.assertEqual(len(self.grid), 4)
+    
+    def test_box_and_radius_queries(self):
+        """
+        Test les requêtes rectangle et rayon
+        """
+        half = INTERSECTION_SIZE / 2
+        inside = self.grid.query_box(-half, -half, half, half, self.positions.get)
+        self.assertEqual(sorted(inside), [1, 2, 4])
+        self.assertEqual(sorted(self.grid.query_radius(0, 0, 130, self.positions.get)), [1, 2])
+    
+    def test_incremental_moves(self):
+        """
+        Test le déplacement et le retrait d'un objet
+        """
+        self.positions[1] = (400.0, 0.0)
+        self.grid.update(1, 400.0, 0.0)
+        self.assertEqual(self.grid.query_radius(0, 0, 50, self.positions.get), [])
+        self.assertTrue(self.grid.remove(2))
+        self.assertFalse(self.grid.remove(2))
+        self.assertEqual(sum(len(cell) for cell in self.grid.cells), 3)
+    
+    def test_manager_intersection_occupancy(self):
+        """
+        Test que l'index du gestionnaire suit les véhicules
+        """
+        for vectorized in (False, True):
+            manager = VehicleManager(rng=random.Random(5), vectorized=vectorized)
+            for frame in range(600):
+                manager.spawn_vehicle("rush_hour")
+                for vehicle_id in manager.update("VERT"):
+                    manager.remove_vehicle(vehicle_id)
+                expected = {v.id for v in manager.get_all_vehicles() if v.is_in_intersection()}
+                self.assertEqual({v.id for v in manager.get_vehicles_in_intersection()}, expected)
+            self.assertEqual(len(manager.grid), manager.get_vehicle_count())
+            
+            vehicle = manager.get_all_vehicles()[0]
+            neighbors = manager.get_neighbors(vehicle.id, 150)
+            for other in manager.get_all_vehicles():
+                if other is vehicle:
+                    continue
+                distance = ((other.x - vehicle.x) ** 2 + (other.y - vehicle.y) ** 2) ** 0.5
+                self.assertEqual(other in neighbors, distance <= 150)
 
 
 if __name__ == '__main__':